@@ -0,0 +1,442 @@
+import argparse
+import os
+import sys
+import time
+from datetime import date
+from typing import List, Optional
+
+import tracker_config as tkc
+from logger_setup import logger
+
+default_db_path = os.path.join(os.path.expanduser('~'), tkc.DB_NAME)
+default_profile_dir = os.path.join(os.path.expanduser('~'), tkc.PROFILE_DIR)
+default_backup_dir = os.path.join(os.path.expanduser('~'), tkc.BACKUP_DIR)
+
+# The QCoreApplication of the headless commands, once created
+_application = None
+
+
+def run_export(args: argparse.Namespace) -> int:
+    """
+    Exports beck_table to Parquet, Feather or NumPy .npz.
+
+    Args:
+        args (argparse.Namespace): The parsed 'export' arguments.
+
+    Returns:
+        int: The process exit code.
+    """
+    from database.beck_export import export_beck_table
+
+    started = time.perf_counter()
+    rows = export_beck_table(args.db, args.output, args.format, args.chunk_size,
+                             progress=lambda done: print(f"\r{done:,} rows", end='',
+                                                         file=sys.stderr))
+    elapsed = time.perf_counter() - started
+    print(f"\nExported {rows:,} rows to {args.output} in {elapsed:.1f}s", file=sys.stderr)
+    return 0
+
+
+def ensure_qt_application() -> None:
+    """
+    Creates the QCoreApplication that QtSql needs to load its SQLite driver plugin.
+
+    The instance is kept in a module global, since Qt destroys it as soon as Python drops
+    the last reference.
+    """
+    global _application
+    from PyQt6.QtCore import QCoreApplication
+
+    if QCoreApplication.instance() is None:
+        _application = QCoreApplication(sys.argv[:1])
+
+
+def ensure_schema(db_path: str) -> None:
+    """
+    Creates or migrates the database through DataManager so headless writers can use it.
+
+    Args:
+        db_path (str): The path to the SQLite database file.
+    """
+    from PyQt6.QtSql import QSqlDatabase
+    from database.database_manager import DataManager
+
+    ensure_qt_application()
+    data_manager = DataManager(db_path)
+    connection_name = data_manager.db.connectionName()
+    data_manager.close()
+    del data_manager
+    QSqlDatabase.removeDatabase(connection_name)
+
+
+def resolve_profile_db(profile_id: str, profile_dir: str) -> str:
+    """
+    Returns the shard of a profile, registering the profile and creating its schema first
+    if needed.
+
+    Args:
+        profile_id (str): The profile id.
+        profile_dir (str): The directory holding the catalog and the shards.
+
+    Returns:
+        str: The path of the profile's shard.
+    """
+    from database.profile_store import ProfileStore
+
+    ensure_qt_application()
+    store = ProfileStore(profile_dir)
+    try:
+        return store.create_profile(profile_id)
+    finally:
+        store.close()
+
+
+def run_profiles(args: argparse.Namespace) -> int:
+    """
+    Lists the profiles with their assessment counts and scores, queried in parallel.
+
+    Args:
+        args (argparse.Namespace): The parsed 'profiles' arguments.
+
+    Returns:
+        int: The process exit code.
+    """
+    from database.profile_store import ProfileStore
+
+    ensure_qt_application()
+    store = ProfileStore(args.profile_dir)
+    try:
+        if args.create:
+            store.create_profile(args.create, args.name)
+        profiles = store.profiles()
+        summaries = store.summaries()
+    finally:
+        store.close()
+    for profile_id, display_name in profiles:
+        summary = summaries.get(profile_id)
+        if summary is None or not summary.count:
+            print(f"{profile_id}\t{display_name}\t0 assessments")
+            continue
+        print(f"{profile_id}\t{display_name}\t{summary.count:,} assessments\t"
+              f"mean {summary.mean:.1f}\trange {summary.low}-{summary.high}\tlast {summary.last}")
+    return 0
+
+
+def run_import(args: argparse.Namespace) -> int:
+    """
+    Imports a CSV or JSONL file of assessments into beck_table.
+
+    Args:
+        args (argparse.Namespace): The parsed 'import' arguments.
+
+    Returns:
+        int: The process exit code.
+    """
+    from database.beck_import import import_beck_file
+    from database.bulk_load import bulk_insert_beck_rows, connect_for_bulk_load, load_beck_keys
+
+    if args.profile:
+        args.db = resolve_profile_db(args.profile, args.profile_dir)
+    ensure_schema(args.db)
+    connection = connect_for_bulk_load(args.db)
+    started = time.perf_counter()
+    try:
+        stats = import_beck_file(
+            args.input,
+            lambda rows: bulk_insert_beck_rows(connection, rows, args.chunk_size,
+                                               defer_indexes=not args.keep_indexes),
+            existing_keys=load_beck_keys(connection),
+            file_format=args.format,
+            rejects_path=args.rejects,
+            progress=lambda s: print(f"\r{s.read:,} read, {s.rejected:,} rejected, "
+                                     f"{s.duplicates:,} duplicates", end='', file=sys.stderr))
+    finally:
+        connection.close()
+    elapsed = time.perf_counter() - started
+    rate = stats.read / elapsed if elapsed > 0 else 0.0
+    print(f"\nImported {stats.inserted:,} of {stats.read:,} records in {elapsed:.1f}s "
+          f"({rate:,.0f} records/sec)", file=sys.stderr)
+    return 0 if stats.inserted == stats.valid else 1
+
+
+def run_rebuild_rollups(args: argparse.Namespace) -> int:
+    """
+    Recomputes the day, week and month rollups of beck_table, e.g. after a backfill.
+
+    Args:
+        args (argparse.Namespace): The parsed 'rebuild-rollups' arguments.
+
+    Returns:
+        int: The process exit code.
+    """
+    from database.bulk_load import connect_for_bulk_load
+    from database.database_utility.rollups import rebuild_rollup_statements
+
+    if (args.first_date is None) != (args.last_date is None):
+        print("error: --from and --to must be given together", file=sys.stderr)
+        return 2
+    ensure_schema(args.db)
+    connection = connect_for_bulk_load(args.db)
+    started = time.perf_counter()
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for sql, binds in rebuild_rollup_statements(args.first_date, args.last_date):
+                connection.execute(sql, binds)
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        periods = connection.execute("SELECT COUNT(*) FROM beck_rollup").fetchone()[0]
+    finally:
+        connection.close()
+    print(f"Rebuilt rollups ({periods:,} periods) in {time.perf_counter() - started:.1f}s",
+          file=sys.stderr)
+    return 0
+
+
+def run_backup(args: argparse.Namespace) -> int:
+    """
+    Takes a gzip snapshot of a database with the online backup API and rotates old ones.
+
+    Args:
+        args (argparse.Namespace): The parsed 'backup' arguments.
+
+    Returns:
+        int: The process exit code.
+    """
+    from database.backup import backup_database
+
+    if not os.path.exists(args.db):
+        print(f"error: {args.db} does not exist", file=sys.stderr)
+        return 2
+    started = time.perf_counter()
+    path = backup_database(args.db, args.dir, args.keep, args.pages,
+                           progress=lambda remaining, total: print(
+                               f"\r{total - remaining:,} of {total:,} pages", end='', file=sys.stderr))
+    print(f"\nBacked up to {path} ({os.path.getsize(path):,} bytes) in "
+          f"{time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return 0
+
+
+def run_restore(args: argparse.Namespace) -> int:
+    """
+    Replaces a database with a snapshot once the snapshot passes PRAGMA integrity_check.
+
+    Args:
+        args (argparse.Namespace): The parsed 'restore' arguments.
+
+    Returns:
+        int: The process exit code.
+    """
+    from database.backup import list_snapshots, restore_database
+
+    snapshot = args.snapshot
+    if snapshot == 'latest':
+        snapshots = list_snapshots(args.dir)
+        if not snapshots:
+            print(f"error: no backups in {args.dir}", file=sys.stderr)
+            return 2
+        snapshot = snapshots[0]
+    started = time.perf_counter()
+    try:
+        restore_database(snapshot, args.db)
+    except RuntimeError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    print(f"Restored {args.db} from {snapshot} in {time.perf_counter() - started:.1f}s",
+          file=sys.stderr)
+    return 0
+
+
+def _generated_path(path: str, profile_id: str, profiles: int) -> str:
+    """
+    Returns the output file of one profile: path itself for a single profile, otherwise
+    path with the profile id before the extension.
+    """
+    if profiles == 1:
+        return path
+    stem, extension = os.path.splitext(path)
+    return f"{stem}_{profile_id}{extension}"
+
+
+def run_generate(args: argparse.Namespace) -> int:
+    """
+    Generates synthetic assessments for load testing into a database, profile shards, CSV
+    or Parquet.
+
+    Args:
+        args (argparse.Namespace): The parsed 'generate' arguments.
+
+    Returns:
+        int: The process exit code.
+    """
+    import csv
+    from itertools import chain
+    from beck_core.items import BECK_COLUMNS
+    from beck_core.synthetic import DEFAULT_YEARS, chunk_rows, iter_synthetic_chunks
+
+    if args.db and args.profiles > 1:
+        print("error: --db holds one profile; use --profile-dir for several", file=sys.stderr)
+        return 2
+    started = time.perf_counter()
+    total = 0
+    for profile in range(args.profiles):
+        profile_id = f"synthetic-{profile + 1:03d}"
+        rows = args.rows // args.profiles + (profile < args.rows % args.profiles)
+        chunks = iter_synthetic_chunks(rows, args.seed, profile, args.end,
+                                       args.years if args.years is not None else DEFAULT_YEARS,
+                                       args.schedule, args.chunk_size)
+        progress = lambda done: print(f"\r{profile_id}: {done:,} rows", end='', file=sys.stderr)
+        if args.db or args.profile_dir:
+            from database.bulk_load import bulk_insert_beck_rows, connect_for_bulk_load
+
+            db_path = args.db or resolve_profile_db(profile_id, args.profile_dir)
+            ensure_schema(db_path)
+            connection = connect_for_bulk_load(db_path)
+            try:
+                total += bulk_insert_beck_rows(connection, chain.from_iterable(map(chunk_rows, chunks)),
+                                               args.chunk_size, on_chunk=progress,
+                                               defer_indexes=True)
+            finally:
+                connection.close()
+        elif args.parquet:
+            from database.beck_export import write_arrow_file
+
+            total += write_arrow_file(chunks, _generated_path(args.parquet, profile_id, args.profiles),
+                                      'parquet', progress)
+        else:
+            written = 0
+            with open(_generated_path(args.csv, profile_id, args.profiles), 'w', newline='',
+                      encoding='utf-8') as handle:
+                writer = csv.writer(handle)
+                writer.writerow(BECK_COLUMNS)
+                for chunk in chunks:
+                    writer.writerows(chunk_rows(chunk))
+                    written += len(chunk['id'])
+                    progress(written)
+            total += written
+    elapsed = time.perf_counter() - started
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"\nGenerated {total:,} rows for {args.profiles} profile(s) in {elapsed:.1f}s "
+          f"({rate:,.0f} rows/sec)", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the command line parser with one sub-command per maintenance task.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(prog='beck_cli',
+                                     description="Headless data tools for the Beck tracker.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export = commands.add_parser('export', help="export beck_table to a columnar file")
+    export.add_argument('output', help="the file to write (.parquet, .feather or .npz)")
+    export.add_argument('--format', choices=('parquet', 'feather', 'npz'),
+                        help="output format, inferred from the extension by default")
+    export.add_argument('--db', default=default_db_path, help="the database file to read")
+    export.add_argument('--chunk-size', type=int, default=tkc.EXPORT_CHUNK_SIZE,
+                        help="rows held in memory at once")
+    export.set_defaults(handler=run_export)
+
+    importer = commands.add_parser('import', help="import assessments from CSV or JSONL")
+    importer.add_argument('input', help="the file to read (.csv or .jsonl)")
+    importer.add_argument('--format', choices=('csv', 'jsonl'),
+                          help="input format, inferred from the extension by default")
+    importer.add_argument('--db', default=default_db_path, help="the database file to write")
+    importer.add_argument('--rejects', help="write rejected records to this CSV file")
+    importer.add_argument('--chunk-size', type=int, default=tkc.BULK_INSERT_CHUNK_SIZE,
+                          help="rows per transaction")
+    importer.add_argument('--keep-indexes', action='store_true',
+                          help="maintain indexes row by row instead of rebuilding them "
+                               "after the load; faster for small files")
+    importer.add_argument('--profile', help="import into this profile's shard instead of --db, "
+                                            "registering the profile if it is new")
+    importer.add_argument('--profile-dir', default=default_profile_dir,
+                          help="the directory holding the profile catalog and shards")
+    importer.set_defaults(handler=run_import)
+
+    rollups = commands.add_parser('rebuild-rollups',
+                                  help="recompute the day, week and month trend rollups")
+    rollups.add_argument('--db', default=default_db_path, help="the database file to update")
+    rollups.add_argument('--from', dest='first_date', metavar='YYYY-MM-DD',
+                         help="only rebuild periods from this date on")
+    rollups.add_argument('--to', dest='last_date', metavar='YYYY-MM-DD',
+                         help="only rebuild periods up to this date")
+    rollups.set_defaults(handler=run_rebuild_rollups)
+
+    generate = commands.add_parser('generate',
+                                   help="generate synthetic assessments for load testing")
+    generate.add_argument('--rows', type=int, default=1000000,
+                          help="assessments in total, split evenly over the profiles")
+    generate.add_argument('--profiles', type=int, default=1, help="simulated people")
+    generate.add_argument('--seed', type=int, default=0, help="random seed")
+    generate.add_argument('--end', type=date.fromisoformat, metavar='YYYY-MM-DD',
+                          help="the last day assessed, today by default")
+    generate.add_argument('--years', type=float,
+                          help="the span assessed, ending on --end, 10 by default; more rows "
+                               "make denser days rather than a longer span")
+    generate.add_argument('--schedule', choices=('daily', 'irregular', 'mixed'), default='mixed',
+                          help="when assessments are taken; mixed draws one per profile")
+    generate.add_argument('--chunk-size', type=int, default=tkc.BULK_INSERT_CHUNK_SIZE,
+                          help="rows generated and written at once")
+    target = generate.add_mutually_exclusive_group(required=True)
+    target.add_argument('--db', help="bulk load into this database file")
+    target.add_argument('--profile-dir',
+                        help="bulk load each profile into its own shard in this directory, "
+                             "registered as synthetic-001, synthetic-002 and so on")
+    target.add_argument('--csv', help="write a CSV file per profile")
+    target.add_argument('--parquet', help="write a Parquet file per profile")
+    generate.set_defaults(handler=run_generate)
+
+    backup = commands.add_parser('backup', help="snapshot the database into a gzip backup")
+    backup.add_argument('--db', default=default_db_path, help="the database file to back up")
+    backup.add_argument('--dir', default=default_backup_dir, help="the backup directory")
+    backup.add_argument('--keep', type=int, default=tkc.BACKUP_KEEP,
+                        help="snapshots kept; older ones are deleted")
+    backup.add_argument('--pages', type=int, default=tkc.BACKUP_STEP_PAGES,
+                        help="database pages copied per step")
+    backup.set_defaults(handler=run_backup)
+
+    restore = commands.add_parser('restore', help="replace the database with a checked backup; "
+                                                  "close the app first")
+    restore.add_argument('snapshot', help="the .db.gz backup to restore, or 'latest'")
+    restore.add_argument('--db', default=default_db_path, help="the database file to replace")
+    restore.add_argument('--dir', default=default_backup_dir,
+                         help="the backup directory 'latest' is looked up in")
+    restore.set_defaults(handler=run_restore)
+
+    profiles = commands.add_parser('profiles', help="list profiles with their score summaries")
+    profiles.add_argument('--profile-dir', default=default_profile_dir,
+                          help="the directory holding the profile catalog and shards")
+    profiles.add_argument('--create', metavar='PROFILE_ID', help="register a new profile first")
+    profiles.add_argument('--name', help="display name of the profile given with --create")
+    profiles.set_defaults(handler=run_profiles)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the command line interface.
+
+    Args:
+        argv (Optional[List[str]]): The arguments, sys.argv[1:] by default.
+
+    Returns:
+        int: The process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except Exception as e:
+        logger.error("beck_cli %s failed: %s", args.command, e, exc_info=True)
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
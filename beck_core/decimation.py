@@ -0,0 +1,118 @@
+"""
+Downsampling of time series for plotting.
+
+A chart never needs more than a couple of points per pixel column, so series are
+reduced to the visible range and bucketed by column before drawing. Both functions take
+x sorted ascending and return new arrays; the input is never modified.
+"""
+from typing import Tuple
+
+import numpy as np
+
+
+def visible_slice(x: np.ndarray, x0: float, x1: float) -> slice:
+    """
+    Returns the slice of a sorted x array that covers x0..x1, plus one point either side
+    so lines run off the edges of the plot instead of stopping short.
+
+    Args:
+        x (np.ndarray): Sorted x values.
+        x0 (float): The left edge of the view.
+        x1 (float): The right edge of the view.
+
+    Returns:
+        slice: The index range to draw.
+    """
+    start = max(int(np.searchsorted(x, x0, side='left')) - 1, 0)
+    stop = min(int(np.searchsorted(x, x1, side='right')) + 1, len(x))
+    return slice(start, stop)
+
+
+def minmax_decimate(x: np.ndarray, y: np.ndarray, x0: float, x1: float,
+                    buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduces a series to the first, minimum, maximum and last point of each bucket.
+
+    The view x0..x1 is split into equal-width buckets, normally one per pixel column.
+    Keeping the extremes of every column draws the same envelope as the full series, and
+    keeping the first and last points keeps the lines between columns joined correctly.
+    The extremes are placed at the middle of their column, which is invisible at one
+    bucket per pixel. Bucket boundaries are found by binary search and the extremes with
+    one reduceat each, so the cost is a single pass over the visible points.
+
+    Args:
+        x (np.ndarray): Sorted x values.
+        y (np.ndarray): The y values, same length as x. NaN marks a missing value.
+        x0 (float): The left edge of the view.
+        x1 (float): The right edge of the view.
+        buckets (int): The number of buckets, e.g. the plot width in pixels.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The kept x and y values in x order; at most four
+        points per bucket plus the neighbours outside the view.
+    """
+    window = visible_slice(x, x0, x1)
+    xs = np.asarray(x[window], dtype=np.float64)
+    ys = np.asarray(y[window], dtype=np.float64)
+    missing = np.isnan(ys)
+    if missing.any():
+        xs, ys = xs[~missing], ys[~missing]
+    if len(xs) <= 4 * buckets or x1 <= x0:
+        return xs, ys
+    edges = np.searchsorted(xs, np.linspace(x0, x1, buckets + 1)[1:-1], side='left')
+    starts = np.unique(np.r_[0, edges, np.searchsorted(xs, x1, side='right')])
+    starts = starts[starts < len(xs)]
+    ends = np.r_[starts[1:], len(xs)] - 1
+    lows = np.minimum.reduceat(ys, starts)
+    highs = np.maximum.reduceat(ys, starts)
+    middles = (xs[starts] + xs[ends]) / 2
+    out_x = np.column_stack((xs[starts], middles, middles, xs[ends])).ravel()
+    out_y = np.column_stack((ys[starts], lows, highs, ys[ends])).ravel()
+    return out_x, out_y
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsamples a series with Largest-Triangle-Three-Buckets.
+
+    LTTB keeps the point of each bucket that forms the largest triangle with the point
+    kept before it and the mean of the next bucket, which preserves the visual shape of
+    a line with exactly threshold points. It suits overviews and exports; for interactive
+    drawing minmax_decimate is cheaper and keeps every extreme.
+
+    Args:
+        x (np.ndarray): Sorted x values.
+        y (np.ndarray): The y values, same length as x. NaN values are dropped.
+        threshold (int): The number of points to keep, at least 3.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The kept x and y values.
+    """
+    xs = np.asarray(x, dtype=np.float64)
+    ys = np.asarray(y, dtype=np.float64)
+    present = ~np.isnan(ys)
+    xs, ys = xs[present], ys[present]
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return xs, ys
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    # The mean of every bucket is needed as the third triangle corner; compute them all
+    # at once from cumulative sums.
+    x_sums = np.r_[0.0, np.cumsum(xs)]
+    y_sums = np.r_[0.0, np.cumsum(ys)]
+    next_starts = np.r_[edges[1:-1], n - 1]
+    next_ends = np.r_[edges[2:], n]
+    counts = np.maximum(next_ends - next_starts, 1)
+    mean_x = (x_sums[next_ends] - x_sums[next_starts]) / counts
+    mean_y = (y_sums[next_ends] - y_sums[next_starts]) / counts
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        ax, ay = xs[previous], ys[previous]
+        areas = np.abs((ax - mean_x[bucket]) * (ys[start:end] - ay)
+                       - (ax - xs[start:end]) * (mean_y[bucket] - ay))
+        previous = start + int(np.argmax(areas))
+        keep[bucket + 1] = previous
+    return xs[keep], ys[keep]
@@ -0,0 +1,55 @@
+"""
+Item definitions and score bands for the 12-item Beck assessment.
+
+This module and the rest of beck_core must not import PyQt so that scoring and
+analytics can run in batch jobs without a QApplication.
+"""
+
+# Item order matches the beck_table columns and the sliders in MainWindow.
+ITEM_NAMES = (
+    'sadness',
+    'outlook',
+    'guilt',
+    'solitude',
+    'sexdrive',
+    'hygiene',
+    'decisiveness',
+    'effort',
+    'interest',
+    'pessimism',
+    'victimhood',
+    'sleep',
+)
+ITEM_COUNT = len(ITEM_NAMES)
+# Row layout used by every insert path: date, time, the items and the summary.
+BECK_COLUMNS = ('beck_date', 'beck_time', *ITEM_NAMES, 'beck_summary')
+ITEM_MIN = 0
+ITEM_MAX = 3
+SUMMARY_MAX = ITEM_COUNT * ITEM_MAX
+
+# Severity bands as (label, lowest total in band). The BDI-II cut-offs (14, 20, 29 of 63)
+# are scaled to the 36 points of the 12 items tracked here.
+SEVERITY_BANDS = (
+    ('minimal', 0),
+    ('mild', 8),
+    ('moderate', 12),
+    ('severe', 17),
+)
+SEVERITY_LABELS = tuple(label for label, _ in SEVERITY_BANDS)
+
+
+def severity_band(total: int) -> str:
+    """
+    Returns the severity label for one summary score.
+
+    Args:
+        total (int): The Beck summary score.
+
+    Returns:
+        str: The label of the band the score falls in.
+    """
+    label = SEVERITY_BANDS[0][0]
+    for band_label, lowest in SEVERITY_BANDS:
+        if total >= lowest:
+            label = band_label
+    return label
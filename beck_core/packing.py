@@ -0,0 +1,83 @@
+"""
+Packed encoding of Beck assessments.
+
+Every item takes two bits, so the twelve items of an assessment fit in one 24-bit
+integer, item i in bits 2i and 2i + 1 in ITEM_NAMES order. The summary is not stored;
+it is the sum of the decoded items. SQLite keeps such an integer in 3 or 4 bytes where
+the unpacked layout needs 13 columns.
+
+The functions work on whole NumPy arrays. PACK_SQL and the UNPACK_SQL expressions are
+the same encoding in SQL, for the packed storage schema.
+"""
+from typing import Dict
+
+import numpy as np
+
+from beck_core.items import ITEM_COUNT, ITEM_MAX, ITEM_MIN, ITEM_NAMES
+from beck_core.scoring import as_item_array
+
+ITEM_BITS = 2
+PACKED_MAX = (1 << (ITEM_BITS * ITEM_COUNT)) - 1
+
+_SHIFTS = np.arange(ITEM_COUNT, dtype=np.int32) * ITEM_BITS
+_WEIGHTS = np.left_shift(1, _SHIFTS).astype(np.int32)
+
+# SQL for the packed integer of the item columns of a row, e.g. of NEW in a trigger.
+PACK_SQL = ' | '.join(f"({{row}}{name} << {shift})" for name, shift in zip(ITEM_NAMES, _SHIFTS.tolist()))
+# SQL for each item of a packed column, by item name.
+UNPACK_SQL: Dict[str, str] = {
+    name: f"(({{column}} >> {shift}) & {ITEM_MAX})" for name, shift in zip(ITEM_NAMES, _SHIFTS.tolist())
+}
+
+
+def pack_items(items) -> np.ndarray:
+    """
+    Packs assessments into one integer each.
+
+    Args:
+        items: An (N, 12) item array, or anything as_item_array accepts.
+
+    Returns:
+        np.ndarray: The packed assessments as an int32 array of length N.
+
+    Raises:
+        ValueError: If an item lies outside 0..3, which two bits can't hold.
+    """
+    array = as_item_array(items)
+    if len(array) and (array.min() < ITEM_MIN or array.max() > ITEM_MAX):
+        raise ValueError(f"Items must lie in {ITEM_MIN}..{ITEM_MAX} to be packed.")
+    # The fields don't overlap, so the sum of the shifted items is their bitwise or
+    return array.astype(np.int32) @ _WEIGHTS
+
+
+def unpack_items(packed) -> np.ndarray:
+    """
+    Unpacks packed assessments into their items.
+
+    Args:
+        packed: An array of packed assessments.
+
+    Returns:
+        np.ndarray: The items as an (N, 12) int8 array.
+    """
+    values = np.asarray(packed, dtype=np.int32).reshape(-1, 1)
+    return ((values >> _SHIFTS) & ITEM_MAX).astype(np.int8)
+
+
+def packed_summaries(packed) -> np.ndarray:
+    """
+    Computes the summary score of packed assessments without unpacking them.
+
+    The two-bit fields are summed pairwise into four-bit fields and those into bytes,
+    then a multiplication adds the three bytes up in the third one.
+
+    Args:
+        packed: An array of packed assessments.
+
+    Returns:
+        np.ndarray: The totals as an int16 array.
+    """
+    values = np.asarray(packed, dtype=np.uint32)
+    nibbles = (values & 0x333333) + ((values >> 2) & 0x333333)
+    octets = (nibbles & 0x0F0F0F) + ((nibbles >> 4) & 0x0F0F0F)
+    return (((octets * 0x010101) >> 16) & 0xFF).astype(np.int16)
@@ -0,0 +1,81 @@
+from typing import Iterable, Sequence, Tuple, Union
+
+from beck_core.items import ITEM_COUNT, ITEM_MAX, ITEM_MIN, severity_band
+
+
+class BeckAssessment:
+    """
+    One Beck assessment held as compactly as plain Python allows.
+
+    The twelve item values are packed into a 12-byte bytes object and the instance has
+    no __dict__, so millions of records fit in memory without the per-object overhead of
+    dicts or widget lookups.
+
+    Attributes:
+        beck_date (str): The date of the entry, formatted yyyy-MM-dd.
+        beck_time (str): The time of the entry, formatted hh:mm:ss.
+        items (bytes): The item values in ITEM_NAMES order.
+
+    """
+    __slots__ = ('beck_date', 'beck_time', 'items')
+
+    def __init__(self, beck_date: str, beck_time: str, items: Iterable[int]) -> None:
+        self.beck_date: str = beck_date
+        self.beck_time: str = beck_time
+        self.items: bytes = bytes(items)
+        if len(self.items) != ITEM_COUNT:
+            raise ValueError(f"Expected {ITEM_COUNT} item values, got {len(self.items)}.")
+        if max(self.items) > ITEM_MAX or min(self.items) < ITEM_MIN:
+            raise ValueError(f"Item values must be between {ITEM_MIN} and {ITEM_MAX}.")
+
+    @classmethod
+    def from_row(cls, row: Sequence[Union[str, int]]) -> "BeckAssessment":
+        """
+        Builds a record from a beck_table row in BECK_COLUMNS order.
+
+        The stored beck_summary, if present, is ignored and recomputed from the items.
+
+        Args:
+            row (Sequence[Union[str, int]]): beck_date, beck_time, the 12 items and
+                optionally beck_summary.
+
+        Returns:
+            BeckAssessment: The record.
+        """
+        return cls(row[0], row[1], row[2:2 + ITEM_COUNT])
+
+    @property
+    def summary(self) -> int:
+        """
+        Returns the Beck summary score, the sum of the item values.
+        """
+        return sum(self.items)
+
+    @property
+    def severity(self) -> str:
+        """
+        Returns the severity band label of the summary score.
+        """
+        return severity_band(self.summary)
+
+    def to_row(self) -> Tuple[Union[str, int], ...]:
+        """
+        Returns the record as a beck_table row in BECK_COLUMNS order.
+
+        Returns:
+            Tuple[Union[str, int], ...]: beck_date, beck_time, the items and beck_summary.
+        """
+        return (self.beck_date, self.beck_time, *self.items, self.summary)
+
+    def __repr__(self) -> str:
+        return (f"BeckAssessment({self.beck_date!r}, {self.beck_time!r}, "
+                f"{tuple(self.items)!r})")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BeckAssessment):
+            return NotImplemented
+        return (self.beck_date, self.beck_time, self.items) == (
+            other.beck_date, other.beck_time, other.items)
+
+    def __hash__(self) -> int:
+        return hash((self.beck_date, self.beck_time, self.items))
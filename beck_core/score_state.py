@@ -0,0 +1,74 @@
+from array import array
+from typing import Iterable
+
+from beck_core.items import ITEM_NAMES
+
+
+class ScoreState:
+    """
+    Running Beck score kept up to date by deltas.
+
+    The per-item values live in a fixed-size signed byte array and the total is adjusted
+    by the difference of the one item that changed, so a slider tick costs O(1) instead
+    of re-reading and re-summing every item. The class has no Qt dependency and can be
+    used to score imported rows.
+
+    Attributes:
+        values (array): The current value of each item, in ITEM_NAMES order.
+        total (int): The sum of all item values.
+
+    """
+    __slots__ = ('values', 'total')
+
+    def __init__(self, size: int = len(ITEM_NAMES)) -> None:
+        self.values: array = array('b', bytes(size))
+        self.total: int = 0
+
+    def set_item(self, index: int, value: int) -> int:
+        """
+        Sets one item and updates the total by its delta.
+
+        Args:
+            index (int): The item position in ITEM_NAMES order.
+            value (int): The new item value.
+
+        Returns:
+            int: The updated total.
+        """
+        self.total += value - self.values[index]
+        self.values[index] = value
+        return self.total
+
+    def load(self, values: Iterable[int]) -> int:
+        """
+        Replaces every item value and recomputes the total.
+
+        Args:
+            values (Iterable[int]): The item values in ITEM_NAMES order.
+
+        Returns:
+            int: The new total.
+        """
+        self.values = array('b', values)
+        self.total = sum(self.values)
+        return self.total
+
+    def reset(self) -> None:
+        """
+        Sets every item and the total back to zero.
+        """
+        self.values = array('b', bytes(len(self.values)))
+        self.total = 0
+
+    @staticmethod
+    def score(values: Iterable[int]) -> int:
+        """
+        Scores one assessment without keeping any state.
+
+        Args:
+            values (Iterable[int]): The item values of the assessment.
+
+        Returns:
+            int: The Beck summary score.
+        """
+        return sum(values)
@@ -0,0 +1,110 @@
+"""
+Vectorized Beck scoring over NumPy arrays.
+
+Assessments are passed as an (N, 12) int8 array with one row per assessment and the
+columns in ITEM_NAMES order, which is 12 bytes per assessment.
+"""
+from typing import Dict
+
+import numpy as np
+
+from beck_core.items import ITEM_COUNT, ITEM_MAX, ITEM_MIN, SEVERITY_BANDS, SEVERITY_LABELS
+
+_BAND_THRESHOLDS = np.array([lowest for _, lowest in SEVERITY_BANDS[1:]], dtype=np.int16)
+_INT8 = np.iinfo(np.int8)
+
+
+def as_item_array(items) -> np.ndarray:
+    """
+    Converts item data to a contiguous (N, 12) int8 array.
+
+    Values are range-checked before the cast, since int8 would wrap e.g. 259 to 3 and
+    valid_rows could no longer see it.
+
+    Args:
+        items: Anything np.asarray accepts, e.g. a list of item tuples.
+
+    Returns:
+        np.ndarray: The items as int8.
+
+    Raises:
+        ValueError: If the data does not have 12 columns or holds a value int8 cannot.
+    """
+    array = np.asarray(items)
+    if array.dtype != np.int8:
+        if array.size and (array.min() < _INT8.min or array.max() > _INT8.max):
+            raise ValueError(f"Item values must fit in int8, got {array.min()}..{array.max()}.")
+        array = array.astype(np.int8)
+    array = np.ascontiguousarray(array)
+    if array.ndim != 2 or array.shape[1] != ITEM_COUNT:
+        raise ValueError(f"Expected an (N, {ITEM_COUNT}) item array, got shape {array.shape}.")
+    return array
+
+
+def valid_rows(items: np.ndarray) -> np.ndarray:
+    """
+    Flags the assessments whose every item lies in the allowed range.
+
+    Args:
+        items (np.ndarray): An (N, 12) int8 item array.
+
+    Returns:
+        np.ndarray: A boolean array of length N.
+    """
+    return ((items >= ITEM_MIN) & (items <= ITEM_MAX)).all(axis=1)
+
+
+def score_items(items: np.ndarray) -> np.ndarray:
+    """
+    Computes the Beck summary score of every assessment.
+
+    Args:
+        items (np.ndarray): An (N, 12) int8 item array.
+
+    Returns:
+        np.ndarray: The totals as an int16 array of length N.
+    """
+    return as_item_array(items).sum(axis=1, dtype=np.int16)
+
+
+def severity_bands(totals: np.ndarray) -> np.ndarray:
+    """
+    Maps summary scores to severity band indexes into SEVERITY_LABELS.
+
+    Args:
+        totals (np.ndarray): Summary scores.
+
+    Returns:
+        np.ndarray: The band index of each score as int8.
+    """
+    return np.searchsorted(_BAND_THRESHOLDS, totals, side='right').astype(np.int8)
+
+
+def band_counts(totals: np.ndarray) -> Dict[str, int]:
+    """
+    Counts how many summary scores fall in each severity band.
+
+    Args:
+        totals (np.ndarray): Summary scores.
+
+    Returns:
+        Dict[str, int]: The count per severity label, in band order.
+    """
+    counts = np.bincount(severity_bands(totals), minlength=len(SEVERITY_LABELS))
+    return dict(zip(SEVERITY_LABELS, counts.tolist()))
+
+
+def item_means(items: np.ndarray) -> np.ndarray:
+    """
+    Computes the mean score of each item across all assessments.
+
+    Args:
+        items (np.ndarray): An (N, 12) int8 item array.
+
+    Returns:
+        np.ndarray: A float64 array of length 12.
+    """
+    array = as_item_array(items)
+    if not len(array):
+        return np.zeros(ITEM_COUNT)
+    return array.mean(axis=0, dtype=np.float64)
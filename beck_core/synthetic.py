@@ -0,0 +1,287 @@
+"""
+Synthetic Beck assessments for load testing.
+
+Each profile is a simulated person. A latent daily severity follows a mean-reverting
+AR(1) process around the profile's baseline, with depressive episodes that push it up and
+fade in and out at the same rate, and a small weekday rhythm. Every assessment adds
+momentary noise, and the twelve items are drawn from a one-factor model on that
+severity, so items correlate the way they do in real scores, then cut at item-specific
+thresholds into 0..3. The summary is the sum of the items.
+
+Schedules:
+    daily      one assessment most evenings, an occasional second one, some days missed
+    irregular  a Poisson number of assessments per day at any waking hour, with lapses
+               of several days without any
+    mixed      daily or irregular, drawn per profile
+
+The assessments of a profile fall within a span of years ending on a given day, today by
+default. The schedule lays out how many assessments each day gets, and those counts are
+scaled to the number of rows asked for, so more rows make denser days rather than a
+longer span.
+
+Everything is vectorized with NumPy over blocks of days, so a million rows take well
+under a second to generate. The output is column chunks in the layout of
+database.beck_export.iter_beck_chunks; chunk_rows() turns a chunk into row tuples for
+the bulk loader and CSV.
+"""
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from beck_core.items import ITEM_COUNT
+
+SCHEDULES = ('daily', 'irregular', 'mixed')
+DEFAULT_YEARS = 10
+
+# Loading of each item on the latent severity, in ITEM_NAMES order. Mood and outlook
+# items track it closely; sex drive, hygiene and sleep are noisier.
+ITEM_LOADINGS = np.array([0.85, 0.80, 0.70, 0.65, 0.45, 0.55, 0.60, 0.70, 0.80, 0.80, 0.55, 0.50])
+# How much more severity an item needs before it scores, in ITEM_NAMES order.
+ITEM_DIFFICULTY = np.array([0.0, 0.1, 0.2, 0.1, 0.4, 0.5, 0.3, 0.1, 0.0, 0.1, 0.5, 0.2])
+# The latent values at which an item moves from 0 to 1, 1 to 2 and 2 to 3.
+_CUTPOINTS = np.array([0.6, 1.4, 2.2], dtype=np.float32)
+
+_EPOCH_DAY = np.datetime64('1970-01-01', 'D')
+_AR_BLOCK = 256
+
+
+@lru_cache(maxsize=None)
+def _time_strings() -> np.ndarray:
+    """
+    Returns 'HH:MM:SS' for every second of the day, indexed by the second.
+    """
+    return np.array([f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in range(86400)],
+                    dtype=object)
+
+
+@lru_cache(maxsize=None)
+def _month_days() -> np.ndarray:
+    """
+    Returns 'MM-DD' indexed by month * 32 + day, so dates format as year prefix + suffix.
+    """
+    return np.array([f"{month:02d}-{day:02d}" for month in range(13) for day in range(32)],
+                    dtype=object)
+
+
+def _ar1(innovations: np.ndarray, phi: float, state: float) -> np.ndarray:
+    """
+    Runs x[t] = phi * x[t-1] + innovations[t] from x[-1] = state.
+
+    Within a block the recursion has the closed form
+    x[t] = phi**t * (phi * state + cumsum(innovations[k] * phi**-k)), so only one Python
+    iteration is needed per _AR_BLOCK steps. Blocks keep phi**-k small enough for float64.
+    """
+    out = np.empty_like(innovations)
+    steps = np.arange(_AR_BLOCK)
+    growth = phi ** steps
+    shrink = phi ** -steps
+    for begin in range(0, len(innovations), _AR_BLOCK):
+        block = innovations[begin:begin + _AR_BLOCK]
+        size = len(block)
+        out[begin:begin + size] = growth[:size] * (phi * state + np.cumsum(block * shrink[:size]))
+        state = out[begin + size - 1]
+    return out
+
+
+class _Profile:
+    """
+    The parameters and running state of one simulated person.
+    """
+
+    def __init__(self, rng: np.random.Generator, schedule: str) -> None:
+        self.rng = rng
+        self.schedule = schedule if schedule != 'mixed' else ('daily', 'irregular')[rng.integers(2)]
+        self.baseline = rng.normal(0.1, 0.6)
+        self.phi = rng.uniform(0.90, 0.985)
+        self.noise = 0.45 * np.sqrt(1 - self.phi ** 2)
+        self.episode_shift = rng.uniform(1.2, 2.4)
+        self.mean_well = rng.uniform(120, 400)
+        self.mean_episode = rng.uniform(20, 90)
+        self.weekday_amplitude = rng.uniform(0.0, 0.15)
+        self.loadings = np.clip(ITEM_LOADINGS + rng.normal(0, 0.05, ITEM_COUNT), 0.2, 0.95)
+        self.difficulty = ITEM_DIFFICULTY + rng.normal(0, 0.1, ITEM_COUNT)
+        self.evening = rng.normal(21 * 3600, 3600)
+        self.adherence = rng.uniform(0.75, 0.97)
+        self.per_day = rng.uniform(1.5, 4.0)
+        self.state = 0.0
+        self.in_episode = False
+        self.state_left = int(rng.geometric(1 / self.mean_well))
+        self.in_lapse = False
+        self.lapse_left = int(rng.geometric(1 / 60))
+
+    def _runs(self, days: int, active: bool, left: int, mean_off: float,
+              mean_on: float) -> Tuple[np.ndarray, bool, int]:
+        """
+        Lays out alternating off and on runs of geometric length over days.
+
+        Returns:
+            Tuple[np.ndarray, bool, int]: Per day whether the run is on, and the state and
+            days left of the run in progress at the end.
+        """
+        flags: List[np.ndarray] = []
+        filled = 0
+        while filled < days:
+            take = min(left, days - filled)
+            flags.append(np.full(take, active))
+            filled += take
+            left -= take
+            if left == 0:
+                active = not active
+                left = int(self.rng.geometric(1 / (mean_on if active else mean_off)))
+        return np.concatenate(flags), active, left
+
+    def severity(self, first_day: int, days: int) -> np.ndarray:
+        """
+        Returns the latent severity of days consecutive days.
+        """
+        episode, self.in_episode, self.state_left = self._runs(
+            days, self.in_episode, self.state_left, self.mean_well, self.mean_episode)
+        drive = (1 - self.phi) * self.episode_shift * episode + self.rng.normal(0, self.noise, days)
+        latent = _ar1(drive, self.phi, self.state)
+        self.state = latent[-1]
+        weekday = (np.arange(first_day, first_day + days) + 3) % 7  # Monday is 0
+        return self.baseline + latent + self.weekday_amplitude * np.cos(2 * np.pi * (weekday - 6) / 7)
+
+    def day_counts(self, days: int) -> np.ndarray:
+        """
+        Returns how many assessments the schedule puts on each of days consecutive days.
+        """
+        rng = self.rng
+        if self.schedule == 'daily':
+            return (rng.random(days) < self.adherence).astype(np.int64) + (rng.random(days) < 0.05)
+        lapse, self.in_lapse, self.lapse_left = self._runs(
+            days, self.in_lapse, self.lapse_left, 60, 8)
+        return np.where(lapse, 0, rng.poisson(self.per_day, days))
+
+    def times_of_day(self, count: int) -> np.ndarray:
+        """
+        Returns the second of the day of count assessments.
+        """
+        if self.schedule == 'daily':
+            seconds = self.evening + self.rng.normal(0, 2700, count)
+        else:
+            seconds = self.rng.uniform(7 * 3600, 86400, count)
+        return np.clip(seconds, 0, 86399).astype(np.int64)
+
+
+def _spread_seconds(offsets: np.ndarray, seconds: np.ndarray, days: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sorts the assessments of a block of days and pushes the ones that landed on the same
+    second apart, since the importer treats (beck_date, beck_time) as the key. None is
+    pushed past the last second of the block.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The day offset and the second of the day of each.
+    """
+    stamps = np.sort(offsets * 86400 + seconds)
+    steps = np.arange(len(stamps))
+    stamps = np.maximum.accumulate(stamps - steps) + steps
+    # Both sequences rise strictly, so their minimum does too
+    stamps = np.minimum(stamps, days * 86400 - len(stamps) + steps)
+    return stamps // 86400, stamps % 86400
+
+
+def iter_synthetic_chunks(rows: int, seed: int = 0, profile: int = 0,
+                          end: Optional[date] = None, years: float = DEFAULT_YEARS,
+                          schedule: str = 'mixed',
+                          chunk_size: int = 100000) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Generates the assessments of one synthetic profile as column chunks.
+
+    The same seed and profile number always give the same rows for the same span, and
+    profiles of one seed are independent of each other and of how many are generated.
+
+    Args:
+        rows (int): The number of assessments.
+        seed (int): The random seed.
+        profile (int): The profile number; each one is a different person.
+        end (Optional[date]): The last day assessed; today if omitted.
+        years (float): The length of the span assessed, ending on end.
+        schedule (str): One of SCHEDULES.
+        chunk_size (int): The approximate number of rows per chunk.
+
+    Yields:
+        Dict[str, np.ndarray]: 'id' (1-based, int64), 'beck_date' (days since epoch, int64),
+        'beck_time' (seconds since midnight, int64), 'beck_timestamp' (epoch seconds,
+        int64), 'items' ((n, 12) int8) and 'beck_summary' (int8), in time order.
+
+    Raises:
+        ValueError: If the schedule is unknown, or the span has fewer seconds than rows.
+    """
+    if schedule not in SCHEDULES:
+        raise ValueError(f"Unknown schedule '{schedule}', expected one of {SCHEDULES}")
+    span = max(int(round(years * 365.25)), 1)
+    if rows > span * 86400:
+        raise ValueError(f"{rows:,} assessments don't fit in {years} years at one a second")
+    end = end if end is not None else date.today()
+    first_day = int((np.datetime64(end, 'D') - _EPOCH_DAY).astype(np.int64)) - span + 1
+    rng = np.random.default_rng([seed, profile])
+    person = _Profile(rng, schedule)
+    # The schedule's pattern of busy days and lapses, scaled to the rows asked for
+    pattern = person.day_counts(span).astype(np.float64)
+    if not pattern.any():
+        pattern[:] = 1
+    counts = rng.multinomial(rows, pattern / pattern.sum())
+    # Blocks of whole days holding about chunk_size rows each
+    bounds = np.searchsorted(np.cumsum(counts), np.arange(chunk_size, rows, chunk_size), side='right')
+    bounds = np.unique(np.concatenate(([0], bounds, [span])))
+    loadings = person.loadings.astype(np.float32)
+    unique = np.sqrt(1 - person.loadings ** 2).astype(np.float32)
+    difficulty = person.difficulty.astype(np.float32)
+    produced = 0
+    for block_start, block_end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        block_days = block_end - block_start
+        severity = person.severity(first_day + block_start, block_days)
+        offsets = np.repeat(np.arange(block_days), counts[block_start:block_end])
+        count = len(offsets)
+        if not count:
+            continue
+        offsets, seconds = _spread_seconds(offsets, person.times_of_day(count), block_days)
+        moment = (severity[offsets] + rng.normal(0, 0.3, count)).astype(np.float32)
+        latent = rng.standard_normal((count, ITEM_COUNT), dtype=np.float32)
+        latent *= unique
+        latent += moment[:, None] * loadings
+        latent -= difficulty
+        # The item score is the number of cutpoints below the latent value.
+        items = (latent > _CUTPOINTS[0]).view(np.int8)
+        for cutpoint in _CUTPOINTS[1:]:
+            items += (latent > cutpoint).view(np.int8)
+        days = first_day + block_start + offsets
+        yield {
+            'id': np.arange(produced + 1, produced + count + 1, dtype=np.int64),
+            'beck_date': days,
+            'beck_time': seconds,
+            'beck_timestamp': days * 86400 + seconds,
+            'items': items,
+            'beck_summary': items.sum(axis=1, dtype=np.int8),
+        }
+        produced += count
+
+
+def chunk_rows(chunk: Dict[str, np.ndarray]) -> Iterator[Tuple[object, ...]]:
+    """
+    Converts a column chunk to row tuples in BECK_COLUMNS order, with ISO date and time
+    strings, as the bulk loader and the CSV importer take them.
+
+    Dates are formatted from a year prefix and a cached month-day suffix, which is several
+    times faster than converting datetime64 values to strings.
+
+    Args:
+        chunk (Dict[str, np.ndarray]): A chunk from iter_synthetic_chunks.
+
+    Returns:
+        Iterator[Tuple[object, ...]]: One tuple per row.
+    """
+    days = chunk['beck_date'].astype('datetime64[D]')
+    months = days.astype('datetime64[M]')
+    years = days.astype('datetime64[Y]')
+    year = years.astype(np.int64) + 1970
+    month = (months - years.astype('datetime64[M]')).astype(np.int64) + 1
+    day = (days - months.astype('datetime64[D]')).astype(np.int64) + 1
+    first_year = int(year[0])  # chunks are in time order and never empty
+    prefixes = np.array([f"{value:04d}-" for value in range(first_year, int(year[-1]) + 1)], dtype=object)
+    dates = (prefixes[year - first_year] + _month_days()[month * 32 + day]).tolist()
+    times = _time_strings()[chunk['beck_time']].tolist()
+    return zip(dates, times, *chunk['items'].T.tolist(), chunk['beck_summary'].tolist())
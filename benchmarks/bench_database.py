@@ -0,0 +1,204 @@
+"""
+Benchmarks of the database layer against a temporary SQLite file.
+
+Operations:
+    insert.single             DataManager.insert_into_beck_table, one row per call
+    insert.batch_qtsql        DataManager.insert_many_into_beck_table, 10k rows per call
+    insert.bulk_sqlite3       bulk_load.bulk_insert_beck_rows, 100k rows per call
+    select.table_model[N]     create_and_set_model on a table of N rows
+    select.paged_model[N]     create_and_set_paged_model on a table of N rows
+    select.paged_sorted[N]    the paged model re-sorted by beck_summary, descending
+    range.raw_30d[N]          every row of the last 30 days, through idx_beck_date_time
+    range.raw_365d[N]         every row of the last 365 days
+    range.rollup_day_365d[N]  DataManager.beck_trend by day over the last 365 days
+    range.rollup_month_all[N] DataManager.beck_trend by month over all data
+    delete.contiguous[K/N]    delete_selected_rows on K adjacent rows of the largest table
+    delete.scattered[K/N]     delete_selected_rows on K rows, every other row selected
+
+The table grows through the sizes in order, so each size costs only the rows added.
+
+Usage:
+    python -m benchmarks.bench_database [--sizes 1000,100000,1000000] [--repeat 5]
+        [--json PATH] [--baseline PATH] [--save-baseline] [--threshold 0.2]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from datetime import date, timedelta
+from itertools import islice
+from types import SimpleNamespace
+from typing import List
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QItemSelection, QItemSelectionModel, Qt
+from PyQt6.QtSql import QSqlQuery
+from PyQt6.QtWidgets import QApplication, QTableView
+
+from beck_core.items import BECK_COLUMNS
+from benchmarks.common import (BenchmarkRun, add_common_arguments, finish, synthetic_rows,
+                               time_calls)
+from database.bulk_load import bulk_insert_beck_rows, connect_for_bulk_load
+from database.database_manager import DataManager
+from database.database_utility.connection_tuning import apply_connection_pragmas
+from database.database_utility.delete_records import delete_selected_rows
+from database.database_utility.model_setup import create_and_set_model, create_and_set_paged_model
+from database.database_utility.paged_model import read_rows
+
+FIRST_DAY = date(2015, 1, 1)
+PER_DAY = 3
+DELETE_SIZES = (1, 100, 1000, 10000)
+_RANGE_SQL = (f"SELECT id, {', '.join(BECK_COLUMNS)} FROM beck_table "
+              f"WHERE beck_date >= ? AND beck_date <= ? ORDER BY beck_date, beck_time")
+
+
+def bench_inserts(run: BenchmarkRun, directory: str, repeat: int, single_inserts: int) -> None:
+    """
+    Times the three insert paths on a scratch database of their own.
+    """
+    manager = DataManager(os.path.join(directory, 'inserts.db'), connection_name='bench_inserts')
+    rows = synthetic_rows(10 ** 9, seed=2)
+    run.record('insert.single', time_calls(lambda: manager.insert_into_beck_table(*next(rows)),
+                                           single_inserts))
+    run.record('insert.batch_qtsql',
+               time_calls(lambda: manager.insert_many_into_beck_table(islice(rows, 10000)), repeat),
+               rows=10000)
+    manager.db.close()
+    connection = connect_for_bulk_load(os.path.join(directory, 'inserts.db'))
+    run.record('insert.bulk_sqlite3',
+               time_calls(lambda: bulk_insert_beck_rows(connection, islice(rows, 100000),
+                                                        defer_indexes=True), repeat),
+               rows=100000)
+    connection.close()
+
+
+def grow_table(manager: DataManager, current: int, target: int) -> None:
+    """
+    Loads rows current..target of the synthetic series, untimed.
+
+    Qt links its own copy of SQLite. Two copies in one process don't see each other's
+    POSIX locks, and closing either one's file handle drops the other's, so the QtSql
+    connection is closed while the stdlib connection loads.
+    """
+    manager.db.close()
+    connection = connect_for_bulk_load(manager.db.databaseName())
+    bulk_insert_beck_rows(connection, islice(synthetic_rows(target), current, target),
+                          defer_indexes=True)
+    connection.close()
+    manager.db.open()
+    apply_connection_pragmas(manager.db)
+
+
+def bench_selects(run: BenchmarkRun, manager: DataManager, size: int, repeat: int) -> None:
+    view = QTableView()
+    run.record(f'select.table_model[{size}]',
+               time_calls(lambda: create_and_set_model('beck_table', view), repeat), rows=size)
+    run.record(f'select.paged_model[{size}]',
+               time_calls(lambda: create_and_set_paged_model('beck_table', view), repeat), rows=size)
+    model = create_and_set_paged_model('beck_table', view)
+    column = model.fieldIndex('beck_summary')
+    run.record(f'select.paged_sorted[{size}]',
+               time_calls(lambda: model.sort(column, Qt.SortOrder.DescendingOrder), repeat),
+               rows=size)
+    view.deleteLater()
+
+
+def bench_ranges(run: BenchmarkRun, manager: DataManager, size: int, repeat: int) -> None:
+    last_day = FIRST_DAY + timedelta(days=(size - 1) // PER_DAY)
+
+    def raw_range(days: int) -> None:
+        query = QSqlQuery(manager.db)
+        query.setForwardOnly(True)
+        query.prepare(_RANGE_SQL)
+        query.addBindValue((last_day - timedelta(days=days - 1)).isoformat())
+        query.addBindValue(last_day.isoformat())
+        query.exec()
+        read_rows(query, len(BECK_COLUMNS) + 1)
+
+    year_start = (last_day - timedelta(days=364)).isoformat()
+    run.record(f'range.raw_30d[{size}]', time_calls(lambda: raw_range(30), repeat), rows=size)
+    run.record(f'range.raw_365d[{size}]', time_calls(lambda: raw_range(365), repeat), rows=size)
+    run.record(f'range.rollup_day_365d[{size}]',
+               time_calls(lambda: manager.beck_trend('day', year_start, last_day.isoformat()), repeat),
+               rows=size)
+    run.record(f'range.rollup_month_all[{size}]',
+               time_calls(lambda: manager.beck_trend('month'), repeat), rows=size)
+
+
+def bench_deletes(run: BenchmarkRun, manager: DataManager, size: int, repeat: int) -> None:
+    """
+    Times delete_selected_rows with the selection the user would make in the data view.
+
+    The deleted rows are put back from a snapshot before every run, so each run starts
+    from the same table.
+    """
+    window = SimpleNamespace(beck_tableview=QTableView(), becks_model=None)
+    query = QSqlQuery(manager.db)
+    query.exec("CREATE TEMP TABLE beck_bench_snapshot AS SELECT * FROM beck_table")
+
+    def select(count: int, step: int) -> None:
+        query.exec("INSERT INTO beck_table SELECT * FROM beck_bench_snapshot "
+                   "WHERE id NOT IN (SELECT id FROM beck_table)")
+        window.becks_model = create_and_set_paged_model('beck_table', window.beck_tableview)
+        model = window.becks_model
+        while model.rowCount() < count * step and model.canFetchMore():
+            model.fetchMore()
+        selection = QItemSelection()
+        for row in range(0, count * step, step):
+            selection.select(model.index(row, 0), model.index(row, model.columnCount() - 1))
+        window.beck_tableview.selectionModel().select(
+            selection, QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows)
+
+    delete = lambda: delete_selected_rows(window, 'beck_tableview', 'becks_model')
+    for count in DELETE_SIZES:
+        for label, step in (('contiguous', 1), ('scattered', 2)):
+            if count * step > size:
+                continue
+            run.record(f'delete.{label}[{count}/{size}]',
+                       time_calls(delete, repeat, setup=lambda: select(count, step)),
+                       rows=size, selected=count)
+    window.beck_tableview.deleteLater()
+    query.exec("DROP TABLE beck_bench_snapshot")
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the database layer.")
+    parser.add_argument('--sizes', default='1000,100000,1000000',
+                        help="Comma separated table sizes for the select and range benchmarks.")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per operation.")
+    parser.add_argument('--single-inserts', type=int, default=200,
+                        help="Timed calls of insert_into_beck_table.")
+    parser.add_argument('--keep', action='store_true', help="Keep the temporary databases.")
+    add_common_arguments(parser)
+    args = parser.parse_args(argv)
+    sizes = sorted(int(size) for size in args.sizes.split(','))
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    directory = tempfile.mkdtemp(prefix='beck_bench_')
+    run = BenchmarkRun('bench_database')
+    run.header()
+    try:
+        bench_inserts(run, directory, args.repeat, args.single_inserts)
+        db_path = os.path.join(directory, 'beck.db')
+        manager = DataManager(db_path)
+        loaded = 0
+        for size in sizes:
+            grow_table(manager, loaded, size)
+            loaded = size
+            bench_selects(run, manager, size, args.repeat)
+            bench_ranges(run, manager, size, args.repeat)
+            app.processEvents()
+        bench_deletes(run, manager, loaded, args.repeat)
+        app.processEvents()
+    finally:
+        if args.keep:
+            print(f"Databases kept in {directory}")
+        else:
+            shutil.rmtree(directory, ignore_errors=True)
+    return finish(run, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
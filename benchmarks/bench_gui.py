@@ -0,0 +1,232 @@
+"""
+GUI latency benchmarks of MainWindow under the offscreen Qt platform.
+
+Operations:
+    window.first_paint        MainWindow() and show() until the window's first paint
+    slider.value_changed      one slider setValue, through on_beck_item_changed
+    slider.summary_flush      the coalesced beck_summary update after a drag
+    commit.gui_blocked        actionCommit.trigger(), the time the GUI thread is busy
+    commit.until_refresh      actionCommit until the data view has re-selected the row
+    table.scroll_page[N]      one page down in beck_tableview, repainted
+    table.sort[N]             a header sort until the first page is repainted
+
+The app runs with HOME pointed at a temporary directory, so its database, settings and
+log are throwaway. The table is filled with N synthetic rows before the window opens.
+Every operation is reported as percentiles. Runs that time out waiting for the app are
+counted as failures instead of samples, and fail the run.
+
+Usage:
+    python -m benchmarks.bench_gui [--rows 100000] [--repeat 30]
+        [--json PATH] [--baseline PATH] [--save-baseline] [--threshold 0.2]
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+# The app derives its database, settings and log paths from HOME when first imported.
+_HOME = tempfile.mkdtemp(prefix='beck_bench_gui_')
+os.environ['HOME'] = _HOME
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import argparse
+import time
+from itertools import islice
+from typing import Any, Callable, List, Optional
+
+from PyQt6.QtCore import QEvent, QEventLoop, QObject, Qt, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from benchmarks.common import BenchmarkRun, add_common_arguments, finish, synthetic_rows, time_calls
+
+
+class _PaintWatcher(QObject):
+    """
+    Records when any widget inside a window paints.
+    """
+
+    def __init__(self, window) -> None:
+        super().__init__()
+        self.window = window
+        self.painted_at = None
+
+    def eventFilter(self, watched, event) -> bool:
+        if (self.painted_at is None and event.type() == QEvent.Type.Paint
+                and getattr(watched, 'window', None) is not None and watched.window() is self.window):
+            self.painted_at = time.perf_counter()
+        return False
+
+
+def wait_for(signal, timeout_ms: int = 10000, trigger: Optional[Callable[[], Any]] = None) -> bool:
+    """
+    Runs the event loop until signal is emitted or timeout_ms passes.
+
+    The signal is connected before trigger is called, so an emission from inside trigger,
+    such as a model reset served from a cache, is not missed.
+
+    Args:
+        signal: The bound signal to wait for.
+        timeout_ms (int): The longest wait.
+        trigger (Optional[Callable[[], Any]]): The action expected to emit the signal.
+
+    Returns:
+        bool: False on timeout.
+    """
+    loop = QEventLoop()
+    fired = []
+
+    def on_signal(*args) -> None:
+        fired.append(True)
+        loop.quit()
+
+    signal.connect(on_signal)
+    try:
+        if trigger is not None:
+            trigger()
+        if not fired:
+            QTimer.singleShot(timeout_ms, loop.quit)
+            loop.exec()
+    finally:
+        signal.disconnect(on_signal)
+    return bool(fired)
+
+
+def bench_first_paint(run: BenchmarkRun, app: QApplication, repeat: int) -> None:
+    from ui.main_window import MainWindow
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        window = MainWindow()
+        watcher = _PaintWatcher(window)
+        app.installEventFilter(watcher)
+        window.show()
+        while watcher.painted_at is None:
+            app.processEvents(QEventLoop.ProcessEventsFlag.WaitForMoreEvents)
+        samples.append((watcher.painted_at - start) * 1000)
+        app.removeEventFilter(watcher)
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    run.record('window.first_paint', samples)
+
+
+def bench_sliders(run: BenchmarkRun, app: QApplication, window, repeat: int) -> None:
+    values = iter(range(10 ** 9))
+    sliders = window.beck_sliders
+
+    def move() -> None:
+        step = next(values)
+        sliders[step % len(sliders)].setValue(step // len(sliders) % 4)
+
+    run.record('slider.value_changed', time_calls(move, repeat * 10))
+    window.tabWidget.setCurrentWidget(window.tab_13)  # the tab beck_summary is on
+    app.processEvents()
+    flushes = []
+    for _ in range(repeat):
+        for _ in range(20):
+            move()
+        start = time.perf_counter()
+        window.summary_timer.stop()
+        window.flush_beck_summary()
+        window.beck_summary.repaint()
+        flushes.append((time.perf_counter() - start) * 1000)
+    run.record('slider.summary_flush', flushes)
+
+
+def bench_commit(run: BenchmarkRun, app: QApplication, window, repeat: int) -> None:
+    model = window.becks_model
+    blocked, refresh = [], []
+    timeouts = 0
+    for index in range(repeat):
+        window.sadness.setValue(index % 4)
+        window.beck_time.setTime(window.beck_time.time().addSecs(1))
+        start = time.perf_counter()
+
+        def commit() -> None:
+            window.actionCommit.trigger()
+            blocked.append((time.perf_counter() - start) * 1000)
+
+        if not wait_for(model.modelReset, trigger=commit):
+            timeouts += 1
+            continue
+        window.beck_tableview.viewport().repaint()
+        refresh.append((time.perf_counter() - start) * 1000)
+    run.record('commit.gui_blocked', blocked)
+    run.record('commit.until_refresh', refresh, failures=timeouts)
+
+
+def bench_table(run: BenchmarkRun, app: QApplication, window, rows: int, repeat: int) -> None:
+    view = window.beck_tableview
+    model = window.becks_model
+    scrollbar = view.verticalScrollBar()
+
+    def page_down() -> None:
+        scrollbar.setValue(scrollbar.value() + scrollbar.pageStep())
+        view.viewport().repaint()
+        app.processEvents()
+
+    run.record(f'table.scroll_page[{rows}]', time_calls(page_down, repeat * 5), rows=rows)
+    column = model.fieldIndex('beck_summary')
+    orders = [Qt.SortOrder.DescendingOrder, Qt.SortOrder.AscendingOrder]
+    samples = []
+    timeouts = 0
+    for index in range(repeat):
+        start = time.perf_counter()
+        if not wait_for(model.modelReset, trigger=lambda: view.sortByColumn(column, orders[index % 2])):
+            timeouts += 1
+            continue
+        view.viewport().repaint()
+        samples.append((time.perf_counter() - start) * 1000)
+    run.record(f'table.sort[{rows}]', samples, failures=timeouts, rows=rows)
+
+
+def fill_database(rows: int) -> None:
+    """
+    Creates the app database and bulk loads the synthetic rows before any QtSql
+    connection to it is opened.
+    """
+    from database.bulk_load import bulk_insert_beck_rows, connect_for_bulk_load
+    from database.database_manager import DataManager, target_db_path
+    from PyQt6.QtSql import QSqlDatabase
+
+    manager = DataManager(target_db_path, connection_name='bench_setup')
+    manager.db.close()
+    del manager
+    QSqlDatabase.removeDatabase('bench_setup')
+    connection = connect_for_bulk_load(target_db_path)
+    bulk_insert_beck_rows(connection, islice(synthetic_rows(rows), rows), defer_indexes=True)
+    connection.close()
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark GUI latency offscreen.")
+    parser.add_argument('--rows', type=int, default=100000, help="Rows in the table.")
+    parser.add_argument('--repeat', type=int, default=30, help="Timed runs per operation.")
+    add_common_arguments(parser)
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    run = BenchmarkRun('bench_gui')
+    run.header()
+    try:
+        fill_database(args.rows)
+        bench_first_paint(run, app, min(args.repeat, 10))
+        from ui.main_window import MainWindow
+        window = MainWindow()
+        window.show()
+        window.switch_to_page2()
+        window.switch_to_page1()
+        bench_sliders(run, app, window, args.repeat)
+        bench_commit(run, app, window, args.repeat)
+        window.switch_to_page2()
+        app.processEvents()
+        bench_table(run, app, window, args.rows, args.repeat)
+        window.close()
+    finally:
+        shutil.rmtree(_HOME, ignore_errors=True)
+    return finish(run, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
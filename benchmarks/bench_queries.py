@@ -0,0 +1,136 @@
+"""
+Benchmarks of DataManager's read query API against the ad-hoc queries it replaces.
+
+Every query is timed three ways:
+    <op>.adhoc     the method's SQL on a new QSqlQuery prepared per call, read to the same width
+    <op>.uncached  the DataManager method with its prepared statement cache disabled
+    <op>.cached    the DataManager method as the app calls it
+
+Operations:
+    latest_50[N]      DataManager.latest_becks(50)
+    range_30d[N]      DataManager.becks_between over the last 30 days
+    by_id_100[N]      DataManager.becks_by_id with 100 scattered ids
+    histogram_all[N]  DataManager.summary_histogram over all rows
+    histogram_30d[N]  DataManager.summary_histogram over the last 30 days
+
+Only the preparation differs between the variants: every one runs the statement the
+DataManager method runs and reads the same columns.
+
+The table grows through the sizes in order, so each size costs only the rows added.
+
+Usage:
+    python -m benchmarks.bench_queries [--sizes 1000,100000,1000000] [--repeat 200]
+        [--json PATH] [--baseline PATH] [--save-baseline] [--threshold 0.2]
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+from datetime import timedelta
+from typing import Any, Callable, List, Sequence
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtSql import QSqlQuery
+from PyQt6.QtWidgets import QApplication
+
+import tracker_config as tkc
+from benchmarks.bench_database import FIRST_DAY, PER_DAY, grow_table
+from benchmarks.common import BenchmarkRun, add_common_arguments, finish, time_calls
+from database.database_manager import DataManager
+from database.database_utility.beck_queries import BY_ID_SQL, LATEST_SQL, histogram_sql, range_sql
+
+
+def adhoc(manager: DataManager, sql: str, binds: Sequence[Any], width: int = 4) -> Callable[[], Any]:
+    """
+    Returns a call running a statement on a query prepared for that call alone.
+    """
+    def call() -> Any:
+        query = QSqlQuery(manager.db)
+        query.setForwardOnly(True)
+        query.prepare(sql)
+        for value in binds:
+            query.addBindValue(value)
+        query.exec()
+        value = query.value
+        rows = []
+        while query.next():
+            rows.append(tuple(value(i) for i in range(width)))
+        query.finish()
+        return rows
+    return call
+
+
+def record_variants(run: BenchmarkRun, manager: DataManager, name: str, size: int, repeat: int,
+                    adhoc_call: Callable[[], Any], api_call: Callable[[], Any]) -> None:
+    run.record(f'{name}[{size}].adhoc', time_calls(adhoc_call, repeat), rows=size)
+    manager.queries.clear()
+    manager.queries.size = 0
+    run.record(f'{name}[{size}].uncached', time_calls(api_call, repeat), rows=size)
+    manager.queries.size = tkc.QUERY_CACHE_SIZE
+    api_call()
+    run.record(f'{name}[{size}].cached', time_calls(api_call, repeat), rows=size)
+
+
+def bench_queries(run: BenchmarkRun, manager: DataManager, size: int, repeat: int) -> None:
+    last_day = FIRST_DAY + timedelta(days=(size - 1) // PER_DAY)
+    month_start = (last_day - timedelta(days=29)).isoformat()
+    month_end = last_day.isoformat()
+    ids = list(range(1, size + 1, max(size // 100, 1)))[:100]
+    record_variants(
+        run, manager, 'latest_50', size, repeat,
+        adhoc(manager, LATEST_SQL, [50]),
+        lambda: manager.latest_becks(50))
+    record_variants(
+        run, manager, 'range_30d', size, repeat,
+        adhoc(manager, *range_sql(month_start, month_end)),
+        lambda: manager.becks_between(month_start, month_end))
+    record_variants(
+        run, manager, 'by_id_100', size, repeat,
+        adhoc(manager, BY_ID_SQL, [json.dumps(ids)]),
+        lambda: manager.becks_by_id(ids))
+    record_variants(
+        run, manager, 'histogram_all', size, repeat,
+        adhoc(manager, *histogram_sql(None, None), 2),
+        lambda: manager.summary_histogram())
+    record_variants(
+        run, manager, 'histogram_30d', size, repeat,
+        adhoc(manager, *histogram_sql(month_start, month_end), 2),
+        lambda: manager.summary_histogram(month_start, month_end))
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the read query API.")
+    parser.add_argument('--sizes', default='1000,100000,1000000',
+                        help="Comma separated table sizes.")
+    parser.add_argument('--repeat', type=int, default=200, help="Timed calls per operation.")
+    parser.add_argument('--keep', action='store_true', help="Keep the temporary database.")
+    add_common_arguments(parser)
+    args = parser.parse_args(argv)
+    sizes = sorted(int(size) for size in args.sizes.split(','))
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    directory = tempfile.mkdtemp(prefix='beck_bench_')
+    run = BenchmarkRun('bench_queries')
+    run.header()
+    try:
+        manager = DataManager(os.path.join(directory, 'beck.db'))
+        loaded = 0
+        for size in sizes:
+            manager.queries.clear()
+            grow_table(manager, loaded, size)
+            loaded = size
+            bench_queries(run, manager, size, args.repeat)
+            app.processEvents()
+    finally:
+        if args.keep:
+            print(f"Database kept in {directory}")
+        else:
+            shutil.rmtree(directory, ignore_errors=True)
+    return finish(run, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
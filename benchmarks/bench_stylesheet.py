@@ -0,0 +1,105 @@
+"""
+Times building, polishing and first rendering the main window's widgets under the two
+ways of styling them:
+
+    inline  one stylesheet per widget, as gui.py used to set them: the window sheet,
+            the stacked and tab widget sheets, the table view sheet, a colour sheet on
+            each slider and an empty sheet on each answer label
+    app     the compiled sheet of ui.theme set once on the QApplication, with the
+            slider colours selected by the beckColor property
+
+Only Ui_MainWindow is built, on a bare QMainWindow, so the numbers are the cost of the
+widgets and their styling without the database or settings.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_stylesheet [--repeat N]
+        [--json PATH] [--baseline PATH] [--save-baseline] [--threshold 0.2]
+"""
+import argparse
+import sys
+import time
+from typing import Dict, List
+
+from PyQt6 import QtWidgets
+
+from benchmarks.common import BenchmarkRun, add_common_arguments, finish
+from ui.main_ui.gui import Ui_MainWindow
+from ui.theme import BASE_STYLESHEET, apply_theme, compile_stylesheet
+
+_PAGE_RULES = BASE_STYLESHEET[BASE_STYLESHEET.index('#stackedWidget QTabWidget {'):]
+_WINDOW_RULES = BASE_STYLESHEET[:BASE_STYLESHEET.index('#stackedWidget QTabWidget {')]
+
+
+def _inline_sheets(window: QtWidgets.QMainWindow, ui: Ui_MainWindow) -> None:
+    """
+    Puts back the per-widget stylesheets gui.py used to set, in the same order.
+    """
+    window.setStyleSheet(_WINDOW_RULES)
+    ui.stackedWidget.setStyleSheet(_PAGE_RULES)
+    ui.tabWidget.setStyleSheet(_PAGE_RULES)
+    colour_rules = compile_stylesheet()[len(BASE_STYLESHEET):]
+    for slider in window.findChildren(QtWidgets.QSlider):
+        name = slider.property("beckColor")
+        own = ''.join(line + '\n' for line in colour_rules.splitlines()
+                      if f'[beckColor="{name}"]' in line)
+        slider.setStyleSheet(own)
+    for label in window.findChildren(QtWidgets.QLabel):
+        if label.wordWrap():
+            label.setStyleSheet("")
+    ui.beck_tableview.setStyleSheet(_PAGE_RULES)
+
+
+def _build(inline: bool) -> Dict[str, float]:
+    """
+    Builds one window and returns the milliseconds spent in each phase.
+    """
+    timings = {}
+    start = time.perf_counter()
+    window = QtWidgets.QMainWindow()
+    ui = Ui_MainWindow()
+    ui.setupUi(window)
+    if inline:
+        _inline_sheets(window, ui)
+    timings['build'] = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    window.ensurePolished()
+    for widget in window.findChildren(QtWidgets.QWidget):
+        widget.ensurePolished()
+    timings['polish'] = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    window.resize(466, 300)
+    window.grab()
+    timings['first render'] = (time.perf_counter() - start) * 1000
+    timings['total'] = sum(timings.values())
+    window.deleteLater()
+    QtWidgets.QApplication.processEvents()
+    return timings
+
+
+def _run(run: BenchmarkRun, mode: str, repeat: int, inline: bool) -> None:
+    _build(inline)  # warm up fonts and the style plugin
+    samples: Dict[str, List[float]] = {}
+    for _ in range(repeat):
+        for phase, took in _build(inline).items():
+            samples.setdefault(phase, []).append(took)
+    for phase, values in samples.items():
+        run.record(f"{mode}.{phase.replace(' ', '_')}", values)
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Time inline versus application-level stylesheets.")
+    parser.add_argument('--repeat', type=int, default=20, help="Windows built per mode.")
+    add_common_arguments(parser)
+    args = parser.parse_args(argv)
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    run = BenchmarkRun('bench_stylesheet')
+    run.header()
+    app.setStyleSheet("")
+    _run(run, 'inline', args.repeat, inline=True)
+    apply_theme(app)
+    _run(run, 'app', args.repeat, inline=False)
+    return finish(run, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,237 @@
+"""
+Shared plumbing of the benchmark scripts: timing, percentiles, JSON results and the
+comparison against a stored baseline.
+
+A suite records one entry per operation with record() and finishes with finish(), which
+prints a table, writes the results as JSON and, given a baseline file, fails when any
+operation's median got slower than the threshold allows:
+
+    python -m benchmarks.bench_database --save-baseline       # on the reference machine
+    python -m benchmarks.bench_database --baseline benchmarks/baselines/bench_database.json
+
+Baselines are only comparable on the machine that produced them.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines')
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Returns the value at a fraction of the sorted samples, interpolating between ranks.
+
+    Args:
+        values (List[float]): The samples.
+        fraction (float): 0.5 for the median, 0.95 for p95 and so on.
+
+    Returns:
+        float: The percentile.
+    """
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def time_calls(func: Callable[[], Any], repeat: int,
+               setup: Optional[Callable[[], Any]] = None) -> List[float]:
+    """
+    Calls func repeat times and returns how long each call took in milliseconds.
+
+    Args:
+        func (Callable[[], Any]): The operation to time.
+        repeat (int): The number of timed calls.
+        setup (Optional[Callable[[], Any]]): Run untimed before every call.
+
+    Returns:
+        List[float]: One duration per call.
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Reduces timing samples to the figures stored in the results.
+    """
+    return {
+        'median_ms': statistics.median(samples),
+        'p90_ms': percentile(samples, 0.9),
+        'p95_ms': percentile(samples, 0.95),
+        'p99_ms': percentile(samples, 0.99),
+        'min_ms': min(samples),
+        'max_ms': max(samples),
+        'runs': len(samples),
+    }
+
+
+def synthetic_rows(count: int, first_day: date = date(2015, 1, 1), per_day: int = 3,
+                   seed: int = 1) -> Iterator[Tuple[Any, ...]]:
+    """
+    Yields reproducible beck_table rows in BECK_COLUMNS order, per_day to a day.
+
+    Args:
+        count (int): The number of rows.
+        first_day (date): The beck_date of the first row.
+        per_day (int): Rows per day, spread over the waking hours.
+        seed (int): The random seed, so every run loads the same data.
+    """
+    rng = random.Random(seed)
+    for index in range(count):
+        day = first_day + timedelta(days=index // per_day)
+        minute = 7 * 60 + (index % per_day) * (15 * 60 // per_day) + rng.randrange(60)
+        items = [rng.choice((0, 0, 1, 1, 2, 3)) for _ in range(12)]
+        yield (day.isoformat(), f"{minute // 60:02d}:{minute % 60:02d}:00", *items, sum(items))
+
+
+class BenchmarkRun:
+    """
+    Collects the results of one suite run.
+
+    Attributes:
+        suite (str): The suite name, also the default baseline file name.
+        results (Dict[str, Dict[str, Any]]): Summaries by operation name, in run order.
+
+    """
+
+    def __init__(self, suite: str) -> None:
+        self.suite: str = suite
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, name: str, samples: List[float], failures: int = 0, **params: Any) -> None:
+        """
+        Stores the summary of one operation and prints it as a table row.
+
+        Args:
+            name (str): A unique, stable operation name; baselines are matched on it.
+            samples (List[float]): Durations in milliseconds of the successful runs.
+            failures (int): Runs that didn't complete, e.g. timed out. They fail the suite.
+            **params: Parameters worth keeping with the result, such as row counts.
+        """
+        summary: Dict[str, Any] = summarize(samples) if samples else {'runs': 0}
+        summary['failures'] = failures
+        summary['params'] = params
+        self.results[name] = summary
+        if samples:
+            print(f"{name:<40}{summary['median_ms']:11.3f}{summary['p90_ms']:11.3f}"
+                  f"{summary['p99_ms']:11.3f}{summary['max_ms']:11.3f}{summary['runs']:6d}", flush=True)
+        if failures:
+            print(f"FAILED {name}: {failures} of {failures + len(samples)} runs did not complete",
+                  file=sys.stderr, flush=True)
+
+    def header(self) -> None:
+        print(f"{'operation':<40}{'p50 ms':>11}{'p90 ms':>11}{'p99 ms':>11}{'max ms':>11}{'runs':>6}")
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            'suite': self.suite,
+            'created': datetime.now(tz=timezone.utc).isoformat(timespec='seconds'),
+            'environment': environment(),
+            'results': self.results,
+        }
+
+
+def environment() -> Dict[str, str]:
+    """
+    Describes the machine and library versions a result was measured with.
+    """
+    from PyQt6.QtCore import PYQT_VERSION_STR, QT_VERSION_STR
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'sqlite': sqlite3.sqlite_version,
+        'qt': QT_VERSION_STR,
+        'pyqt': PYQT_VERSION_STR,
+    }
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            threshold: float) -> List[Tuple[str, float, float]]:
+    """
+    Finds the operations whose median exceeds the baseline's by more than threshold.
+
+    Operations missing from either side are skipped, so suites can grow.
+
+    Args:
+        results (Dict[str, Dict[str, Any]]): The current results.
+        baseline (Dict[str, Dict[str, Any]]): The results of the baseline file.
+        threshold (float): The allowed slowdown, 0.2 for 20 %.
+
+    Returns:
+        List[Tuple[str, float, float]]: (name, baseline median, current median) per
+        regression.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if (previous is None or 'median_ms' not in current or 'median_ms' not in previous
+                or previous['median_ms'] <= 0):
+            continue
+        if current['median_ms'] > previous['median_ms'] * (1 + threshold):
+            regressions.append((name, previous['median_ms'], current['median_ms']))
+    return regressions
+
+
+def add_common_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds the --json, --baseline, --save-baseline and --threshold options.
+    """
+    parser.add_argument('--json', metavar='PATH', help="Write the results as JSON to PATH.")
+    parser.add_argument('--baseline', metavar='PATH',
+                        help="Compare against this results file and fail on regressions.")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Store the results as the suite's baseline in benchmarks/baselines.")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Allowed slowdown against the baseline, as a fraction (default 0.2).")
+
+
+def finish(run: BenchmarkRun, args: argparse.Namespace) -> int:
+    """
+    Writes the results where asked and compares them with the baseline.
+
+    Args:
+        run (BenchmarkRun): The finished run.
+        args (argparse.Namespace): Parsed options from add_common_arguments.
+
+    Returns:
+        int: The process exit code, 1 if any operation failed or regressed.
+    """
+    document = run.to_json()
+    failed = [name for name, result in run.results.items() if result.get('failures')]
+    paths = [args.json] if args.json else []
+    if args.save_baseline:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        paths.append(os.path.join(BASELINE_DIR, f"{run.suite}.json"))
+    for path in paths:
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(document, handle, indent=2)
+        print(f"Results written to {path}")
+    if not args.baseline:
+        return 1 if failed else 0
+    with open(args.baseline, encoding='utf-8') as handle:
+        baseline = json.load(handle)
+    regressions = compare(run.results, baseline.get('results', {}), args.threshold)
+    for name, before, after in regressions:
+        print(f"REGRESSION {name}: {before:.3f} ms -> {after:.3f} ms "
+              f"(+{(after / before - 1) * 100:.0f} %)", file=sys.stderr)
+    if not regressions:
+        print(f"No regressions beyond {args.threshold * 100:.0f} % against {args.baseline}")
+    return 1 if regressions or failed else 0
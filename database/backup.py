@@ -0,0 +1,308 @@
+import gzip
+import os
+import shutil
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+import tracker_config as tkc
+from logger_setup import log_timing, logger
+
+SNAPSHOT_PREFIX = 'beck_'
+SNAPSHOT_SUFFIX = '.db.gz'
+# A snapshot is written under this suffix first and renamed once it is complete.
+_PARTIAL_SUFFIX = '.partial'
+# A validated restore waits next to the database under this suffix until it is opened.
+STAGED_RESTORE_SUFFIX = '.restore'
+_COPY_BUFFER = 1024 * 1024
+
+default_backup_dir = os.path.join(os.path.expanduser('~'), tkc.BACKUP_DIR)
+
+
+def snapshot_name(when: Optional[datetime] = None) -> str:
+    """
+    Returns the file name of a snapshot taken at a given time, now by default.
+
+    Names sort in the order the snapshots were taken.
+    """
+    return f"{SNAPSHOT_PREFIX}{(when or datetime.now()):%Y%m%d_%H%M%S}{SNAPSHOT_SUFFIX}"
+
+
+def list_snapshots(backup_dir: str) -> List[str]:
+    """
+    Returns the paths of the complete snapshots in a directory, newest first.
+
+    Args:
+        backup_dir (str): The backup directory. It need not exist.
+
+    Returns:
+        List[str]: The snapshot paths.
+    """
+    if not os.path.isdir(backup_dir):
+        return []
+    names = [name for name in os.listdir(backup_dir)
+             if name.startswith(SNAPSHOT_PREFIX) and name.endswith(SNAPSHOT_SUFFIX)]
+    return [os.path.join(backup_dir, name) for name in sorted(names, reverse=True)]
+
+
+def backup_due(backup_dir: str, interval_hours: float = tkc.BACKUP_INTERVAL_HOURS) -> bool:
+    """
+    Tells whether the newest snapshot is older than the backup interval, or missing.
+
+    Args:
+        backup_dir (str): The backup directory.
+        interval_hours (float): The time between scheduled snapshots.
+
+    Returns:
+        bool: True if a snapshot should be taken.
+    """
+    snapshots = list_snapshots(backup_dir)
+    if not snapshots:
+        return True
+    taken = datetime.fromtimestamp(os.path.getmtime(snapshots[0]))
+    return datetime.now() - taken >= timedelta(hours=interval_hours)
+
+
+def copy_database(source_path: str,
+                  target_path: str,
+                  pages: int = tkc.BACKUP_STEP_PAGES,
+                  progress: Optional[Callable[[int, int], None]] = None) -> None:
+    """
+    Copies a database with SQLite's online backup API, a few pages per step.
+
+    The source is only read-locked while a step runs, so other connections keep writing
+    between steps; the copy is restarted by SQLite if they do and is consistent as of
+    the last step. The target is overwritten.
+
+    This uses the stdlib driver, whose SQLite library is not the one QtSql bundles. Two
+    SQLite libraries in one process must never have the same file open at once, so the
+    app takes its snapshots with DataManager.snapshot_into instead while its own
+    connections are open.
+
+    Args:
+        source_path (str): The database to copy.
+        target_path (str): The file to write.
+        pages (int): The number of pages copied per step.
+        progress (Optional[Callable[[int, int], None]]): Called after every step with the
+            pages remaining and the total.
+    """
+    def on_step(status: int, remaining: int, total: int) -> None:
+        if progress is not None:
+            progress(remaining, total)
+
+    source = sqlite3.connect(f"file:{source_path}?mode=ro", uri=True)
+    try:
+        target = sqlite3.connect(target_path)
+        try:
+            with log_timing('backup.copy', source=source_path):
+                source.backup(target, pages=pages, progress=on_step)
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+
+def compress_snapshot(raw_path: str, snapshot_path: str) -> int:
+    """
+    Gzips a copied database into a snapshot, streaming, and removes the copy.
+
+    The snapshot only appears under its name once it is complete.
+
+    Args:
+        raw_path (str): An uncompressed copy of the database.
+        snapshot_path (str): The snapshot to write.
+
+    Returns:
+        int: The size of the snapshot in bytes.
+    """
+    partial_path = snapshot_path + _PARTIAL_SUFFIX
+    try:
+        with open(raw_path, 'rb') as source, \
+                gzip.open(partial_path, 'wb', compresslevel=tkc.BACKUP_GZIP_LEVEL) as target:
+            shutil.copyfileobj(source, target, _COPY_BUFFER)
+        os.replace(partial_path, snapshot_path)
+    finally:
+        for path in (partial_path, raw_path):
+            if os.path.exists(path):
+                os.remove(path)
+    return os.path.getsize(snapshot_path)
+
+
+def rotate_snapshots(backup_dir: str, keep: int = tkc.BACKUP_KEEP) -> List[str]:
+    """
+    Deletes all but the newest snapshots.
+
+    Args:
+        backup_dir (str): The backup directory.
+        keep (int): The number of snapshots kept.
+
+    Returns:
+        List[str]: The deleted paths.
+    """
+    removed = list_snapshots(backup_dir)[max(keep, 1):]
+    for path in removed:
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.error("Error removing old backup %s: %s", path, e)
+    return removed
+
+
+def backup_database(db_path: str,
+                    backup_dir: str = default_backup_dir,
+                    keep: int = tkc.BACKUP_KEEP,
+                    pages: int = tkc.BACKUP_STEP_PAGES,
+                    progress: Optional[Callable[[int, int], None]] = None) -> str:
+    """
+    Takes a gzip snapshot of a database with the online backup API and rotates old ones.
+
+    Only for databases this process has no QtSql connection to; see copy_database.
+
+    Args:
+        db_path (str): The database to back up.
+        backup_dir (str): The directory the snapshots are kept in.
+        keep (int): The number of snapshots kept.
+        pages (int): The number of pages copied per step.
+        progress (Optional[Callable[[int, int], None]]): See copy_database.
+
+    Returns:
+        str: The path of the new snapshot.
+    """
+    os.makedirs(backup_dir, exist_ok=True)
+    snapshot_path = os.path.join(backup_dir, snapshot_name())
+    raw_path = snapshot_path + '.db'
+    try:
+        copy_database(db_path, raw_path, pages, progress)
+    except Exception:
+        if os.path.exists(raw_path):
+            os.remove(raw_path)
+        raise
+    compress_snapshot(raw_path, snapshot_path)
+    rotate_snapshots(backup_dir, keep)
+    return snapshot_path
+
+
+def check_integrity(db_path: str) -> List[str]:
+    """
+    Runs PRAGMA integrity_check on a database.
+
+    Args:
+        db_path (str): The database to check.
+
+    Returns:
+        List[str]: The problems found; empty if the database is intact.
+    """
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        with log_timing('backup.integrity_check', path=db_path):
+            messages = [row[0] for row in connection.execute("PRAGMA integrity_check")]
+    except sqlite3.DatabaseError as e:
+        return [str(e)]
+    finally:
+        connection.close()
+    return [] if messages == ['ok'] else messages
+
+
+def stage_restore(snapshot_path: str, db_path: str) -> str:
+    """
+    Decompresses a snapshot next to a database and checks it, without touching the
+    database itself.
+
+    The checked copy is put in place by apply_staged_restore, which is quick because it
+    only renames the file.
+
+    Args:
+        snapshot_path (str): The snapshot to restore.
+        db_path (str): The database it will replace.
+
+    Returns:
+        str: The path of the staged copy.
+
+    Raises:
+        RuntimeError: If the snapshot is not an intact database.
+    """
+    staged_path = db_path + STAGED_RESTORE_SUFFIX
+    partial_path = staged_path + _PARTIAL_SUFFIX
+    try:
+        with gzip.open(snapshot_path, 'rb') as source, open(partial_path, 'wb') as target:
+            shutil.copyfileobj(source, target, _COPY_BUFFER)
+        problems = check_integrity(partial_path)
+        if problems:
+            raise RuntimeError(f"{os.path.basename(snapshot_path)} failed the integrity check: "
+                               f"{'; '.join(problems[:3])}")
+        os.replace(partial_path, staged_path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+    return staged_path
+
+
+def apply_staged_restore(db_path: str) -> bool:
+    """
+    Replaces a database with its staged restore, if there is one.
+
+    Must run before any connection to the database is opened. The database's WAL and
+    shared memory files belong to the replaced file and are removed with it.
+
+    Args:
+        db_path (str): The database.
+
+    Returns:
+        bool: True if a restore was applied.
+    """
+    staged_path = db_path + STAGED_RESTORE_SUFFIX
+    if not os.path.exists(staged_path):
+        return False
+    for suffix in ('-wal', '-shm'):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+    os.replace(staged_path, db_path)
+    logger.info("Restored %s from a staged backup", db_path)
+    return True
+
+
+def restore_database(snapshot_path: str, db_path: str) -> None:
+    """
+    Restores a database from a snapshot after checking the snapshot's integrity.
+
+    Nothing may have the database open.
+
+    Args:
+        snapshot_path (str): The snapshot to restore.
+        db_path (str): The database to replace.
+
+    Raises:
+        RuntimeError: If the snapshot is not an intact database.
+    """
+    stage_restore(snapshot_path, db_path)
+    apply_staged_restore(db_path)
+
+
+class RestoreStager(QThread):
+    """
+    Runs stage_restore off the GUI thread, since decompressing and checking a large
+    snapshot takes seconds.
+
+    Signals:
+        staged (str): The snapshot passed the check and is staged.
+        failed (str): The error message.
+
+    """
+    staged = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, snapshot_path: str, db_path: str, parent=None) -> None:
+        super().__init__(parent)
+        self.snapshot_path: str = snapshot_path
+        self.db_path: str = db_path
+
+    def run(self) -> None:
+        try:
+            stage_restore(self.snapshot_path, self.db_path)
+        except Exception as e:
+            logger.error("Error staging restore of %s: %s", self.snapshot_path, e)
+            self.failed.emit(str(e))
+        else:
+            self.staged.emit(self.snapshot_path)
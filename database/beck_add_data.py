@@ -1,8 +1,10 @@
 from PyQt6.QtCore import QDate, QTime
 import tracker_config as tkc
 from logger_setup import logger
+from utility.app_operations.perf_stats import perf_stats
 
 
+@perf_stats.timed('add_beck_data')
 def add_beck_data(main_window_instance, widget_names, db_insert_method):
     """
     Add mental solo data to the database.
@@ -42,13 +44,13 @@ def add_beck_data(main_window_instance, widget_names, db_insert_method):
                 value = value.toString(format_type)
             data_to_insert.append(value)
         except Exception as e:
-            logger.error(f"Error getting value from widget {widget_name}: {e}")
+            logger.error("Error getting value from widget %s: %s", widget_name, e)
 
     try:
         db_insert_method(*data_to_insert)
         reset_beck_exam(main_window_instance, widget_names)
     except Exception as e:
-        logger.error(f"Error inserting data into the database: {e}")
+        logger.error("Error inserting data into the database: %s", e)
 
 
 def reset_beck_exam(main_window_instance, widget_names):
@@ -81,6 +83,8 @@ def reset_beck_exam(main_window_instance, widget_names):
         getattr(main_window_instance, widget_names['victimhood']).setValue(0)
         getattr(main_window_instance, widget_names['sleep']).setValue(0)
         getattr(main_window_instance, widget_names['beck_summary']).setValue(0)
-        getattr(main_window_instance, widget_names['model']).select()
+        model = getattr(main_window_instance, widget_names['model'])
+        if model is not None:
+            model.select()
     except Exception as e:
-        logger.error(f"Error resetting pain levels form: {e}")
+        logger.error("Error resetting pain levels form: %s", e)
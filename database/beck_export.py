@@ -0,0 +1,261 @@
+import os
+import sqlite3
+import tempfile
+import zipfile
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+import numpy as np
+
+import tracker_config as tkc
+from logger_setup import logger
+from beck_core.items import ITEM_NAMES
+
+# NULL or unparsable values come out of SQLite as this sentinel. It is the bit pattern
+# NumPy uses for NaT, so the date columns convert to datetime64 without a fix-up pass.
+_MISSING = np.iinfo(np.int64).min
+
+# Dates and times are parsed by SQLite so each chunk converts to NumPy in one call.
+_EXPORT_SQL = f"""
+    SELECT
+        id,
+        IFNULL(CAST(strftime('%s', beck_date) AS INTEGER) / 86400, {_MISSING}),
+        IFNULL(CAST(strftime('%s', '1970-01-01 ' || beck_time) AS INTEGER), {_MISSING}),
+        IFNULL(CAST(strftime('%s', beck_date || ' ' || beck_time) AS INTEGER), {_MISSING}),
+        {', '.join(f'IFNULL({name}, -1)' for name in ITEM_NAMES)},
+        IFNULL(beck_summary, -1)
+    FROM beck_table
+    ORDER BY id"""
+
+EXPORT_FORMATS = ('parquet', 'feather', 'npz')
+
+
+def connect_read_only(db_path: str) -> sqlite3.Connection:
+    """
+    Opens a read-only sqlite3 connection for streaming reads.
+
+    The stdlib driver is used instead of QtSql so exports run without a QApplication.
+    With the database in WAL mode the reader does not block the app's writes.
+
+    Args:
+        db_path (str): The path to the SQLite database file.
+
+    Returns:
+        sqlite3.Connection: The connection, in autocommit mode.
+    """
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, isolation_level=None)
+    connection.execute(f"PRAGMA mmap_size = {tkc.DB_PRAGMAS['mmap_size']}")
+    return connection
+
+
+def iter_beck_chunks(connection: sqlite3.Connection,
+                     chunk_size: int = tkc.EXPORT_CHUNK_SIZE) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Streams beck_table as column chunks of NumPy arrays.
+
+    Only one chunk is materialized at a time, so memory stays bounded by chunk_size
+    regardless of the table size.
+
+    Args:
+        connection (sqlite3.Connection): An open connection to the database.
+        chunk_size (int): The number of rows per chunk.
+
+    Yields:
+        Dict[str, np.ndarray]: 'id' (int64), 'beck_date' (days since epoch, int64),
+        'beck_time' (seconds since midnight, int64), 'beck_timestamp' (epoch seconds,
+        int64), 'items' ((n, 12) int8) and 'beck_summary' (int8). Missing dates and times
+        are the NaT sentinel and missing scores are -1.
+    """
+    cursor = connection.execute(_EXPORT_SQL)
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        block = np.array(rows, dtype=np.int64)
+        yield {
+            'id': block[:, 0],
+            'beck_date': block[:, 1],
+            'beck_time': block[:, 2],
+            'beck_timestamp': block[:, 3],
+            'items': block[:, 4:4 + len(ITEM_NAMES)].astype(np.int8),
+            'beck_summary': block[:, 4 + len(ITEM_NAMES)].astype(np.int8),
+        }
+
+
+def _require_pyarrow():
+    """
+    Imports pyarrow, which is only needed for the Parquet and Feather formats.
+    """
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError as e:
+        raise RuntimeError("Parquet and Feather export need pyarrow: pip install pyarrow") from e
+
+
+def _arrow_schema(pa):
+    """
+    Returns the Arrow schema of an exported beck_table.
+    """
+    return pa.schema(
+        [('id', pa.int64()),
+         ('beck_date', pa.date32()),
+         ('beck_time', pa.time32('s')),
+         *[(name, pa.int8()) for name in ITEM_NAMES],
+         ('beck_summary', pa.int8()),
+         ('beck_timestamp', pa.timestamp('s'))])
+
+
+def _arrow_batch(pa, schema, chunk: Dict[str, np.ndarray]):
+    """
+    Converts one column chunk to an Arrow record batch with proper nulls.
+    """
+    date_missing = chunk['beck_date'] == _MISSING
+    time_missing = chunk['beck_time'] == _MISSING
+    stamp_missing = chunk['beck_timestamp'] == _MISSING
+    items = chunk['items']
+    columns = [
+        pa.array(chunk['id'], type=pa.int64()),
+        pa.array(chunk['beck_date'].astype(np.int32), type=pa.date32(), mask=date_missing),
+        pa.array(chunk['beck_time'].astype(np.int32), type=pa.time32('s'), mask=time_missing),
+        *[pa.array(items[:, i], type=pa.int8(), mask=items[:, i] < 0)
+          for i in range(len(ITEM_NAMES))],
+        pa.array(chunk['beck_summary'], type=pa.int8(), mask=chunk['beck_summary'] < 0),
+        pa.array(chunk['beck_timestamp'], type=pa.timestamp('s'), mask=stamp_missing),
+    ]
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def write_arrow_file(chunks: Iterable[Dict[str, np.ndarray]], output_path: str, file_format: str,
+                     progress: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Writes column chunks in the layout of iter_beck_chunks to a Parquet or Feather
+    (Arrow IPC) file, one record batch per chunk.
+
+    Args:
+        chunks (Iterable[Dict[str, np.ndarray]]): The column chunks.
+        output_path (str): The file to write.
+        file_format (str): 'parquet' or 'feather'.
+        progress (Optional[Callable[[int], None]]): Called with the running row count
+            after every chunk.
+
+    Returns:
+        int: The number of rows written.
+
+    Raises:
+        RuntimeError: If pyarrow is not installed.
+    """
+    pa = _require_pyarrow()
+    schema = _arrow_schema(pa)
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(output_path, schema, compression='zstd')
+    else:
+        import pyarrow.ipc
+        writer = pa.ipc.new_file(output_path, schema,
+                                 options=pa.ipc.IpcWriteOptions(compression='zstd'))
+    written = 0
+    try:
+        for chunk in chunks:
+            batch = _arrow_batch(pa, schema, chunk)
+            if file_format == 'parquet':
+                writer.write_batch(batch)
+            else:
+                writer.write(batch)
+            written += batch.num_rows
+            if progress:
+                progress(written)
+    finally:
+        writer.close()
+    return written
+
+
+def _export_npz(connection: sqlite3.Connection, output_path: str, chunk_size: int,
+                progress: Optional[Callable[[int], None]]) -> int:
+    """
+    Streams beck_table into a NumPy .npz archive.
+
+    Each column is filled chunk by chunk into a memory-mapped .npy file on disk and the
+    files are then stored uncompressed in the archive, which is what np.load expects.
+    """
+    total = connection.execute("SELECT COUNT(*) FROM beck_table").fetchone()[0]
+    layouts = {
+        'id': (np.int64, (total,)),
+        'beck_date': ('datetime64[D]', (total,)),
+        'beck_time': ('timedelta64[s]', (total,)),
+        'beck_timestamp': ('datetime64[s]', (total,)),
+        'items': (np.int8, (total, len(ITEM_NAMES))),
+        'beck_summary': (np.int8, (total,)),
+    }
+    written = 0
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(output_path))) as tmp:
+        arrays = {name: np.lib.format.open_memmap(os.path.join(tmp, f"{name}.npy"), mode='w+',
+                                                  dtype=dtype, shape=shape)
+                  for name, (dtype, shape) in layouts.items()}
+        for chunk in iter_beck_chunks(connection, chunk_size):
+            end = min(written + len(chunk['id']), total)
+            size = end - written
+            for name, array in arrays.items():
+                target = array.view(np.int64) if array.dtype.kind in 'Mm' else array
+                target[written:end] = chunk[name][:size]
+            written = end
+            if progress:
+                progress(written)
+        for array in arrays.values():
+            array.flush()
+        del arrays
+        np.save(os.path.join(tmp, 'item_names.npy'), np.array(ITEM_NAMES))
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_STORED, allowZip64=True) as archive:
+            for name in (*layouts, 'item_names'):
+                archive.write(os.path.join(tmp, f"{name}.npy"), arcname=f"{name}.npy")
+    return written
+
+
+def export_beck_table(db_path: str,
+                      output_path: str,
+                      file_format: Optional[str] = None,
+                      chunk_size: int = tkc.EXPORT_CHUNK_SIZE,
+                      progress: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Exports beck_table to a columnar file with bounded memory.
+
+    The whole export reads from a single snapshot, so rows committed by the app while it
+    runs are not half included.
+
+    Args:
+        db_path (str): The path to the SQLite database file.
+        output_path (str): The file to write.
+        file_format (Optional[str]): 'parquet', 'feather' or 'npz'. Inferred from the
+            output file extension when omitted.
+        chunk_size (int): The number of rows read and written per chunk.
+        progress (Optional[Callable[[int], None]]): Called with the running row count
+            after every chunk.
+
+    Returns:
+        int: The number of rows exported.
+
+    Raises:
+        ValueError: If the format is unknown.
+        RuntimeError: If the format needs pyarrow and it is not installed.
+    """
+    if file_format is None:
+        file_format = os.path.splitext(output_path)[1].lstrip('.').lower()
+        file_format = {'arrow': 'feather', 'pq': 'parquet'}.get(file_format, file_format)
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{file_format}', expected one of {EXPORT_FORMATS}")
+
+    connection = connect_read_only(db_path)
+    try:
+        connection.execute("BEGIN")
+        if file_format == 'npz':
+            written = _export_npz(connection, output_path, chunk_size, progress)
+        else:
+            written = write_arrow_file(iter_beck_chunks(connection, chunk_size), output_path,
+                                       file_format, progress)
+        connection.execute("COMMIT")
+    except Exception as e:
+        logger.error("Error exporting beck_table to %s: %s", output_path, e, exc_info=True)
+        raise
+    finally:
+        connection.close()
+    logger.info("Exported %s rows from beck_table to %s", written, output_path)
+    return written
@@ -0,0 +1,250 @@
+import csv
+import json
+import os
+from datetime import date, time
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, Optional, Set, Tuple, Union
+
+import tracker_config as tkc
+from logger_setup import logger
+from beck_core.items import BECK_COLUMNS, ITEM_COUNT, ITEM_MAX, ITEM_MIN, ITEM_NAMES
+
+Row = Tuple[Union[str, int], ...]
+
+# Columns read from a file. beck_summary is always recomputed, so it is not read.
+RECORD_COLUMNS = BECK_COLUMNS[:2 + ITEM_COUNT]
+
+# Accepted spellings of each item value, so an item is validated by one dict lookup.
+_ITEM_VALUES: Dict[object, int] = {}
+for _value in range(ITEM_MIN, ITEM_MAX + 1):
+    _ITEM_VALUES[_value] = _value
+    _ITEM_VALUES[str(_value)] = _value
+
+IMPORT_FORMATS = ('csv', 'jsonl')
+
+
+class ImportStats:
+    """
+    Running counters of an import, passed to the progress callback.
+
+    Attributes:
+        read (int): Records read from the file.
+        valid (int): Records that passed validation and were not duplicates.
+        rejected (int): Records that failed validation.
+        duplicates (int): Records whose (beck_date, beck_time) was already stored or
+            appeared earlier in the file.
+        inserted (int): Rows committed to the database.
+
+    """
+    __slots__ = ('read', 'valid', 'rejected', 'duplicates', 'inserted')
+
+    def __init__(self) -> None:
+        self.read: int = 0
+        self.valid: int = 0
+        self.rejected: int = 0
+        self.duplicates: int = 0
+        self.inserted: int = 0
+
+    def __repr__(self) -> str:
+        return (f"ImportStats(read={self.read}, valid={self.valid}, rejected={self.rejected}, "
+                f"duplicates={self.duplicates}, inserted={self.inserted})")
+
+
+def iter_csv_records(path: str) -> Iterator[Tuple[int, Tuple[object, ...]]]:
+    """
+    Streams the records of a CSV file with a header row.
+
+    Columns are matched by header name, so their order and any extra columns do not
+    matter.
+
+    Args:
+        path (str): The CSV file.
+
+    Yields:
+        Tuple[int, Tuple[object, ...]]: The line number and the raw values in
+        RECORD_COLUMNS order. Rows whose field count differs from the header yield an
+        empty tuple, which validation rejects, since their values cannot be placed.
+
+    Raises:
+        ValueError: If the header lacks one of RECORD_COLUMNS.
+    """
+    with open(path, newline='', encoding='utf-8') as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return
+        positions = {name.strip(): i for i, name in enumerate(header)}
+        missing = [name for name in RECORD_COLUMNS if name not in positions]
+        if missing:
+            raise ValueError(f"{path} is missing columns: {', '.join(missing)}")
+        pick = itemgetter(*(positions[name] for name in RECORD_COLUMNS))
+        width = len(header)
+        for line_number, values in enumerate(reader, start=2):
+            yield line_number, pick(values) if len(values) == width else ()
+
+
+def iter_jsonl_records(path: str) -> Iterator[Tuple[int, Tuple[object, ...]]]:
+    """
+    Streams the records of a JSON Lines file, one object per line.
+
+    Args:
+        path (str): The JSONL file.
+
+    Yields:
+        Tuple[int, Tuple[object, ...]]: The line number and the raw values in
+        RECORD_COLUMNS order, None for missing keys. Lines that are not JSON objects
+        yield an empty tuple.
+    """
+    with open(path, encoding='utf-8') as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                yield line_number, ()
+                continue
+            if not isinstance(record, dict):
+                yield line_number, ()
+                continue
+            yield line_number, tuple(record.get(name) for name in RECORD_COLUMNS)
+
+
+@lru_cache(maxsize=1 << 17)
+def _valid_date(value: str) -> bool:
+    try:
+        return len(value) == 10 and bool(date.fromisoformat(value))
+    except (TypeError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=1 << 17)
+def _valid_time(value: str) -> bool:
+    try:
+        return len(value) == 8 and bool(time.fromisoformat(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def validate_record(values: Tuple[object, ...]) -> Row:
+    """
+    Validates one raw record and returns it as a beck_table row.
+
+    Dates must be yyyy-MM-dd and times hh:mm:ss, the formats add_beck_data writes. Every
+    item must be an int or a digit string in the 0..3 slider range; booleans are refused. beck_summary is recomputed from the items.
+    Date and time checks are memoized since a file repeats the same days and times.
+
+    Args:
+        values (Tuple[object, ...]): Raw values in RECORD_COLUMNS order.
+
+    Returns:
+        Row: The row in BECK_COLUMNS order.
+
+    Raises:
+        ValueError: If the record is invalid, with the reason as the message.
+    """
+    if len(values) != len(RECORD_COLUMNS):
+        raise ValueError("malformed record")
+    beck_date, beck_time = values[0], values[1]
+    if not isinstance(beck_date, str) or not _valid_date(beck_date):
+        raise ValueError("bad beck_date")
+    if not isinstance(beck_time, str) or not _valid_time(beck_time):
+        raise ValueError("bad beck_time")
+    raw_items = values[2:]
+    try:
+        items = tuple(map(_ITEM_VALUES.__getitem__, raw_items))
+    except (KeyError, TypeError):
+        items = ()
+    # JSON true and false hash equal to 1 and 0, so the lookup alone lets them through
+    if not items or bool in map(type, raw_items):
+        for name, raw in zip(ITEM_NAMES, raw_items):
+            if type(raw) is bool:
+                raise ValueError(f"{name} is not an integer")
+            try:
+                _ITEM_VALUES[raw]
+            except (KeyError, TypeError):
+                raise ValueError(f"{name} out of range") from None
+    return (beck_date, beck_time, *items, sum(items))
+
+
+def import_beck_file(path: str,
+                     insert_many: Callable[[Iterable[Row]], int],
+                     existing_keys: Optional[Set[Tuple[str, str]]] = None,
+                     file_format: Optional[str] = None,
+                     rejects_path: Optional[str] = None,
+                     progress: Optional[Callable[[ImportStats], None]] = None,
+                     progress_every: int = tkc.IMPORT_PROGRESS_EVERY) -> ImportStats:
+    """
+    Streams a CSV or JSONL file of assessments into the database.
+
+    Records are parsed and validated lazily and handed to insert_many as a generator, so
+    the file is never held in memory and the database sees large transactional batches.
+    Duplicates by (beck_date, beck_time) are skipped with an in-memory hash set seeded
+    from existing_keys. Invalid records are written to rejects_path with the reason.
+
+    Args:
+        path (str): The file to import.
+        insert_many (Callable[[Iterable[Row]], int]): Writes rows in BECK_COLUMNS order and
+            returns how many were committed, e.g. bulk_insert_beck_rows bound to a
+            connection or DataManager.insert_many_into_beck_table.
+        existing_keys (Optional[Set[Tuple[str, str]]]): Keys already stored. The set is
+            extended with the imported keys.
+        file_format (Optional[str]): 'csv' or 'jsonl'; inferred from the extension when
+            omitted.
+        rejects_path (Optional[str]): Where to write rejected records as CSV.
+        progress (Optional[Callable[[ImportStats], None]]): Called every progress_every
+            records and once at the end.
+        progress_every (int): The number of records between progress calls.
+
+    Returns:
+        ImportStats: The final counters.
+
+    Raises:
+        ValueError: If the format is unknown or a CSV header lacks required columns.
+    """
+    if file_format is None:
+        file_format = os.path.splitext(path)[1].lstrip('.').lower()
+        file_format = {'ndjson': 'jsonl', 'json': 'jsonl'}.get(file_format, file_format)
+    if file_format not in IMPORT_FORMATS:
+        raise ValueError(f"Unknown import format '{file_format}', expected one of {IMPORT_FORMATS}")
+    records = iter_csv_records(path) if file_format == 'csv' else iter_jsonl_records(path)
+    seen = existing_keys if existing_keys is not None else set()
+    stats = ImportStats()
+    rejects_file = open(rejects_path, 'w', newline='', encoding='utf-8') if rejects_path else None
+    rejects = csv.writer(rejects_file) if rejects_file else None
+    if rejects:
+        rejects.writerow(('line', 'reason', *RECORD_COLUMNS))
+
+    def valid_rows() -> Iterator[Row]:
+        for line_number, values in records:
+            stats.read += 1
+            if progress and stats.read % progress_every == 0:
+                progress(stats)
+            try:
+                row = validate_record(values)
+            except ValueError as e:
+                stats.rejected += 1
+                if rejects:
+                    rejects.writerow((line_number, str(e), *values))
+                continue
+            key = (row[0], row[1])
+            if key in seen:
+                stats.duplicates += 1
+                continue
+            seen.add(key)
+            stats.valid += 1
+            yield row
+
+    try:
+        stats.inserted = insert_many(valid_rows())
+    finally:
+        if rejects_file:
+            rejects_file.close()
+    if stats.inserted < stats.valid:
+        logger.error("Import of %s stopped early: %s of %s valid rows committed",
+                     path, stats.inserted, stats.valid)
+    if progress:
+        progress(stats)
+    logger.info("Imported %s: %s", path, stats)
+    return stats
@@ -0,0 +1,223 @@
+import os
+import sqlite3
+import time
+from itertools import islice
+from typing import Callable, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+import tracker_config as tkc
+from logger_setup import logger
+from beck_core.items import BECK_COLUMNS
+from database.database_utility.rollups import ROLLUP_TRIGGERS, rebuild_rollup_statements
+
+# beck_timestamp is concatenated from the bound date and time, NULL if either is, so the
+# rows are bound as they come instead of being copied with it appended
+_INSERT_SQL = (f"INSERT INTO beck_table({', '.join(BECK_COLUMNS)}, beck_timestamp) "
+               f"VALUES ({', '.join(f'?{i}' for i in range(1, len(BECK_COLUMNS) + 1))}, ?1 || 'T' || ?2)")
+
+# The indexes and triggers a deferred load dropped, recorded in the transaction that drops
+# them. Rows left here mean a load was killed before restoring them; repair_interrupted_load,
+# run before the app opens the database, and connect_for_bulk_load put them back and
+# rebuild the rollups.
+DEFERRED_TABLE = 'beck_deferred_ddl'
+CREATE_DEFERRED_TABLE = (f"CREATE TABLE IF NOT EXISTS {DEFERRED_TABLE} "
+                         f"(type TEXT NOT NULL, name TEXT PRIMARY KEY, sql TEXT NOT NULL)")
+
+
+def connect_for_bulk_load(db_path: str) -> sqlite3.Connection:
+    """
+    Opens a sqlite3 connection tuned with the DB_PRAGMAS profile for headless bulk loads.
+
+    QtSql binds and executes batches one value at a time through QVariant, which caps
+    inserts well below what SQLite can take. Batch jobs that write hundreds of thousands
+    of rows go through the stdlib driver instead. The schema must already exist; opening
+    the file once with DataManager creates and migrates it.
+
+    Args:
+        db_path (str): The path to the SQLite database file.
+
+    Returns:
+        sqlite3.Connection: The connection, with transactions controlled explicitly.
+
+    Raises:
+        RuntimeError: If the database has no beck_table.
+    """
+    connection = sqlite3.connect(db_path, isolation_level=None)
+    for name, value in tkc.DB_PRAGMAS.items():
+        connection.execute(f"PRAGMA {name} = {value}")
+    if connection.execute("SELECT 1 FROM sqlite_master WHERE type IN ('table', 'view') "
+                          "AND name = 'beck_table'").fetchone() is None:
+        connection.close()
+        raise RuntimeError(f"{db_path} has no beck_table; open it with DataManager first")
+    restore_deferred_schema(connection)
+    return connection
+
+
+def restore_deferred_schema(connection: sqlite3.Connection) -> bool:
+    """
+    Recreates the indexes and triggers a killed deferred load left dropped, and rebuilds
+    every rollup, since the rows loaded meanwhile are not known.
+
+    Args:
+        connection (sqlite3.Connection): A connection in autocommit mode.
+
+    Returns:
+        bool: True if anything was restored.
+    """
+    if connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                          (DEFERRED_TABLE,)).fetchone() is None:
+        return False
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        deferred = connection.execute(f"SELECT sql FROM {DEFERRED_TABLE}").fetchall()
+        for (sql,) in deferred:
+            connection.execute(sql)
+        if deferred:
+            for sql, binds in rebuild_rollup_statements():
+                connection.execute(sql, binds)
+        connection.execute(f"DROP TABLE {DEFERRED_TABLE}")
+        connection.execute("COMMIT")
+    except sqlite3.Error:
+        connection.execute("ROLLBACK")
+        raise
+    if deferred:
+        logger.warning("Restored %d indexes and triggers left dropped by an interrupted bulk load",
+                       len(deferred))
+    return bool(deferred)
+
+
+def repair_interrupted_load(db_path: str) -> bool:
+    """
+    Runs restore_deferred_schema on a database the process has no QtSql connection to.
+
+    Must run before QtSql opens the file: the stdlib driver links a different SQLite
+    library, and two in one process must never have the same file open at once.
+
+    Args:
+        db_path (str): The path to the SQLite database file. It need not exist.
+
+    Returns:
+        bool: True if anything was restored.
+    """
+    if not os.path.exists(db_path):
+        return False
+    connection = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        connection.execute(f"PRAGMA busy_timeout = {tkc.DB_PRAGMAS['busy_timeout']}")
+        return restore_deferred_schema(connection)
+    finally:
+        connection.close()
+
+
+def load_beck_keys(connection: sqlite3.Connection) -> Set[Tuple[str, str]]:
+    """
+    Returns the (beck_date, beck_time) pair of every stored row.
+
+    The pairs are read from the (beck_date, beck_time) index without visiting the rows.
+    A packed beck_table is a view, which takes no INDEXED BY; its rows are decoded from
+    beck_packed instead.
+
+    Args:
+        connection (sqlite3.Connection): An open connection.
+
+    Returns:
+        Set[Tuple[str, str]]: The stored keys.
+    """
+    packed = connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'view' "
+                                "AND name = 'beck_table'").fetchone() is not None
+    return set(connection.execute("SELECT beck_date, beck_time FROM beck_table" if packed else
+                                  "SELECT beck_date, beck_time FROM beck_table "
+                                  "INDEXED BY idx_beck_date_time"))
+
+
+def bulk_insert_beck_rows(connection: sqlite3.Connection,
+                          rows: Iterable[Sequence[Union[str, int]]],
+                          chunk_size: int = tkc.BULK_INSERT_CHUNK_SIZE,
+                          on_chunk: Optional[Callable[[int], None]] = None,
+                          defer_indexes: bool = False) -> int:
+    """
+    Inserts rows into the beck_table with executemany in chunked transactions.
+
+    Each chunk is committed on its own. If a chunk fails it is rolled back and loading
+    stops, so the returned count only includes committed rows.
+
+    With defer_indexes the secondary indexes of beck_table and the beck_rollup triggers
+    are dropped for the duration of the load. The indexes are rebuilt once at the end and
+    the rollups are recomputed with GROUP BY for the periods the loaded dates fall in,
+    which is several times cheaper than maintaining both row by row for large loads.
+    Both are restored even if loading fails, and if the process is killed mid-load they
+    are restored the next time the database is opened; see DEFERRED_TABLE.
+
+    Args:
+        connection (sqlite3.Connection): A connection from connect_for_bulk_load.
+        rows (Iterable[Sequence[Union[str, int]]]): Row tuples in BECK_COLUMNS order. May be
+            a generator; it is consumed one chunk at a time.
+        chunk_size (int): The number of rows per transaction.
+        on_chunk (Optional[Callable[[int], None]]): Called with the running count of
+            committed rows after every chunk.
+        defer_indexes (bool): Rebuild the secondary indexes after loading instead of
+            maintaining them during the load.
+
+    Returns:
+        int: The number of rows committed.
+    """
+    inserted = 0
+    started = time.perf_counter()
+    row_iter = iter(rows)
+    deferred: List[Tuple[str, str, str]] = []
+    first_date: Optional[str] = None
+    last_date: Optional[str] = None
+    if defer_indexes:
+        deferred = connection.execute(
+            f"SELECT type, name, sql FROM sqlite_master WHERE tbl_name = 'beck_table' "
+            f"AND sql IS NOT NULL AND (type = 'index' OR name IN "
+            f"({', '.join('?' * len(ROLLUP_TRIGGERS))}))", ROLLUP_TRIGGERS).fetchall()
+        connection.execute("BEGIN IMMEDIATE")
+        connection.execute(CREATE_DEFERRED_TABLE)
+        connection.executemany(f"INSERT OR REPLACE INTO {DEFERRED_TABLE}(type, name, sql) "
+                               f"VALUES (?, ?, ?)", deferred)
+        for kind, name, _ in deferred:
+            connection.execute(f"DROP {kind.upper()} {name}")
+        connection.execute("COMMIT")
+    try:
+        while True:
+            chunk: List[Sequence[Union[str, int]]] = list(islice(row_iter, chunk_size))
+            if not chunk:
+                break
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(_INSERT_SQL, chunk)
+                connection.execute("COMMIT")
+            except sqlite3.Error as e:
+                connection.execute("ROLLBACK")
+                logger.error("Error inserting chunk of %s rows: beck_table - %s", len(chunk), e)
+                break
+            inserted += len(chunk)
+            if deferred:
+                dates = [row[0] for row in chunk if row[0] is not None]
+                if dates:
+                    low, high = min(dates), max(dates)
+                    first_date = low if first_date is None else min(first_date, low)
+                    last_date = high if last_date is None else max(last_date, high)
+            if on_chunk:
+                on_chunk(inserted)
+    finally:
+        if connection.in_transaction:
+            # A non-sqlite3 error left the chunk's transaction open
+            connection.execute("ROLLBACK")
+        if defer_indexes:
+            # Restored, rolled up and unrecorded in one transaction, so a crash leaves
+            # either all of it or none of it to restore_deferred_schema
+            connection.execute("BEGIN IMMEDIATE")
+            for _, _, sql in deferred:
+                connection.execute(sql)
+            if first_date is not None:
+                for sql, binds in rebuild_rollup_statements(first_date, last_date):
+                    connection.execute(sql, binds)
+            connection.execute(f"DROP TABLE {DEFERRED_TABLE}")
+            connection.execute("COMMIT")
+        elapsed = time.perf_counter() - started
+        rate = inserted / elapsed if elapsed > 0 else 0.0
+        logger.info("Bulk load beck_table: %s rows in %.2fs (%.0f rows/sec)", inserted, elapsed, rate,
+                    extra={'operation': 'beck_table.bulk_load', 'duration_ms': round(elapsed * 1000, 3),
+                           'rows': inserted})
+    return inserted
@@ -1,9 +1,22 @@
 import tracker_config as tkc
 from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+import json
 import os
-import shutil
-from typing import List, Union
-from logger_setup import logger
+import time
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from logger_setup import log_timing, logger
+from beck_core.items import BECK_COLUMNS, ITEM_COUNT, SUMMARY_MAX
+from database.database_utility.beck_queries import (
+    BY_ID_SQL, LATEST_SQL, BeckRows, PreparedQueryCache, histogram_sql, range_sql)
+from database.database_utility.connection_tuning import apply_connection_pragmas
+from database.database_utility.migrations import SCHEMA_VERSION, apply_migrations, get_schema_version
+from database.database_utility.packed_storage import is_packed, set_packed_storage
+from database.database_utility.paged_model import read_rows
+from database.database_utility.rollups import rebuild_rollup_statements, trend_query
+from database.database_utility.undo_buffer import DeletedRows
+from utility.app_operations.perf_stats import perf_stats
 
 user_dir = os.path.expanduser('~')
 db_path = os.path.join(os.getcwd(), tkc.DB_NAME)  # Database Name
@@ -15,7 +28,8 @@ def initialize_database() -> None:
     Initializes the database by creating a new database file or copying an existing one.
 
     If the target database file doesn't exist, it checks if the source database file exists.
-    If the source database file exists, it copies it to the target location.
+    If the source database file exists, it copies it to the target location with SQLite's
+    online backup API, which gives a consistent copy even if the source is being written.
     If the source database file doesn't exist, it creates a new database file using the 'QSQLITE' driver.
 
     Returns:
@@ -27,49 +41,73 @@ def initialize_database() -> None:
     try:
         if not os.path.exists(target_db_path):
             if os.path.exists(db_path):
-                shutil.copy(db_path, target_db_path)
+                from database.backup import copy_database
+                copy_database(db_path, target_db_path)
             else:
                 db: QSqlDatabase = QSqlDatabase.addDatabase('QSQLITE')
                 db.setDatabaseName(target_db_path)
                 if not db.open():
                     logger.error("Error: Unable to create database")
+                else:
+                    apply_connection_pragmas(db)
                 db.close()
     except Exception as e:
-        logger.error("Error: Unable to create database", str(e))
+        logger.error("Error: Unable to create database: %s", e)
 
 
 class DataManager:
     
     def __init__(self,
-                 db_name: str = target_db_path) -> None:
+                 db_name: str = target_db_path,
+                 connection_name: Optional[str] = None,
+                 journal_path: Optional[str] = None) -> None:
         """
         Initializes the DataManager object and opens the database connection.
 
         Args:
             db_name (str): The path to the SQLite database file.
+            connection_name (Optional[str]): The QSqlDatabase connection name. The default
+                connection is used when omitted. A thread other than the GUI thread must
+                use its own named connection.
+            journal_path (Optional[str]): A commit journal whose records are replayed into
+                beck_table once the tables are set up. Only the connection opened first
+                should replay it.
 
         Raises:
             Exception: If there is an error opening the database.
 
         """
         try:
-            self.db: QSqlDatabase = QSqlDatabase.addDatabase('QSQLITE')
+            if connection_name is None:
+                self.db: QSqlDatabase = QSqlDatabase.addDatabase('QSQLITE')
+            else:
+                self.db: QSqlDatabase = QSqlDatabase.addDatabase('QSQLITE', connection_name)
             self.db.setDatabaseName(db_name)
             
             if not self.db.open():
                 logger.error("Error: Unable to open database")
             logger.info("DB INITIALIZING")
-            self.query: QSqlQuery = QSqlQuery()
+            apply_connection_pragmas(self.db)
+            self.query: QSqlQuery = QSqlQuery(self.db)
+            self.queries: PreparedQueryCache = PreparedQueryCache(self.db)
             self.setup_tables()
+            if journal_path is not None:
+                self.replay_journal(journal_path)
         except Exception as e:
-            logger.error(f"Error: Unable to open database {e}", exc_info=True)
+            logger.error("Error: Unable to open database %s", e, exc_info=True)
     
     def setup_tables(self) -> None:
         """
-        Sets up the necessary tables in the database.
+        Sets up the necessary tables in the database, applies pending schema migrations
+        and converts beck_table to the layout tkc.PACKED_STORAGE asks for.
 
         """
         self.setup_beck_table()
+        if is_packed(self.db) and get_schema_version(self.db) < SCHEMA_VERSION:
+            # Migrations are written against the plain table; it is packed again below
+            set_packed_storage(self.db, False)
+        apply_migrations(self.db)
+        set_packed_storage(self.db, tkc.PACKED_STORAGE)
     
     def setup_beck_table(self) -> None:
         """
@@ -115,9 +153,9 @@ class DataManager:
                         sleep INTEGER,
                         beck_summary INTEGER
                         )"""):
-            logger.error(f"Error creating table: beck_table",
-                         self.query.lastError().text())
+            logger.error("Error creating table: beck_table - %s", self.query.lastError().text())
     
+    @perf_stats.timed('insert_into_beck_table')
     def insert_into_beck_table(self,
                                beck_date: str,
                                beck_time: str,
@@ -177,7 +215,8 @@ class DataManager:
                         pessimism,
                         victimhood,
                         sleep,
-                        beck_summary) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+                        beck_summary,
+                        beck_timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
 
         bind_values: List[Union[str, int]] = [beck_date, beck_time, sadness, outlook,
                                               guilt,
@@ -188,7 +227,9 @@ class DataManager:
                                               effort,
                                               interest,
                                               pessimism,
-                                              victimhood, sleep, beck_summary]
+                                              victimhood, sleep, beck_summary,
+                                              None if beck_date is None or beck_time is None
+                                              else f"{beck_date}T{beck_time}"]
         try:
             self.query.prepare(sql)
             for value in bind_values:
@@ -198,11 +239,382 @@ class DataManager:
                     bind values, got {len(bind_values)}.""")
             if not self.query.exec():
                 logger.error(
-                    f"Error inserting data: beck_table - {self.query.lastError().text()}")
+                    "Error inserting data: beck_table - %s", self.query.lastError().text())
         except ValueError as e:
-            logger.error(f"ValueError beck_table: {e}")
+            logger.error("ValueError beck_table: %s", e)
         except Exception as e:
-            logger.error(f"Error during data insertion: beck_table {e}", exc_info=True)
+            logger.error("Error during data insertion: beck_table %s", e, exc_info=True)
+    
+    @perf_stats.timed('insert_many_into_beck_table')
+    def insert_many_into_beck_table(self,
+                                    rows: Iterable[Sequence[Union[str, int]]],
+                                    chunk_size: int = tkc.BULK_INSERT_CHUNK_SIZE) -> int:
+        """
+        Inserts many rows into the beck_table in chunked transactions.
+
+        The INSERT statement is prepared once and each chunk is bound column-wise and
+        executed with QSqlQuery.execBatch inside its own transaction. If a chunk fails it is
+        rolled back and the import stops, so every row reported as inserted is committed.
+
+        Args:
+            rows (Iterable[Sequence[Union[str, int]]]): Row tuples in BECK_COLUMNS order. May be
+                a generator; it is consumed one chunk at a time.
+            chunk_size (int): The number of rows per transaction.
+
+        Returns:
+            int: The number of rows committed.
+        """
+        # beck_timestamp is bound with the row, since no trigger fills it in on insert
+        sql: str = (f"INSERT INTO beck_table({', '.join(BECK_COLUMNS)}, beck_timestamp) "
+                    f"VALUES ({', '.join('?' * (len(BECK_COLUMNS) + 1))})")
+        query: QSqlQuery = QSqlQuery(self.db)
+        if not query.prepare(sql):
+            logger.error("Error preparing bulk insert: beck_table - %s", query.lastError().text())
+            return 0
+        
+        inserted: int = 0
+        row_iter = iter(rows)
+        started: float = time.perf_counter()
+        try:
+            while True:
+                chunk: List[Sequence[Union[str, int]]] = list(islice(row_iter, chunk_size))
+                if not chunk:
+                    break
+                if any(len(row) != len(BECK_COLUMNS) for row in chunk):
+                    raise ValueError(f"Mismatch: beck_table Expected {len(BECK_COLUMNS)} "
+                                     f"values per row.")
+                columns: List[List[Union[str, int]]] = [list(column) for column in zip(*chunk)]
+                columns.append([None if beck_date is None or beck_time is None
+                                else f"{beck_date}T{beck_time}"
+                                for beck_date, beck_time in zip(columns[0], columns[1])])
+                if not self._exec_beck_chunk(query, columns):
+                    break
+                inserted += len(chunk)
+        except ValueError as e:
+            logger.error("ValueError beck_table: %s", e)
+        except Exception as e:
+            logger.error("Error during bulk insertion: beck_table %s", e, exc_info=True)
+        elapsed: float = time.perf_counter() - started
+        rate: float = inserted / elapsed if elapsed > 0 else 0.0
+        logger.info("Batch insert beck_table: %s rows in %.2fs (%.0f rows/sec)", inserted, elapsed, rate,
+                    extra={'operation': 'beck_table.insert_many', 'duration_ms': round(elapsed * 1000, 3),
+                           'rows': inserted})
+        return inserted
+    
+    def replay_journal(self, journal_path: str) -> int:
+        """
+        Inserts the rows of a commit journal that are not in beck_table yet, then empties
+        the journal.
+
+        The journal holds commits that had not been written when the app last stopped.
+        Rows already stored were written just before the journal was trimmed and are
+        skipped. Rows are matched on every column, and each stored row accounts for one
+        journal copy, so separate commits made in the same second are all kept. Rows that
+        fail to insert stay in the journal for the next replay.
+
+        Args:
+            journal_path (str): The journal file.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+        from database.journal import encode_record, read_journal
+        rows = read_journal(journal_path)
+        if not rows and not os.path.exists(journal_path):
+            return 0
+        query: QSqlQuery = QSqlQuery(self.db)
+        query.prepare(f"SELECT COUNT(*) FROM beck_table WHERE "
+                      f"{' AND '.join(f'{name} = ?' for name in BECK_COLUMNS)}")
+        # Stored copies of each distinct row not yet matched to a journal record
+        unmatched: Dict[Tuple[Union[str, int], ...], int] = {}
+        missing = []
+        for row in rows:
+            row = tuple(row)
+            if row not in unmatched:
+                for value in row:
+                    query.addBindValue(value)
+                if not query.exec() or not query.next():
+                    logger.error("Error checking journal row: beck_table - %s", query.lastError().text())
+                    return 0
+                unmatched[row] = query.value(0)
+                query.finish()
+            if unmatched[row]:
+                unmatched[row] -= 1
+            else:
+                missing.append(row)
+        inserted = self.insert_many_into_beck_table(missing) if missing else 0
+        # Rewritten rather than truncated, which also drops a record torn by a crash
+        partial_path = journal_path + '.partial'
+        with open(partial_path, 'wb') as handle:
+            handle.write(b''.join(encode_record(row) for row in missing[inserted:]))
+        os.replace(partial_path, journal_path)
+        if rows:
+            logger.info("Replayed %d of %d journal rows into beck_table", inserted, len(rows))
+        return inserted
+    
+    def delete_from_beck_table(self, ids: Sequence[int]) -> Optional[DeletedRows]:
+        """
+        Deletes rows from the beck_table by primary key as one set-based statement.
+
+        The ids are bound in one batch into a temporary table. The rows are copied out
+        for undo and deleted with a single join against that table, all in one
+        transaction.
+
+        Args:
+            ids (Sequence[int]): The ids of the rows to delete.
+
+        Returns:
+            Optional[DeletedRows]: The deleted rows, or None if the transaction was rolled
+            back.
+        """
+        deleted = DeletedRows()
+        if not ids:
+            return deleted
+        with log_timing('beck_table.delete', rows=len(ids)):
+            columns: str = ', '.join(('id', *BECK_COLUMNS))
+            query: QSqlQuery = QSqlQuery(self.db)
+            if not self.db.transaction():
+                logger.error("Error starting transaction: beck_table - %s", self.db.lastError().text())
+                return None
+            try:
+                if not query.exec("CREATE TEMP TABLE IF NOT EXISTS beck_delete_ids "
+                                  "(id INTEGER PRIMARY KEY)") \
+                        or not query.exec("DELETE FROM temp.beck_delete_ids"):
+                    raise RuntimeError(query.lastError().text())
+                query.prepare("INSERT OR IGNORE INTO temp.beck_delete_ids(id) VALUES (?)")
+                query.addBindValue(list(ids))
+                if not query.execBatch():
+                    raise RuntimeError(query.lastError().text())
+                query.setForwardOnly(True)
+                if not query.exec(f"SELECT {columns} FROM beck_table "
+                                  f"WHERE id IN (SELECT id FROM temp.beck_delete_ids)"):
+                    raise RuntimeError(query.lastError().text())
+                for row in read_rows(query, len(BECK_COLUMNS) + 1):
+                    deleted.append(row)
+                if not query.exec("DELETE FROM beck_table "
+                                  "WHERE id IN (SELECT id FROM temp.beck_delete_ids)") \
+                        or not self.db.commit():
+                    raise RuntimeError(query.lastError().text() or self.db.lastError().text())
+            except RuntimeError as e:
+                logger.error("Error deleting %s rows: beck_table - %s", len(ids), e)
+                self.db.rollback()
+                return None
+            return deleted
+    
+    def restore_beck_rows(self, deleted: DeletedRows) -> int:
+        """
+        Re-inserts rows removed by delete_from_beck_table under their original ids.
+
+        Args:
+            deleted (DeletedRows): The rows to restore.
+
+        Returns:
+            int: The number of rows restored, 0 if the transaction was rolled back.
+        """
+        if not len(deleted):
+            return 0
+        with log_timing('beck_table.restore', rows=len(deleted)):
+            columns = ('id', *BECK_COLUMNS, 'beck_timestamp')
+            query: QSqlQuery = QSqlQuery(self.db)
+            if not self.db.transaction():
+                logger.error("Error starting transaction: beck_table - %s", self.db.lastError().text())
+                return 0
+            query.prepare(f"INSERT INTO beck_table({', '.join(columns)}) "
+                          f"VALUES ({', '.join('?' * len(columns))})")
+            rows = list(deleted.rows())
+            for column in zip(*rows):
+                query.addBindValue(list(column))
+            query.addBindValue([None if row[1] is None or row[2] is None else f"{row[1]}T{row[2]}"
+                                for row in rows])
+            if not query.execBatch() or not self.db.commit():
+                logger.error("Error restoring %s rows: beck_table - %s", len(deleted),
+                             query.lastError().text())
+                self.db.rollback()
+                return 0
+            return len(deleted)
+    
+    def rebuild_rollups(self, first_date: Optional[str] = None,
+                        last_date: Optional[str] = None) -> bool:
+        """
+        Recomputes the beck_rollup aggregates from beck_table in one transaction.
+
+        The rollups are kept current by triggers, so this is only needed after writes made
+        with the triggers disabled, or to repair them.
+
+        Args:
+            first_date (Optional[str]): Restrict the rebuild to periods from this date on.
+            last_date (Optional[str]): Restrict the rebuild to periods up to this date.
+
+        Returns:
+            bool: True if the rebuild was committed.
+        """
+        with log_timing('beck_rollup.rebuild', first_date=first_date, last_date=last_date):
+            if not self.db.transaction():
+                logger.error("Error starting transaction: beck_rollup - %s", self.db.lastError().text())
+                return False
+            query: QSqlQuery = QSqlQuery(self.db)
+            for sql, binds in rebuild_rollup_statements(first_date, last_date):
+                query.prepare(sql)
+                for value in binds:
+                    query.addBindValue(value)
+                if not query.exec():
+                    logger.error("Error rebuilding rollups: beck_rollup - %s", query.lastError().text())
+                    self.db.rollback()
+                    return False
+            return self.db.commit()
+    
+    def snapshot_into(self, path: str) -> bool:
+        """
+        Writes a consistent copy of the database to a new file with VACUUM INTO.
+
+        The copy is made by SQLite on this connection, so it is safe while the app's other
+        connections are open, and other connections keep writing meanwhile in WAL mode.
+
+        Args:
+            path (str): The file to write; it must not exist yet.
+
+        Returns:
+            bool: True if the copy was written.
+        """
+        with log_timing('database.snapshot', path=path):
+            query: QSqlQuery = QSqlQuery(self.db)
+            query.prepare("VACUUM INTO ?")
+            query.addBindValue(path)
+            if not query.exec():
+                logger.error("Error writing database snapshot: %s - %s", path, query.lastError().text())
+                return False
+            return True
+
+    def beck_trend(self, granularity: str = 'day', start: Optional[str] = None,
+                   end: Optional[str] = None) -> List[tuple]:
+        """
+        Returns the beck_summary and item trend per day, week or month.
+
+        The series is read from the beck_rollup table, one row per period.
+
+        Args:
+            granularity (str): 'day', 'week' or 'month'.
+            start (Optional[str]): The first period_start to include, yyyy-MM-dd.
+            end (Optional[str]): The last period_start to include, yyyy-MM-dd.
+
+        Returns:
+            List[tuple]: Rows of period_start, row_count, the mean, minimum and maximum
+            beck_summary and the mean of each item.
+        """
+        with log_timing('beck_rollup.trend', granularity=granularity):
+            sql, binds = trend_query(granularity, start, end)
+            query: QSqlQuery = QSqlQuery(self.db)
+            query.setForwardOnly(True)
+            query.prepare(sql)
+            for value in binds:
+                query.addBindValue(value)
+            if not query.exec():
+                logger.error("Error reading trend: beck_rollup - %s", query.lastError().text())
+                return []
+            return read_rows(query, 5 + ITEM_COUNT)
+    
+    def close(self) -> None:
+        """
+        Finishes and drops the cached queries and closes the connection.
+
+        No QSqlQuery of this DataManager is left on the connection afterwards, so the
+        caller can remove it with QSqlDatabase.removeDatabase.
+        """
+        self.queries.close()
+        self.query = None
+        self.db.close()
+        self.db = QSqlDatabase()
+
+    @perf_stats.timed('query.latest')
+    def latest_becks(self, count: int) -> BeckRows:
+        """
+        Returns the most recent assessments by beck_date and beck_time.
+
+        Args:
+            count (int): The number of rows.
+
+        Returns:
+            BeckRows: Up to count rows, oldest first.
+        """
+        rows = self.queries.run(LATEST_SQL, (count,), 4) or []
+        return BeckRows(rows[::-1])
+
+    @perf_stats.timed('query.range')
+    def becks_between(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> BeckRows:
+        """
+        Returns the assessments dated within a range.
+
+        Args:
+            date_from (Optional[str]): The first beck_date, yyyy-MM-dd; open if None.
+            date_to (Optional[str]): The last beck_date, yyyy-MM-dd; open if None.
+
+        Returns:
+            BeckRows: The rows, oldest first.
+        """
+        sql, binds = range_sql(date_from, date_to)
+        return BeckRows(self.queries.run(sql, binds, 4) or [])
+
+    @perf_stats.timed('query.by_id')
+    def becks_by_id(self, ids: Sequence[int]) -> BeckRows:
+        """
+        Returns the assessments with the given ids.
+
+        Args:
+            ids (Sequence[int]): Row ids; ones that don't exist are left out.
+
+        Returns:
+            BeckRows: The rows, in id order.
+        """
+        if not len(ids):
+            return BeckRows([])
+        rows = self.queries.run(BY_ID_SQL, (json.dumps([int(id_) for id_ in ids]),), 4)
+        return BeckRows(rows or [])
+
+    @perf_stats.timed('query.histogram')
+    def summary_histogram(self, date_from: Optional[str] = None,
+                          date_to: Optional[str] = None) -> np.ndarray:
+        """
+        Counts the assessments per beck_summary score, optionally within a date range.
+
+        Args:
+            date_from (Optional[str]): The first beck_date, yyyy-MM-dd; open if None.
+            date_to (Optional[str]): The last beck_date, yyyy-MM-dd; open if None.
+
+        Returns:
+            np.ndarray: int64 counts indexed by score, 0..SUMMARY_MAX. Rows without a
+            score in that range are not counted.
+        """
+        sql, binds = histogram_sql(date_from, date_to)
+        counts = np.zeros(SUMMARY_MAX + 1, dtype=np.int64)
+        for score, count in self.queries.run(sql, binds, 2) or []:
+            if 0 <= score <= SUMMARY_MAX:
+                counts[score] = count
+        return counts
+
+    def _exec_beck_chunk(self,
+                         query: QSqlQuery,
+                         columns: List[List[Union[str, int]]]) -> bool:
+        """
+        Executes one column-bound chunk of the bulk insert inside a transaction.
+
+        Args:
+            query (QSqlQuery): The prepared INSERT query.
+            columns (List[List[Union[str, int]]]): One value list per column.
+
+        Returns:
+            bool: True if the chunk was committed, False if it was rolled back.
+        """
+        if not self.db.transaction():
+            logger.error("Error starting transaction: beck_table - %s", self.db.lastError().text())
+            return False
+        for column in columns:
+            query.addBindValue(column)
+        if not query.execBatch() or not self.db.commit():
+            logger.error("Error inserting chunk of %s rows: beck_table - %s", len(columns[0]),
+                         query.lastError().text())
+            self.db.rollback()
+            return False
+        return True
 
 
 def close_database(self) -> None:
@@ -225,4 +637,4 @@ def close_database(self) -> None:
             logger.info("the database is closed successfully")
             self.db.close()
     except Exception as e:
-        logger.exception(f"Error closing database: {e}")
+        logger.exception("Error closing database: %s", e)
@@ -0,0 +1,39 @@
+from typing import Any, List, Optional, Tuple
+
+from beck_core.items import SUMMARY_MAX
+
+
+def beck_filter_clause(date_from: Optional[str] = None,
+                       date_to: Optional[str] = None,
+                       min_score: int = 0,
+                       max_score: int = SUMMARY_MAX) -> Tuple[str, List[Any]]:
+    """
+    Turns the data view filters into a parameterized WHERE clause on beck_table.
+
+    Columns are compared bare, so the date range is served by idx_beck_date_time and the
+    score range by idx_beck_summary. Filters that don't narrow anything are left out; with
+    no filters at all the clause is empty.
+
+    Args:
+        date_from (Optional[str]): The first beck_date shown, yyyy-MM-dd, or None.
+        date_to (Optional[str]): The last beck_date shown, yyyy-MM-dd, or None.
+        min_score (int): The lowest beck_summary shown.
+        max_score (int): The highest beck_summary shown.
+
+    Returns:
+        Tuple[str, List[Any]]: The clause without WHERE and its bind values.
+    """
+    conditions: List[str] = []
+    binds: List[Any] = []
+    if date_from is not None:
+        conditions.append("beck_date >= ?")
+        binds.append(date_from)
+    if date_to is not None:
+        conditions.append("beck_date <= ?")
+        binds.append(date_to)
+    if min_score > 0 or max_score < SUMMARY_MAX:
+        # Both bounds, even if one is open: SQLite guesses a one-sided comparison matches
+        # most rows and scans the table in id order instead of using the index
+        conditions.append("beck_summary BETWEEN ? AND ?")
+        binds.extend((min_score, max_score))
+    return " AND ".join(conditions), binds
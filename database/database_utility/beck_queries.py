@@ -0,0 +1,164 @@
+from collections import OrderedDict
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+import tracker_config as tkc
+from logger_setup import logger
+from beck_core.items import ITEM_MAX, ITEM_MIN, ITEM_NAMES
+from beck_core.packing import PACK_SQL, unpack_items
+from database.database_utility.beck_filter import beck_filter_clause
+
+# A missing date or time comes out as the NaT bit pattern, as in the exports
+_MISSING = np.iinfo(np.int64).min
+
+# Four values per row instead of sixteen: every QSqlQuery.value call crosses into Qt, so
+# the items are packed in SQL and unpacked by NumPy. Rows whose items can't be packed
+# come out as -1 and are unpacked as all -1.
+_ROW_COLUMNS = f"""
+    id,
+    IFNULL(CAST(strftime('%s', beck_date || ' ' || beck_time) AS INTEGER), {_MISSING}),
+    IFNULL(beck_summary, -1),
+    IFNULL(CASE WHEN {' OR '.join(f'{name} NOT BETWEEN {ITEM_MIN} AND {ITEM_MAX}' for name in ITEM_NAMES)}
+                THEN -1 ELSE {PACK_SQL.format(row='')} END, -1)"""
+_ROW_WIDTH = 4
+
+LATEST_SQL = (f"SELECT {_ROW_COLUMNS} FROM beck_table "
+              f"ORDER BY beck_date DESC, beck_time DESC, id DESC LIMIT ?")
+# The ids are bound as one JSON array, so every call shares one prepared statement
+BY_ID_SQL = f"SELECT {_ROW_COLUMNS} FROM beck_table WHERE id IN (SELECT value FROM json_each(?)) ORDER BY id"
+
+
+class BeckRows:
+    """
+    beck_table rows as column arrays.
+
+    Attributes:
+        ids (np.ndarray): int64 row ids.
+        timestamps (np.ndarray): int64 epoch seconds; .astype('datetime64[s]') gives
+            datetimes, missing ones as NaT.
+        summaries (np.ndarray): int16 beck_summary, -1 where missing.
+        items (np.ndarray): (N, 12) int8 items in ITEM_NAMES order, all -1 for a row with
+            a missing or out-of-range item.
+
+    """
+    __slots__ = ('ids', 'timestamps', 'summaries', 'items')
+
+    def __init__(self, rows: List[Tuple[Any, ...]]) -> None:
+        block = np.array(rows, dtype=np.int64).reshape(-1, _ROW_WIDTH)
+        self.ids: np.ndarray = block[:, 0]
+        self.timestamps: np.ndarray = block[:, 1]
+        self.summaries: np.ndarray = block[:, 2].astype(np.int16)
+        self.items: np.ndarray = unpack_items(block[:, 3])
+        self.items[block[:, 3] < 0] = -1
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class PreparedQueryCache:
+    """
+    An LRU of prepared, forward-only QSqlQuery objects of one connection, keyed by SQL.
+
+    Preparing parses and plans the statement; a cached query skips that and is only
+    rebound and executed. SQLite re-prepares a cached statement by itself when the schema
+    changes, e.g. when beck_table is packed.
+
+    Attributes:
+        db (QSqlDatabase): The connection the queries are prepared on.
+        size (int): The number of queries kept.
+
+    """
+
+    def __init__(self, db: QSqlDatabase, size: int = tkc.QUERY_CACHE_SIZE) -> None:
+        self.db: QSqlDatabase = db
+        self.size: int = size
+        self._queries: 'OrderedDict[str, QSqlQuery]' = OrderedDict()
+
+    def get(self, sql: str) -> Optional[QSqlQuery]:
+        """
+        Returns the prepared query of a statement, preparing it on a miss.
+
+        Args:
+            sql (str): The statement.
+
+        Returns:
+            Optional[QSqlQuery]: The query, or None if it doesn't prepare.
+        """
+        query = self._queries.get(sql)
+        if query is not None:
+            self._queries.move_to_end(sql)
+            return query
+        query = QSqlQuery(self.db)
+        query.setForwardOnly(True)
+        if not query.prepare(sql):
+            logger.error("Error preparing query: %s - %s", sql, query.lastError().text())
+            return None
+        self._queries[sql] = query
+        while len(self._queries) > self.size:
+            self._queries.popitem(last=False)[1].finish()
+        return query
+
+    def run(self, sql: str, binds: Sequence[Any], width: int) -> Optional[List[Tuple[Any, ...]]]:
+        """
+        Executes a cached query and reads all of its rows.
+
+        The query is finished afterwards, so it holds no read snapshot open between calls;
+        an open one would keep WAL checkpoints from completing.
+
+        Args:
+            sql (str): The statement.
+            binds (Sequence[Any]): Its positional bind values.
+            width (int): The number of columns to read; NULLs must be mapped in SQL.
+
+        Returns:
+            Optional[List[Tuple[Any, ...]]]: The rows, or None if the query failed.
+        """
+        query = self.get(sql)
+        if query is None:
+            return None
+        for position, value in enumerate(binds):
+            query.bindValue(position, value)
+        if not query.exec():
+            logger.error("Error running query: %s - %s", sql, query.lastError().text())
+            return None
+        value = query.value
+        rows = []
+        while query.next():
+            rows.append(tuple(value(i) for i in range(width)))
+        query.finish()
+        return rows
+
+    def clear(self) -> None:
+        for query in self._queries.values():
+            query.finish()
+        self._queries.clear()
+
+    def close(self) -> None:
+        """
+        Drops every query and the connection handle, so the connection can be removed
+        with QSqlDatabase.removeDatabase without being reported as still in use.
+        """
+        self.clear()
+        self.db = QSqlDatabase()
+
+
+def range_sql(date_from: Optional[str], date_to: Optional[str]) -> Tuple[str, List[Any]]:
+    """
+    Builds the SELECT of the rows between two dates, oldest first.
+    """
+    where, binds = beck_filter_clause(date_from, date_to)
+    return (f"SELECT {_ROW_COLUMNS} FROM beck_table {f'WHERE {where} ' if where else ''}"
+            f"ORDER BY beck_date, beck_time, id"), binds
+
+
+def histogram_sql(date_from: Optional[str], date_to: Optional[str]) -> Tuple[str, List[Any]]:
+    """
+    Builds the SELECT of the row count per beck_summary between two dates.
+
+    Without dates it is answered from idx_beck_summary alone.
+    """
+    where, binds = beck_filter_clause(date_from, date_to)
+    return (f"SELECT IFNULL(beck_summary, -1), COUNT(*) FROM beck_table "
+            f"{f'WHERE {where} ' if where else ''}GROUP BY beck_summary"), binds
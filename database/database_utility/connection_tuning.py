@@ -0,0 +1,43 @@
+import logging
+from typing import Any, Dict, Mapping
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+import tracker_config as tkc
+from logger_setup import logger
+
+# The settings line is diagnostic but should reach the log under the default LOG_LEVEL
+settings_logger = logger.getChild('connection')
+settings_logger.setLevel(tkc.DB_SETTINGS_LOG_LEVEL)
+
+
+def apply_connection_pragmas(db: QSqlDatabase,
+                             pragmas: Mapping[str, Any] = tkc.DB_PRAGMAS) -> Dict[str, Any]:
+    """
+    Applies the SQLite performance profile to an open connection.
+
+    Most of these pragmas are per-connection, so this has to run every time a
+    connection is opened. journal_mode=WAL is persistent in the database file but is
+    re-asserted anyway so a database created by an older build is converted.
+
+    Args:
+        db (QSqlDatabase): An open QSQLITE connection.
+        pragmas (Mapping[str, Any]): Pragma names mapped to the values to set.
+
+    Returns:
+        Dict[str, Any]: The effective value of each pragma as reported by SQLite.
+    """
+    query = QSqlQuery(db)
+    effective: Dict[str, Any] = {}
+    for name, value in pragmas.items():
+        if not query.exec(f"PRAGMA {name} = {value}"):
+            logger.error("Error setting PRAGMA %s=%s: %s", name, value, query.lastError().text())
+            continue
+        query.finish()
+        if query.exec(f"PRAGMA {name}") and query.next():
+            effective[name] = query.value(0)
+        query.finish()
+    if settings_logger.isEnabledFor(logging.INFO):
+        settings_logger.info("SQLite connection '%s' settings: %s", db.connectionName(),
+                             ", ".join(f"{name}={value}" for name, value in effective.items()))
+    return effective
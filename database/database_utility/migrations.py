@@ -0,0 +1,93 @@
+from typing import List, Tuple
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from logger_setup import logger
+from database.database_utility.rollups import (CREATE_ROLLUP_TABLE, rebuild_rollup_statements,
+                                               rollup_trigger_statements)
+
+# Each migration is (version, description, statements). Versions are stored in
+# PRAGMA user_version and must be strictly increasing; never edit a released migration,
+# append a new one instead.
+MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+    (1, "beck_table: combined ISO timestamp column and lookup indexes", [
+        "ALTER TABLE beck_table ADD COLUMN beck_timestamp TEXT",
+        """UPDATE beck_table
+           SET beck_timestamp = beck_date || 'T' || beck_time
+           WHERE beck_date IS NOT NULL AND beck_time IS NOT NULL""",
+        "CREATE INDEX IF NOT EXISTS idx_beck_date_time ON beck_table(beck_date, beck_time)",
+        "CREATE INDEX IF NOT EXISTS idx_beck_summary ON beck_table(beck_summary)",
+        "CREATE INDEX IF NOT EXISTS idx_beck_timestamp ON beck_table(beck_timestamp)",
+        # Inserts bind beck_timestamp themselves; only edits of the date or time recompute it
+        """CREATE TRIGGER IF NOT EXISTS beck_table_timestamp_update
+           AFTER UPDATE OF beck_date, beck_time ON beck_table
+           BEGIN
+               UPDATE beck_table
+               SET beck_timestamp = NEW.beck_date || 'T' || NEW.beck_time
+               WHERE id = NEW.id;
+           END""",
+    ]),
+    (2, "beck_rollup: day, week and month aggregates maintained by triggers", [
+        CREATE_ROLLUP_TABLE,
+        *(sql for sql, _ in rebuild_rollup_statements()),
+        *rollup_trigger_statements(),
+    ]),
+]
+
+SCHEMA_VERSION: int = MIGRATIONS[-1][0]
+
+
+def get_schema_version(db: QSqlDatabase) -> int:
+    """
+    Reads the schema version stored in PRAGMA user_version.
+
+    Args:
+        db (QSqlDatabase): An open database connection.
+
+    Returns:
+        int: The current schema version, 0 for a database that was never migrated.
+    """
+    query = QSqlQuery(db)
+    if query.exec("PRAGMA user_version") and query.next():
+        return int(query.value(0))
+    logger.error("Error reading schema version: %s", query.lastError().text())
+    return 0
+
+
+def apply_migrations(db: QSqlDatabase) -> int:
+    """
+    Brings the database schema up to SCHEMA_VERSION.
+
+    All pending migrations and the user_version bump run inside one transaction, so a
+    failure leaves the database exactly at its previous version and large backfills are
+    committed with a single journal flush.
+
+    Args:
+        db (QSqlDatabase): An open database connection.
+
+    Returns:
+        int: The schema version after the call.
+    """
+    current = get_schema_version(db)
+    pending = [migration for migration in MIGRATIONS if migration[0] > current]
+    if not pending:
+        return current
+
+    if not db.transaction():
+        logger.error("Error starting migration transaction: %s", db.lastError().text())
+        return current
+    query = QSqlQuery(db)
+    for version, description, statements in pending:
+        for statement in statements:
+            if not query.exec(statement):
+                logger.error("Error applying migration %s (%s): %s", version, description,
+                             query.lastError().text())
+                db.rollback()
+                return current
+        logger.info("Applied migration %s: %s", version, description)
+    target = pending[-1][0]
+    if not query.exec(f"PRAGMA user_version = {int(target)}") or not db.commit():
+        logger.error("Error committing migrations: %s", db.lastError().text())
+        db.rollback()
+        return current
+    return target
@@ -1,6 +1,7 @@
 from PyQt6 import QtSql
 from PyQt6.QtWidgets import QAbstractItemView
 from logger_setup import logger
+from database.database_utility.paged_model import PagedSqlTableModel
 
 
 def create_and_set_model(table_name: str, view_widget: QAbstractItemView) -> QtSql.QSqlTableModel:
@@ -28,3 +29,31 @@ def create_and_set_model(table_name: str, view_widget: QAbstractItemView) -> QtS
 
     view_widget.setModel(model)
     return model
+
+
+def create_and_set_paged_model(table_name: str, view_widget: QAbstractItemView) -> PagedSqlTableModel:
+    """
+    Creates and sets up a PagedSqlTableModel for the specified table name and view widget.
+
+    Unlike create_and_set_model, only the first page of rows is loaded; the view pulls
+    further pages through fetchMore as it scrolls and sorting is done by SQL.
+
+    Args:
+        table_name (str): The name of the table to create the model for.
+        view_widget (QAbstractItemView): The view widget to set the model on.
+
+    Returns:
+        PagedSqlTableModel: The created PagedSqlTableModel.
+
+    Raises:
+        RuntimeError: If there is an error selecting data from the table.
+    """
+    model = PagedSqlTableModel(table_name)
+
+    if not model.select():
+        error_message = f"Error selecting data from table: {table_name}, {model.lastError().text()}"
+        logger.error(error_message)
+        raise RuntimeError(error_message)
+
+    view_widget.setModel(model)
+    return model
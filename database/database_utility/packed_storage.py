@@ -0,0 +1,195 @@
+from typing import List
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from logger_setup import log_timing, logger
+from beck_core.items import ITEM_MAX, ITEM_MIN, ITEM_NAMES
+from beck_core.packing import PACK_SQL, PACKED_MAX, UNPACK_SQL
+from database.database_utility.rollups import rollup_row_statements
+
+# The packed rows: epoch seconds in UTC, as the journal stores them, and the items of
+# beck_core.packing. beck_table becomes a view over it with the original columns.
+CREATE_PACKED_TABLE = f"""
+    CREATE TABLE beck_packed (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ts INTEGER NOT NULL,
+        items INTEGER NOT NULL CHECK (items BETWEEN 0 AND {PACKED_MAX})
+    )"""
+
+# The date filter, the duplicate check of imports and the rollup repairs look rows up by
+# date. The expressions are those of the view, so SQLite matches them through it.
+CREATE_PACKED_INDEX = ("CREATE INDEX idx_beck_packed_date ON beck_packed"
+                       "(date(ts, 'unixepoch'), time(ts, 'unixepoch'))")
+
+_ITEM_COLUMNS = {name: UNPACK_SQL[name].format(column='items') for name in ITEM_NAMES}
+
+_PACKED_ROWS = f"""
+    SELECT id,
+           date(ts, 'unixepoch') AS beck_date,
+           time(ts, 'unixepoch') AS beck_time,
+           {', '.join(f'{sql} AS {name}' for name, sql in _ITEM_COLUMNS.items())},
+           ({' + '.join(_ITEM_COLUMNS.values())}) AS beck_summary,
+           strftime('%Y-%m-%dT%H:%M:%S', ts, 'unixepoch') AS beck_timestamp
+    FROM beck_packed"""
+CREATE_PACKED_VIEW = f"CREATE VIEW beck_table AS {_PACKED_ROWS}"
+
+_ROW_TS = "CAST(strftime('%s', {row}beck_date || ' ' || {row}beck_time) AS INTEGER)"
+_NEW_SUMMARY = f"({' + '.join(f'NEW.{name}' for name in ITEM_NAMES)})"
+# True for a row with an item that is NULL or outside what two bits hold
+_BAD_ITEMS = ' OR '.join(f"IFNULL({{row}}{name} NOT BETWEEN {ITEM_MIN} AND {ITEM_MAX}, 1)"
+                         for name in ITEM_NAMES)
+_CHECK_NEW_ITEMS = (f"SELECT RAISE(ABORT, 'beck_table items must lie in {ITEM_MIN}..{ITEM_MAX}') "
+                    f"WHERE {_BAD_ITEMS.format(row='NEW.')};")
+
+# Layout of the plain beck_table, saved while the database is packed so it can be unpacked
+_LAYOUT_TABLE = 'beck_plain_layout'
+
+
+def _packed_trigger_statements() -> List[str]:
+    """
+    Returns the INSTEAD OF triggers that make the beck_table view writable.
+
+    The summary a caller writes is ignored, since the packed layout derives it from the
+    items. The rollup statements of the plain table's triggers are run in the same
+    triggers, after the write, which is when the AFTER triggers of the plain table run.
+    """
+    add, remove = rollup_row_statements()
+    add = add.replace('NEW.beck_summary', _NEW_SUMMARY)
+    return [
+        f"""CREATE TRIGGER beck_packed_insert
+            INSTEAD OF INSERT ON beck_table
+            BEGIN
+                {_CHECK_NEW_ITEMS}
+                INSERT INTO beck_packed(id, ts, items)
+                VALUES (NEW.id, {_ROW_TS.format(row='NEW.')}, {PACK_SQL.format(row='NEW.')});
+                {add}
+            END""",
+        f"""CREATE TRIGGER beck_packed_update
+            INSTEAD OF UPDATE ON beck_table
+            BEGIN
+                {_CHECK_NEW_ITEMS}
+                UPDATE beck_packed
+                SET id = NEW.id, ts = {_ROW_TS.format(row='NEW.')}, items = {PACK_SQL.format(row='NEW.')}
+                WHERE id = OLD.id;
+                {remove}
+                {add}
+            END""",
+        f"""CREATE TRIGGER beck_packed_delete
+            INSTEAD OF DELETE ON beck_table
+            BEGIN
+                DELETE FROM beck_packed WHERE id = OLD.id;
+                {remove}
+            END""",
+    ]
+
+
+def is_packed(db: QSqlDatabase) -> bool:
+    """
+    Tells whether beck_table is stored packed, i.e. is the view over beck_packed.
+
+    Args:
+        db (QSqlDatabase): An open database connection.
+
+    Returns:
+        bool: True for the packed layout.
+    """
+    query = QSqlQuery(db)
+    if query.exec("SELECT type FROM sqlite_master WHERE name = 'beck_table'") and query.next():
+        return query.value(0) == 'view'
+    return False
+
+
+def _pack_statements() -> List[str]:
+    return [
+        f"CREATE TABLE {_LAYOUT_TABLE} AS SELECT type, name, sql FROM sqlite_master "
+        f"WHERE tbl_name = 'beck_table' AND sql IS NOT NULL",
+        CREATE_PACKED_TABLE,
+        f"""INSERT INTO beck_packed(id, ts, items)
+            SELECT id, {_ROW_TS.format(row='')}, {PACK_SQL.format(row='')}
+            FROM beck_table ORDER BY id""",
+        "DELETE FROM sqlite_sequence WHERE name = 'beck_packed'",
+        "INSERT INTO sqlite_sequence(name, seq) "
+        "SELECT 'beck_packed', seq FROM sqlite_sequence WHERE name = 'beck_table'",
+        "DROP TABLE beck_table",
+        CREATE_PACKED_INDEX,
+        CREATE_PACKED_VIEW,
+        *_packed_trigger_statements(),
+    ]
+
+
+def _unpack_statements(db: QSqlDatabase) -> List[str]:
+    query = QSqlQuery(db)
+    query.setForwardOnly(True)
+    if not query.exec(f"SELECT type, sql FROM {_LAYOUT_TABLE}"):
+        raise RuntimeError(query.lastError().text())
+    layout = {'table': [], 'index': [], 'trigger': []}
+    while query.next():
+        layout[query.value(0)].append(query.value(1))
+    if len(layout['table']) != 1:
+        raise RuntimeError(f"{_LAYOUT_TABLE} holds no beck_table layout")
+    columns = ['id', 'beck_date', 'beck_time', *ITEM_NAMES, 'beck_summary', 'beck_timestamp']
+    # The view is dropped first, which takes its triggers with it. The saved indexes and
+    # triggers are only created after the copy, so the copied rows aren't rolled up twice.
+    return [
+        "DROP VIEW beck_table",
+        layout['table'][0],
+        f"""INSERT INTO beck_table({', '.join(columns)})
+            SELECT {', '.join(columns)} FROM ({_PACKED_ROWS}) ORDER BY id""",
+        "DELETE FROM sqlite_sequence WHERE name = 'beck_table'",
+        "INSERT INTO sqlite_sequence(name, seq) "
+        "SELECT 'beck_table', seq FROM sqlite_sequence WHERE name = 'beck_packed'",
+        "DROP TABLE beck_packed",
+        *layout['index'],
+        *layout['trigger'],
+        f"DROP TABLE {_LAYOUT_TABLE}",
+    ]
+
+
+def set_packed_storage(db: QSqlDatabase, packed: bool) -> bool:
+    """
+    Converts beck_table to the packed or the plain layout, in one transaction.
+
+    Packed, the rows live in beck_packed with 2 bits per item and an epoch-seconds
+    timestamp, and beck_table is a view with the original columns whose INSTEAD OF
+    triggers pack writes and keep beck_rollup current. Everything that reads or writes
+    beck_table, the data view model included, works on either layout.
+
+    Only rows with a date, a time and all twelve items in 0..3 can be packed; a database
+    holding others stays plain. Times are kept to the second.
+
+    Args:
+        db (QSqlDatabase): An open database connection, migrated to SCHEMA_VERSION.
+        packed (bool): The layout wanted.
+
+    Returns:
+        bool: True if beck_table has the wanted layout after the call.
+    """
+    if is_packed(db) == packed:
+        return True
+    query = QSqlQuery(db)
+    if packed:
+        unpackable = (f"SELECT COUNT(*) FROM beck_table "
+                      f"WHERE beck_date IS NULL OR beck_time IS NULL OR {_BAD_ITEMS.format(row='')}")
+        if not query.exec(unpackable) or not query.next():
+            logger.error("Error checking rows to pack: beck_table - %s", query.lastError().text())
+            return False
+        if int(query.value(0)):
+            logger.error("beck_table has %s rows that can't be packed; it stays unpacked",
+                         query.value(0))
+            return False
+    with log_timing('beck_table.pack' if packed else 'beck_table.unpack'):
+        if not db.transaction():
+            logger.error("Error starting transaction: beck_table - %s", db.lastError().text())
+            return False
+        try:
+            for sql in (_pack_statements() if packed else _unpack_statements(db)):
+                if not query.exec(sql):
+                    raise RuntimeError(query.lastError().text())
+            if not db.commit():
+                raise RuntimeError(db.lastError().text())
+        except RuntimeError as e:
+            logger.error("Error converting beck_table layout: %s", e)
+            db.rollback()
+            return False
+    logger.info("beck_table converted to the %s layout", 'packed' if packed else 'plain')
+    return True
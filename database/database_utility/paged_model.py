@@ -0,0 +1,597 @@
+from collections import OrderedDict
+from typing import Any, Iterable, List, Optional, Tuple
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtSql import QSqlDatabase, QSqlError, QSqlQuery
+
+import tracker_config as tkc
+from logger_setup import logger
+from utility.app_operations.perf_stats import perf_stats
+
+
+# Ids bound per DELETE ... IN statement, well below SQLite's host parameter limit.
+DELETE_CHUNK_SIZE = 500
+
+
+def row_ranges(rows: List[int]) -> List[Tuple[int, int]]:
+    """
+    Groups sorted row positions into inclusive (first, last) runs of consecutive rows.
+
+    Args:
+        rows (List[int]): Sorted, distinct row positions.
+
+    Returns:
+        List[Tuple[int, int]]: The runs in ascending order.
+    """
+    ranges: List[Tuple[int, int]] = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1] = (ranges[-1][0], row)
+        else:
+            ranges.append((row, row))
+    return ranges
+
+
+def read_rows(query: QSqlQuery, width: int) -> List[Tuple[Any, ...]]:
+    """
+    Reads every remaining row of an executed query into tuples.
+
+    QSqlQuery.value returns '' for NULL, so NULLs are mapped to None explicitly; the
+    keyset pagination relies on telling them apart.
+
+    Args:
+        query (QSqlQuery): An executed SELECT.
+        width (int): The number of columns to read.
+
+    Returns:
+        List[Tuple[Any, ...]]: The rows.
+    """
+    rows: List[Tuple[Any, ...]] = []
+    while query.next():
+        rows.append(tuple(None if query.isNull(i) else query.value(i) for i in range(width)))
+    return rows
+
+
+class PagedSqlTableModel(QAbstractTableModel):
+    """
+    A read-mostly table model that loads an SQLite table in pages instead of all at once.
+
+    Rows are appended through canFetchMore/fetchMore using keyset pagination on
+    (sort column, id), so each page is an indexed range scan rather than an OFFSET walk.
+    Only the row ids of fetched rows are kept for the whole table; the row data itself
+    lives in an LRU of pages and evicted pages are reloaded by id when scrolled back into
+    view. Sorting is pushed down to SQL ORDER BY and filters set with set_filter to SQL
+    WHERE, so both are served by indexes instead of scanning rows in Python.
+
+    The first pages of the most recent filter and sort combinations are kept, so switching
+    back to one of them resets the model at once without a query. They are dropped by
+    select() and by any write through the model.
+
+    The model keeps the small part of the QSqlTableModel API the app relies on
+    (select, lastError, removeRow(s), submitAll), so it can be swapped in for it.
+
+    Attributes:
+        table_name (str): The table the model reads from.
+        page_size (int): The number of rows fetched per page.
+        cache_pages (int): The number of pages kept in memory.
+        filter_cache (int): The number of first pages of recent filters and sorts kept.
+
+    """
+
+    def __init__(self,
+                 table_name: str,
+                 page_size: int = tkc.MODEL_PAGE_SIZE,
+                 cache_pages: int = tkc.MODEL_CACHE_PAGES,
+                 filter_cache: int = tkc.MODEL_FILTER_CACHE,
+                 db: Optional[QSqlDatabase] = None) -> None:
+        super().__init__()
+        self.table_name: str = table_name
+        self.page_size: int = page_size
+        self.cache_pages: int = cache_pages
+        self.filter_cache: int = filter_cache
+        self._db: QSqlDatabase = db if db is not None else QSqlDatabase.database()
+        self._last_error: QSqlError = QSqlError()
+        self._columns: List[str] = []
+        self._column_types: List[str] = []
+        self._ids: List[int] = []
+        self._pages: "OrderedDict[int, List[Tuple[Any, ...]]]" = OrderedDict()
+        self._last_key: Optional[Tuple[Any, int]] = None
+        self._exhausted: bool = True
+        self._sort_column: int = 0
+        self._sort_order: Qt.SortOrder = Qt.SortOrder.AscendingOrder
+        self._filter: str = ''
+        self._filter_binds: List[Any] = []
+        self._first_pages: "OrderedDict[Tuple[Any, ...], List[Tuple[Any, ...]]]" = OrderedDict()
+        self._requested: Optional[Tuple[Any, ...]] = None
+        # The sort and filter of the rows shown or of the select in flight
+        self._selected: Optional[Tuple[Any, ...]] = None
+        self._worker: Optional[Any] = None
+        self._generation: int = 0
+        # A worker select is in flight; the loaded rows and _last_key belong to the old sort
+        self._select_pending: bool = False
+        self._load_columns()
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # QSqlTableModel compatible API
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def select(self) -> bool:
+        """
+        Discards all loaded rows and fetches the first page with the current sort order
+        and filter.
+
+        With a DatabaseWorker attached the query runs on the worker thread, behind any
+        writes queued before it. The current rows stay visible until the new first page
+        arrives, and no further pages are fetched for them meanwhile.
+
+        Returns:
+            bool: True if the first page was loaded or the refresh was queued.
+        """
+        self._first_pages.clear()
+        return self._refresh()
+
+    def set_filter(self, where: str, binds: Iterable[Any] = ()) -> bool:
+        """
+        Restricts the model to the rows matching an SQL condition and reloads it.
+
+        Args:
+            where (str): A condition on the table's columns with ? placeholders, or '' to
+                show every row.
+            binds (Iterable[Any]): The values of the placeholders.
+
+        Returns:
+            bool: True if the first page was loaded or the refresh was queued.
+        """
+        binds = list(binds)
+        if where == self._filter and binds == self._filter_binds:
+            return True
+        self._filter = where
+        self._filter_binds = binds
+        return self._refresh()
+
+    def attach_worker(self, worker: Any) -> None:
+        """
+        Routes refreshes and deletes through a DatabaseWorker instead of the GUI thread.
+
+        Args:
+            worker (DatabaseWorker): A started database worker.
+        """
+        self._worker = worker
+        worker.selected.connect(self._on_worker_selected)
+
+    def lastError(self) -> QSqlError:
+        """
+        Returns the last database error encountered by the model.
+
+        Returns:
+            QSqlError: The last error.
+        """
+        return self._last_error
+
+    def submitAll(self) -> bool:
+        """
+        Kept for QSqlTableModel compatibility; edits and deletes are written immediately.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def fieldIndex(self, field_name: str) -> int:
+        """
+        Returns the column index of a field, or -1 if the table has no such field.
+
+        Args:
+            field_name (str): The column name.
+
+        Returns:
+            int: The column index.
+        """
+        return self._columns.index(field_name) if field_name in self._columns else -1
+
+    def row_id(self, row: int) -> int:
+        """
+        Returns the primary key of the row at the given position.
+
+        Args:
+            row (int): The row position in the model.
+
+        Returns:
+            int: The id of the row.
+        """
+        return self._ids[row]
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # QAbstractTableModel overrides
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole,
+                                               Qt.ItemDataRole.EditRole):
+            return None
+        row: Optional[Tuple[Any, ...]] = self._row(index.row())
+        return None if row is None else row[index.column()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._columns[section] if section < len(self._columns) else None
+        return section + 1
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags: Qt.ItemFlag = super().flags(index)
+        if index.isValid() and self._columns[index.column()] != 'id':
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        """
+        Writes an edited cell straight to the database and updates the cached row.
+
+        Args:
+            index (QModelIndex): The edited cell.
+            value (Any): The new value.
+            role (int): The item data role.
+
+        Returns:
+            bool: True if the update succeeded.
+        """
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        column: str = self._columns[index.column()]
+        query: QSqlQuery = QSqlQuery(self._db)
+        query.prepare(f"UPDATE {self.table_name} SET {column} = ? WHERE id = ?")
+        query.addBindValue(value)
+        query.addBindValue(self._ids[index.row()])
+        if not query.exec():
+            self._set_error(query, "updating")
+            return False
+        self._first_pages.clear()
+        page: Optional[List[Tuple[Any, ...]]] = self._pages.get(index.row() // self.page_size)
+        if page is not None:
+            offset: int = index.row() % self.page_size
+            row: List[Any] = list(page[offset])
+            row[index.column()] = value
+            page[offset] = tuple(row)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        """
+        Deletes the given rows from the database and removes them from the model.
+
+        Args:
+            row (int): The first row to remove.
+            count (int): The number of rows to remove.
+            parent (QModelIndex): Unused; the model is flat.
+
+        Returns:
+            bool: True if the rows were deleted.
+        """
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self._ids):
+            return False
+        return self.remove_rows(range(row, row + count))
+
+    def remove_rows(self, rows: Iterable[int]) -> bool:
+        """
+        Deletes any set of rows with one set-based delete and removes them in place.
+
+        The ids are sent to the worker as one delete, or deleted here in a single
+        transaction when no worker is attached. Each contiguous run of rows is then removed
+        from the model with its own beginRemoveRows, from the bottom up, so views keep
+        their scroll position and the model is not re-selected. Every removal costs the
+        view a pass over its rows, so past MODEL_REMOVE_RESET_RUNS runs the loaded rows
+        are dropped under one model reset instead. Cached pages before the first removed
+        row are still valid and are kept.
+
+        Args:
+            rows (Iterable[int]): The row positions to remove, in any order.
+
+        Returns:
+            bool: True if the rows were deleted.
+        """
+        positions: List[int] = sorted({row for row in rows if 0 <= row < len(self._ids)})
+        if not positions:
+            return False
+        ids: List[int] = [self._ids[row] for row in positions]
+        if self._worker is not None:
+            self._worker.submit_delete(ids)
+        elif not self._delete_ids(ids):
+            return False
+        self._first_pages.clear()
+        runs: List[Tuple[int, int]] = row_ranges(positions)
+        if len(runs) > tkc.MODEL_REMOVE_RESET_RUNS:
+            self.beginResetModel()
+            for first, last in reversed(runs):
+                del self._ids[first:last + 1]
+            self.endResetModel()
+        else:
+            for first, last in reversed(runs):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                del self._ids[first:last + 1]
+                self.endRemoveRows()
+        first_stale: int = positions[0] // self.page_size
+        for page_number in [number for number in self._pages if number >= first_stale]:
+            del self._pages[page_number]
+        return True
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted and not self._select_pending
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if self.canFetchMore(parent):
+            self._fetch_page()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """
+        Re-sorts the model by pushing the ORDER BY down to SQL and reloading the first page.
+
+        QTableView.sortByColumn calls this twice per header click; a call for the sort
+        already shown or being selected does nothing.
+
+        Args:
+            column (int): The column to sort by.
+            order (Qt.SortOrder): The sort direction.
+        """
+        if not 0 <= column < len(self._columns):
+            return
+        if self._selected == (column, order, self._filter, tuple(self._filter_binds)):
+            return
+        self._sort_column = column
+        self._sort_order = order
+        self._refresh()
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # Paging internals
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def _load_columns(self) -> None:
+        """
+        Reads the column names and declared types of the table.
+        """
+        query: QSqlQuery = QSqlQuery(self._db)
+        if not query.exec(f"PRAGMA table_info({self.table_name})"):
+            self._set_error(query, "reading columns of")
+            return
+        while query.next():
+            self._columns.append(query.value(1))
+            self._column_types.append(str(query.value(2)).upper())
+
+    @perf_stats.timed('model.select')
+    def _refresh(self) -> bool:
+        """
+        Resets the model to the first page of the current sort and filter, from the
+        first-page cache when it has them.
+        """
+        key: Tuple[Any, ...] = self._select_key()
+        cached: Optional[List[Tuple[Any, ...]]] = self._first_pages.get(key)
+        if cached is not None:
+            self._first_pages.move_to_end(key)
+            self._generation += 1  # a select still in flight is stale now
+            self._select_pending = False
+            self._selected = key
+            self._reset_with(cached)
+            return True
+        sql, binds = self._page_query(None)
+        if self._worker is not None:
+            self._generation += 1
+            self._select_pending = True
+            self._requested = key
+            self._selected = key
+            self._worker.submit_select(self._worker_key(), self._generation, sql, binds,
+                                       len(self._columns))
+            return True
+        rows: Optional[List[Tuple[Any, ...]]] = self._run(sql, binds, "selecting from")
+        if rows is None:
+            return False
+        self._remember_first_page(key, rows)
+        self._selected = key
+        self._reset_with(rows)
+        return True
+
+    def _select_key(self) -> Tuple[Any, ...]:
+        return (self._sort_column, self._sort_order, self._filter, tuple(self._filter_binds))
+
+    def _remember_first_page(self, key: Tuple[Any, ...], rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Keeps the first page of a sort and filter, evicting the least recently used one.
+        """
+        self._first_pages[key] = rows
+        self._first_pages.move_to_end(key)
+        while len(self._first_pages) > self.filter_cache:
+            self._first_pages.popitem(last=False)
+
+    def _keyset_clause(self, after: Tuple[Any, int], descending: bool) -> Tuple[str, List[Any]]:
+        """
+        Returns the WHERE clause and binds that continue after the last loaded row.
+
+        SQLite sorts NULLs first in ascending order, and row-value comparisons with NULL are
+        never true, so NULL sort values get their own branch. The sort column is compared
+        bare so an index on it can serve the range scan.
+        """
+        column: str = self._columns[self._sort_column]
+        value, last_id = after
+        if column == 'id':
+            return f"id {'<' if descending else '>'} ?", [last_id]
+        if descending:
+            if value is None:
+                return f"{column} IS NULL AND id < ?", [last_id]
+            return f"({column}, id) < (?, ?) OR {column} IS NULL", [value, last_id]
+        if value is None:
+            return f"({column} IS NULL AND id > ?) OR {column} IS NOT NULL", [last_id]
+        return f"({column}, id) > (?, ?)", [value, last_id]
+
+    def _page_query(self, after: Optional[Tuple[Any, int]]) -> Tuple[str, List[Any]]:
+        """
+        Builds the SELECT for the page that follows the given key, or the first page.
+        """
+        column: str = self._columns[self._sort_column]
+        descending: bool = self._sort_order == Qt.SortOrder.DescendingOrder
+        direction: str = 'DESC' if descending else 'ASC'
+
+        sql: str = f"SELECT {', '.join(self._columns)} FROM {self.table_name}"
+        conditions: List[str] = []
+        binds: List[Any] = []
+        if self._filter:
+            conditions.append(f"({self._filter})")
+            binds.extend(self._filter_binds)
+        if after is not None:
+            clause, keyset_binds = self._keyset_clause(after, descending)
+            conditions.append(f"({clause})")
+            binds.extend(keyset_binds)
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        sql += f" ORDER BY {column} {direction}"
+        if column != 'id':
+            sql += f", id {direction}"
+        sql += " LIMIT ?"
+        binds.append(self.page_size)
+        return sql, binds
+
+    def _fetch_page(self) -> bool:
+        """
+        Fetches the next page after the last loaded key and appends it to the model.
+
+        Returns:
+            bool: True if the query succeeded.
+        """
+        sql, binds = self._page_query(self._last_key)
+        rows: Optional[List[Tuple[Any, ...]]] = self._run(sql, binds, "fetching page from")
+        if rows is None:
+            self._exhausted = True
+            return False
+        if len(rows) < self.page_size:
+            self._exhausted = True
+        if rows:
+            first: int = len(self._ids)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._store_rows(rows)
+            self.endInsertRows()
+        return True
+
+    def _reset_with(self, rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Replaces everything loaded with a freshly selected first page.
+        """
+        self.beginResetModel()
+        self._ids = []
+        self._pages.clear()
+        self._last_key = None
+        self._exhausted = len(rows) < self.page_size
+        if rows:
+            self._store_rows(rows)
+        self.endResetModel()
+
+    def _store_rows(self, rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Appends fetched rows to the id list and page cache and advances the keyset.
+        """
+        id_column: int = self._columns.index('id')
+        first: int = len(self._ids)
+        self._ids.extend(row[id_column] for row in rows)
+        if first % self.page_size == 0:
+            self._cache_page(first // self.page_size, rows)
+        self._last_key = (rows[-1][self._sort_column], rows[-1][id_column])
+
+    def _worker_key(self) -> str:
+        return f"{self.table_name}:{id(self)}"
+
+    def _on_worker_selected(self, key: str, token: int, rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Applies a first page selected by the worker unless a newer select is pending.
+        """
+        if key == self._worker_key() and token == self._generation:
+            self._select_pending = False
+            if self._requested is not None:
+                self._remember_first_page(self._requested, rows)
+            self._reset_with(rows)
+
+    def _row(self, row: int) -> Optional[Tuple[Any, ...]]:
+        """
+        Returns a row, reloading its page by id if it has been evicted from the cache.
+        """
+        if not 0 <= row < len(self._ids):
+            return None
+        page_number: int = row // self.page_size
+        page: Optional[List[Tuple[Any, ...]]] = self._pages.get(page_number)
+        if page is None:
+            page = self._load_page(page_number)
+            if page is None:
+                return None
+        else:
+            self._pages.move_to_end(page_number)
+        offset: int = row % self.page_size
+        return page[offset] if offset < len(page) else None
+
+    def _load_page(self, page_number: int) -> Optional[List[Tuple[Any, ...]]]:
+        """
+        Loads one page of already-fetched rows by primary key and caches it.
+        """
+        ids: List[int] = self._ids[page_number * self.page_size:(page_number + 1) * self.page_size]
+        sql: str = (f"SELECT {', '.join(self._columns)} FROM {self.table_name} "
+                    f"WHERE id IN ({', '.join('?' * len(ids))})")
+        rows: Optional[List[Tuple[Any, ...]]] = self._run(sql, ids, "reloading page from")
+        if rows is None:
+            return None
+        id_column: int = self._columns.index('id')
+        by_id = {row[id_column]: row for row in rows}
+        empty: Tuple[Any, ...] = (None,) * len(self._columns)
+        page: List[Tuple[Any, ...]] = [by_id.get(row_id, empty) for row_id in ids]
+        self._cache_page(page_number, page)
+        return page
+
+    def _delete_ids(self, ids: List[int]) -> bool:
+        """
+        Deletes rows by id on the model's own connection in one transaction.
+        """
+        query: QSqlQuery = QSqlQuery(self._db)
+        if not self._db.transaction():
+            self._last_error = self._db.lastError()
+            logger.error("Error starting transaction: %s - %s", self.table_name, self._last_error.text())
+            return False
+        for start in range(0, len(ids), DELETE_CHUNK_SIZE):
+            chunk: List[int] = ids[start:start + DELETE_CHUNK_SIZE]
+            query.prepare(f"DELETE FROM {self.table_name} "
+                          f"WHERE id IN ({', '.join('?' * len(chunk))})")
+            for row_id in chunk:
+                query.addBindValue(row_id)
+            if not query.exec():
+                self._set_error(query, "deleting from")
+                self._db.rollback()
+                return False
+        return self._db.commit()
+
+    def _cache_page(self, page_number: int, rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Stores a page in the LRU, evicting the least recently used page when full.
+        """
+        self._pages[page_number] = list(rows)
+        self._pages.move_to_end(page_number)
+        while len(self._pages) > self.cache_pages:
+            self._pages.popitem(last=False)
+
+    def _run(self, sql: str, binds: List[Any], action: str) -> Optional[List[Tuple[Any, ...]]]:
+        """
+        Executes a forward-only SELECT and returns its rows, or None on error.
+        """
+        query: QSqlQuery = QSqlQuery(self._db)
+        query.setForwardOnly(True)
+        query.prepare(sql)
+        for value in binds:
+            query.addBindValue(value)
+        if not query.exec():
+            self._set_error(query, action)
+            return None
+        return read_rows(query, len(self._columns))
+
+    def _set_error(self, query: QSqlQuery, action: str) -> None:
+        """
+        Records and logs a failed query.
+        """
+        self._last_error = query.lastError()
+        logger.error("Error %s table: %s, %s", action, self.table_name, self._last_error.text())
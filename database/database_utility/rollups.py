@@ -0,0 +1,223 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from beck_core.items import ITEM_NAMES
+
+# The first day of the period a beck_date falls in. Weeks start on Monday.
+PERIOD_STARTS: Dict[str, str] = {
+    'day': "{date}",
+    'week': "date({date}, 'weekday 0', '-6 days')",
+    'month': "strftime('%Y-%m-01', {date})",
+}
+
+# Half-open beck_date range of a period, so recomputing a bound is an index range scan.
+_PERIOD_ENDS: Dict[str, str] = {
+    'day': "date({start}, '+1 day')",
+    'week': "date({start}, '+7 days')",
+    'month': "date({start}, '+1 month')",
+}
+
+GRANULARITIES: Tuple[str, ...] = tuple(PERIOD_STARTS)
+
+_ITEM_SUMS: List[str] = [f"{name}_sum" for name in ITEM_NAMES]
+
+_ROLLUP_COLUMNS: str = ', '.join(('granularity', 'period_start', 'row_count', 'summary_sum',
+                                  'summary_min', 'summary_max', *_ITEM_SUMS))
+
+CREATE_ROLLUP_TABLE: str = f"""
+    CREATE TABLE IF NOT EXISTS beck_rollup (
+        granularity TEXT NOT NULL,
+        period_start TEXT NOT NULL,
+        row_count INTEGER NOT NULL,
+        summary_sum INTEGER NOT NULL,
+        summary_min INTEGER,
+        summary_max INTEGER,
+        {', '.join(f'{column} INTEGER NOT NULL' for column in _ITEM_SUMS)},
+        PRIMARY KEY (granularity, period_start)
+    ) WITHOUT ROWID"""
+
+
+def _add_row_statement(granularity: str) -> str:
+    """
+    Returns the UPSERT that folds the NEW row of a trigger into its period.
+    """
+    start = PERIOD_STARTS[granularity].format(date='NEW.beck_date')
+    return f"""
+        INSERT INTO beck_rollup ({_ROLLUP_COLUMNS})
+        VALUES ('{granularity}', {start}, 1, IFNULL(NEW.beck_summary, 0),
+                NEW.beck_summary, NEW.beck_summary,
+                {', '.join(f'IFNULL(NEW.{name}, 0)' for name in ITEM_NAMES)})
+        ON CONFLICT (granularity, period_start) DO UPDATE SET
+            row_count = row_count + 1,
+            summary_sum = summary_sum + excluded.summary_sum,
+            summary_min = IFNULL(MIN(summary_min, excluded.summary_min),
+                                 IFNULL(summary_min, excluded.summary_min)),
+            summary_max = IFNULL(MAX(summary_max, excluded.summary_max),
+                                 IFNULL(summary_max, excluded.summary_max)),
+            {', '.join(f'{name}_sum = {name}_sum + excluded.{name}_sum' for name in ITEM_NAMES)};"""
+
+
+def _remove_row_statements(granularity: str) -> str:
+    """
+    Returns the statements that take the OLD row of a trigger out of its period.
+
+    Counts and sums are decremented. A minimum or maximum can't be, so it is recomputed
+    from beck_table over the period, but only when the removed row held it.
+    """
+    start = PERIOD_STARTS[granularity].format(date='OLD.beck_date')
+    period = (f"beck_date >= beck_rollup.period_start AND beck_date < "
+              f"{_PERIOD_ENDS[granularity].format(start='beck_rollup.period_start')}")
+    return f"""
+        UPDATE beck_rollup SET
+            row_count = row_count - 1,
+            summary_sum = summary_sum - IFNULL(OLD.beck_summary, 0),
+            summary_min = CASE WHEN OLD.beck_summary <= summary_min
+                THEN (SELECT MIN(beck_summary) FROM beck_table WHERE {period})
+                ELSE summary_min END,
+            summary_max = CASE WHEN OLD.beck_summary >= summary_max
+                THEN (SELECT MAX(beck_summary) FROM beck_table WHERE {period})
+                ELSE summary_max END,
+            {', '.join(f'{name}_sum = {name}_sum - IFNULL(OLD.{name}, 0)' for name in ITEM_NAMES)}
+        WHERE granularity = '{granularity}' AND period_start = {start};
+        DELETE FROM beck_rollup
+        WHERE granularity = '{granularity}' AND period_start = {start} AND row_count <= 0;"""
+
+
+def rollup_row_statements() -> Tuple[str, str]:
+    """
+    Returns the trigger bodies that fold the NEW row into beck_rollup and take the OLD
+    row out of it, for every granularity.
+
+    Returns:
+        Tuple[str, str]: The statements for NEW and for OLD.
+    """
+    return (''.join(_add_row_statement(granularity) for granularity in GRANULARITIES),
+            ''.join(_remove_row_statements(granularity) for granularity in GRANULARITIES))
+
+
+def rollup_trigger_statements() -> List[str]:
+    """
+    Returns the triggers that keep beck_rollup in step with every write to beck_table.
+
+    Each insert, delete or update touches one rollup row per granularity, so the rollups
+    stay current whichever path writes the data.
+
+    Returns:
+        List[str]: The CREATE TRIGGER statements.
+    """
+    add, remove = rollup_row_statements()
+    return [
+        f"""CREATE TRIGGER IF NOT EXISTS beck_rollup_insert
+            AFTER INSERT ON beck_table
+            WHEN NEW.beck_date IS NOT NULL
+            BEGIN {add}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS beck_rollup_delete
+            AFTER DELETE ON beck_table
+            WHEN OLD.beck_date IS NOT NULL
+            BEGIN {remove}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS beck_rollup_update_old
+            AFTER UPDATE OF beck_date, {', '.join(ITEM_NAMES)}, beck_summary ON beck_table
+            WHEN OLD.beck_date IS NOT NULL
+            BEGIN {remove}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS beck_rollup_update_new
+            AFTER UPDATE OF beck_date, {', '.join(ITEM_NAMES)}, beck_summary ON beck_table
+            WHEN NEW.beck_date IS NOT NULL
+            BEGIN {add}
+            END""",
+    ]
+
+
+ROLLUP_TRIGGERS: Tuple[str, ...] = ('beck_rollup_insert', 'beck_rollup_delete',
+                                    'beck_rollup_update_old', 'beck_rollup_update_new')
+
+
+def rebuild_rollup_statements(first_date: Optional[str] = None,
+                              last_date: Optional[str] = None) -> List[Tuple[str, List[Any]]]:
+    """
+    Returns the statements that recompute beck_rollup from beck_table with GROUP BY.
+
+    Without dates every period is rebuilt. With dates only the periods overlapping
+    first_date..last_date are rebuilt, each from the whole of its period, which is what
+    a bulk load with the triggers disabled needs afterwards.
+
+    Only the day rollups are aggregated from beck_table. Weeks and months are summed
+    from the freshly rebuilt days, which have a fraction of the rows.
+
+    Args:
+        first_date (Optional[str]): The earliest beck_date that changed, yyyy-MM-dd.
+        last_date (Optional[str]): The latest beck_date that changed, yyyy-MM-dd.
+
+    Returns:
+        List[Tuple[str, List[Any]]]: (sql, binds) pairs to run in order in one transaction.
+    """
+    statements: List[Tuple[str, List[Any]]] = []
+    for granularity in GRANULARITIES:
+        date_column = 'beck_date' if granularity == 'day' else 'period_start'
+        start = PERIOD_STARTS[granularity].format(date=date_column)
+        where, binds = f"{date_column} IS NOT NULL", []
+        delete, delete_binds = f"DELETE FROM beck_rollup WHERE granularity = '{granularity}'", []
+        if first_date is not None and last_date is not None:
+            range_start = PERIOD_STARTS[granularity].format(date='?')
+            range_end = _PERIOD_ENDS[granularity].format(start=PERIOD_STARTS[granularity].format(date='?'))
+            where = f"{date_column} >= {range_start} AND {date_column} < {range_end}"
+            binds = [first_date, last_date]
+            delete += f" AND period_start >= {range_start} AND period_start <= ?"
+            delete_binds = [first_date, last_date]
+        statements.append((delete, delete_binds))
+        if granularity == 'day':
+            select = f"""
+                SELECT 'day', {start}, COUNT(*), IFNULL(SUM(beck_summary), 0),
+                       MIN(beck_summary), MAX(beck_summary),
+                       {', '.join(f'IFNULL(SUM({name}), 0)' for name in ITEM_NAMES)}
+                FROM beck_table"""
+        else:
+            select = f"""
+                SELECT '{granularity}', {start}, SUM(row_count), SUM(summary_sum),
+                       MIN(summary_min), MAX(summary_max),
+                       {', '.join(f'SUM({column})' for column in _ITEM_SUMS)}
+                FROM beck_rollup"""
+            where = f"granularity = 'day' AND {where}"
+        statements.append((f"""
+            INSERT INTO beck_rollup ({_ROLLUP_COLUMNS}){select}
+            WHERE {where}
+            GROUP BY {start}""", binds))
+    return statements
+
+
+def trend_query(granularity: str,
+                start: Optional[str] = None,
+                end: Optional[str] = None) -> Tuple[str, List[Any]]:
+    """
+    Builds the SELECT of a trend series read from beck_rollup.
+
+    The rows are one per period, so the cost grows with the number of days rather than
+    the number of assessments.
+
+    Args:
+        granularity (str): 'day', 'week' or 'month'.
+        start (Optional[str]): The first period_start to include, yyyy-MM-dd.
+        end (Optional[str]): The last period_start to include, yyyy-MM-dd.
+
+    Returns:
+        Tuple[str, List[Any]]: The statement and its binds. Columns are period_start,
+        row_count, the mean, minimum and maximum beck_summary and the mean of each item.
+
+    Raises:
+        ValueError: If the granularity is unknown.
+    """
+    if granularity not in PERIOD_STARTS:
+        raise ValueError(f"Unknown granularity '{granularity}', expected one of {GRANULARITIES}")
+    sql = (f"SELECT period_start, row_count, CAST(summary_sum AS REAL) / row_count, "
+           f"summary_min, summary_max, "
+           f"{', '.join(f'CAST({name}_sum AS REAL) / row_count' for name in ITEM_NAMES)} "
+           f"FROM beck_rollup WHERE granularity = ?")
+    binds: List[Any] = [granularity]
+    if start is not None:
+        sql += " AND period_start >= ?"
+        binds.append(start)
+    if end is not None:
+        sql += " AND period_start <= ?"
+        binds.append(end)
+    return sql + " ORDER BY period_start", binds
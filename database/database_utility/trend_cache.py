@@ -0,0 +1,206 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from logger_setup import logger
+from beck_core.items import ITEM_COUNT, ITEM_NAMES
+from database.database_utility.paged_model import read_rows
+
+# Epoch seconds are computed by SQLite so a fetched range converts to NumPy in one call.
+_RANGE_SQL = (f"SELECT CAST(strftime('%s', beck_timestamp) AS INTEGER), "
+              f"IFNULL(beck_summary, -1), {', '.join(f'IFNULL({name}, -1)' for name in ITEM_NAMES)} "
+              f"FROM beck_table WHERE beck_timestamp >= ? AND beck_timestamp < ? "
+              f"ORDER BY beck_timestamp")
+_BOUNDS_SQL = ("SELECT CAST(strftime('%s', MIN(beck_timestamp)) AS INTEGER), "
+               "CAST(strftime('%s', MAX(beck_timestamp)) AS INTEGER) FROM beck_table")
+_WIDTH = 2 + ITEM_COUNT
+
+
+def to_timestamp(seconds: float) -> str:
+    """
+    Formats epoch seconds the way beck_timestamp stores them, yyyy-MM-ddThh:mm:ss.
+    """
+    return datetime.fromtimestamp(int(seconds), tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+
+
+class TrendSeriesCache(QObject):
+    """
+    Holds the beck_table time series loaded so far and extends it on demand.
+
+    The loaded data always covers one contiguous time range. When a view asks for a
+    range, only the parts outside the loaded extent are queried, through the
+    idx_beck_timestamp index, and prepended or appended to the arrays. Panning therefore
+    fetches thin slices at the edges instead of re-querying the view.
+
+    Times are epoch seconds in a float64 array, summaries int16 and items an (N, 12) int8
+    array, with -1 for NULL, so a million assessments take about 22 MB.
+
+    Signals:
+        changed: The loaded data changed.
+        bounds_ready (float, float): The first and last timestamp of the table, after
+            request_bounds. Both are NaN for an empty table.
+
+    """
+    changed = pyqtSignal()
+    bounds_ready = pyqtSignal(float, float)
+
+    def __init__(self, db: Optional[QSqlDatabase] = None) -> None:
+        super().__init__()
+        self._db: QSqlDatabase = db if db is not None else QSqlDatabase.database()
+        self._worker: Optional[Any] = None
+        self._serial: int = 0
+        self._requests: Dict[int, Tuple[str, Optional[Tuple[float, float]]]] = {}
+        self._wanted: Optional[Tuple[float, float]] = None
+        self._pending: List[Optional[Tuple[float, float]]] = [None, None]
+        self.clear()
+
+    def attach_worker(self, worker: Any) -> None:
+        """
+        Runs the range queries on a DatabaseWorker instead of the GUI thread.
+
+        Args:
+            worker (DatabaseWorker): A started database worker.
+        """
+        self._worker = worker
+        worker.selected.connect(self._on_worker_selected)
+
+    def clear(self) -> None:
+        """
+        Drops the loaded data. Results of queries still in flight are ignored.
+        """
+        self._requests = {}
+        self.times: np.ndarray = np.empty(0, dtype=np.float64)
+        self.summaries: np.ndarray = np.empty(0, dtype=np.int16)
+        self.items: np.ndarray = np.empty((0, ITEM_COUNT), dtype=np.int8)
+        self.extent: Optional[Tuple[float, float]] = None
+        self._pending = [None, None]
+
+    def invalidate(self) -> None:
+        """
+        Reloads the most recently requested range after the table changed.
+        """
+        wanted = self._wanted
+        self.clear()
+        self.changed.emit()
+        if wanted is not None:
+            self.ensure(*wanted)
+
+    def request_bounds(self) -> None:
+        """
+        Looks up the first and last timestamp; the answer arrives via bounds_ready.
+        """
+        self._query('bounds', None, _BOUNDS_SQL, [], 2)
+
+    def ensure(self, start: float, end: float) -> None:
+        """
+        Makes sure start..end is loaded, querying only what is missing.
+
+        Args:
+            start (float): The first epoch second needed.
+            end (float): The epoch second the range ends before.
+        """
+        self._wanted = (start, end)
+        if self.extent is None:
+            if self._pending[0] is None or start < self._pending[0][0] or end > self._pending[0][1]:
+                self._pending = [(start, end), None]
+                self._query_range('fill', start, end)
+            return
+        low, high = self.extent
+        if start < low and (self._pending[0] is None or start < self._pending[0][0]):
+            self._pending[0] = (start, low)
+            self._query_range('left', start, low)
+        if end > high and (self._pending[1] is None or end > self._pending[1][1]):
+            self._pending[1] = (high, end)
+            self._query_range('right', high, end)
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # Query plumbing
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def _key(self) -> str:
+        return f"trend:{id(self)}"
+
+    def _query_range(self, part: str, start: float, end: float) -> None:
+        self._query(part, (start, end), _RANGE_SQL, [to_timestamp(start), to_timestamp(end)], _WIDTH)
+
+    def _query(self, part: str, span: Optional[Tuple[float, float]], sql: str,
+               binds: List[Any], width: int) -> None:
+        """
+        Runs a query on the worker, or synchronously without one.
+
+        Every request gets a serial number that comes back with its rows, so a result
+        is merged for exactly the range it was queried for, and results of requests
+        made before clear() are dropped.
+        """
+        self._serial += 1
+        self._requests[self._serial] = (part, span)
+        if self._worker is not None:
+            self._worker.submit_select(f"{self._key()}:{part}", self._serial, sql, binds, width)
+            return
+        query = QSqlQuery(self._db)
+        query.setForwardOnly(True)
+        query.prepare(sql)
+        for value in binds:
+            query.addBindValue(value)
+        if not query.exec():
+            logger.error("Error loading trend %s: %s", part, query.lastError().text())
+            self._requests.pop(self._serial, None)
+            return
+        self._apply(self._serial, read_rows(query, width))
+
+    def _on_worker_selected(self, key: str, token: int, rows: List[Tuple[Any, ...]]) -> None:
+        if key.startswith(self._key()) and token in self._requests:
+            self._apply(token, rows)
+
+    def _apply(self, serial: int, rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Merges a query result into the loaded arrays.
+
+        A newer request for the same edge may have been answered first, so rows already
+        covered by the loaded extent are trimmed before merging.
+        """
+        part, span = self._requests.pop(serial)
+        # The worker answers in order and skips superseded selects, so older requests
+        # for the same part will never be answered.
+        for older in [key for key, (kind, _) in self._requests.items()
+                      if key < serial and kind == part]:
+            del self._requests[older]
+        if part == 'bounds':
+            low, high = rows[0] if rows else (None, None)
+            self.bounds_ready.emit(float('nan') if low is None else float(low),
+                                   float('nan') if high is None else float(high))
+            return
+        index = 1 if part == 'right' else 0
+        if self._pending[index] == span:
+            self._pending[index] = None
+        block = np.array(rows, dtype=np.int64).reshape(-1, _WIDTH)
+        times = block[:, 0].astype(np.float64)
+        if part == 'fill' or self.extent is None:
+            if part != 'fill':
+                return
+            keep = slice(None)
+            self.extent = span
+        elif part == 'left':
+            keep = times < self.extent[0]
+            self.extent = (min(span[0], self.extent[0]), self.extent[1])
+        else:
+            keep = times >= self.extent[1]
+            self.extent = (self.extent[0], max(span[1], self.extent[1]))
+        times = times[keep]
+        summaries = block[keep, 1].astype(np.int16)
+        items = block[keep, 2:].astype(np.int8)
+        if part == 'fill':
+            self.times, self.summaries, self.items = times, summaries, items
+        elif part == 'left':
+            self.times = np.concatenate((times, self.times))
+            self.summaries = np.concatenate((summaries, self.summaries))
+            self.items = np.concatenate((items, self.items))
+        else:
+            self.times = np.concatenate((self.times, times))
+            self.summaries = np.concatenate((self.summaries, summaries))
+            self.items = np.concatenate((self.items, items))
+        self.changed.emit()
+        if self._wanted is not None:
+            self.ensure(*self._wanted)
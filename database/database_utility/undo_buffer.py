@@ -0,0 +1,60 @@
+from array import array
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+from beck_core.items import ITEM_COUNT
+
+
+class DeletedRows:
+    """
+    A compact copy of deleted beck_table rows, kept so a delete can be undone.
+
+    Numbers are stored column-wise in typed arrays: ids as int64, the items as one
+    signed byte each and summaries as int16, with -1 standing in for NULL. Only the
+    date and time strings are Python objects, so a buffer of thousands of rows costs a
+    few dozen bytes per row.
+
+    Attributes:
+        ids (array): The primary keys, in deletion order.
+
+    """
+    __slots__ = ('ids', '_dates', '_times', '_items', '_summaries')
+
+    def __init__(self) -> None:
+        self.ids: array = array('q')
+        self._dates: List[Optional[str]] = []
+        self._times: List[Optional[str]] = []
+        self._items: array = array('b')
+        self._summaries: array = array('h')
+
+    def append(self, row: Sequence[Union[str, int, None]]) -> None:
+        """
+        Adds one row given as id followed by the BECK_COLUMNS values.
+
+        Args:
+            row (Sequence[Union[str, int, None]]): id, beck_date, beck_time, the items and
+                beck_summary.
+        """
+        self.ids.append(row[0])
+        self._dates.append(row[1])
+        self._times.append(row[2])
+        self._items.extend(-1 if value is None else value for value in row[3:3 + ITEM_COUNT])
+        summary = row[3 + ITEM_COUNT]
+        self._summaries.append(-1 if summary is None else summary)
+
+    def rows(self) -> Iterator[Tuple[Union[str, int, None], ...]]:
+        """
+        Yields the rows back in the form they were appended.
+
+        Yields:
+            Tuple[Union[str, int, None], ...]: id, beck_date, beck_time, the items and
+            beck_summary.
+        """
+        for i, row_id in enumerate(self.ids):
+            items = self._items[i * ITEM_COUNT:(i + 1) * ITEM_COUNT]
+            summary = self._summaries[i]
+            yield (row_id, self._dates[i], self._times[i],
+                   *(None if value < 0 else value for value in items),
+                   None if summary < 0 else summary)
+
+    def __len__(self) -> int:
+        return len(self.ids)
@@ -0,0 +1,257 @@
+import os
+import queue
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+import tracker_config as tkc
+from logger_setup import log_timing, logger
+from database.database_manager import DataManager
+from database.database_utility.paged_model import read_rows
+from database.database_utility.undo_buffer import DeletedRows
+from database.journal import BeckJournal
+
+# Command kinds placed on the worker queue.
+INSERT = 'insert'
+DELETE = 'delete'
+RESTORE = 'restore'
+SELECT = 'select'
+BACKUP = 'backup'
+_STOP = 'stop'
+
+
+class DatabaseWorker(QThread):
+    """
+    Runs database writes and refresh queries off the GUI thread.
+
+    The worker owns a DataManager on its own named QSqlDatabase connection, which is
+    opened inside the thread because Qt connections may only be used by the thread that
+    created them. Callers put commands on a queue and get results back through queued
+    signals. Whatever has piled up while the worker was busy is drained and coalesced:
+    all pending inserts go in as one batch, restores follow, all pending deletes run as
+    one transaction, and only the newest SELECT per key runs, after the writes. A backup
+    runs last, so it includes the writes of its batch.
+
+    Signals:
+        inserted (int): The number of rows committed by an insert batch.
+        deleted (list, object): The ids deleted by a delete batch and the DeletedRows
+            copy of those rows, for undo.
+        restored (int): The number of rows put back by a restore.
+        selected (str, int, list): The key, token and rows of a completed SELECT.
+        backed_up (str): The path of a snapshot written by a backup.
+        failed (str, str): The command kind and an error message.
+
+    """
+    inserted = pyqtSignal(int)
+    deleted = pyqtSignal(list, object)
+    restored = pyqtSignal(int)
+    selected = pyqtSignal(str, int, list)
+    backed_up = pyqtSignal(str)
+    failed = pyqtSignal(str, str)
+
+    def __init__(self,
+                 db_name: str,
+                 connection_name: str = tkc.DB_WORKER_CONNECTION,
+                 parent: Optional[Any] = None,
+                 journal: Optional[BeckJournal] = None) -> None:
+        super().__init__(parent)
+        self.db_name: str = db_name
+        self.connection_name: str = connection_name
+        self.journal: Optional[BeckJournal] = journal
+        # Journal records at the front whose rows failed to insert, kept for the next replay
+        self._journal_kept: int = 0
+        self._commands: "queue.Queue[Tuple[Any, ...]]" = queue.Queue()
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # Called from the GUI thread
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def submit_insert(self, *values: Union[str, int]) -> None:
+        """
+        Queues one beck_table row for insertion.
+
+        The signature matches DataManager.insert_into_beck_table so the worker can be used
+        as the db_insert_method of add_beck_data. With a journal the row is appended to it
+        first, so it is not lost if the app stops before the worker has written it.
+
+        Args:
+            *values (Union[str, int]): The row in BECK_COLUMNS order.
+        """
+        if self.journal is not None:
+            self.journal.append(values)
+        self._commands.put((INSERT, values))
+
+    def submit_delete(self, ids: Sequence[int]) -> None:
+        """
+        Queues rows for deletion by primary key.
+
+        Args:
+            ids (Sequence[int]): The ids to delete.
+        """
+        self._commands.put((DELETE, list(ids)))
+
+    def submit_restore(self, deleted: DeletedRows) -> None:
+        """
+        Queues rows removed by an earlier delete to be inserted back under their ids.
+
+        Args:
+            deleted (DeletedRows): The buffer emitted with the deleted signal.
+        """
+        self._commands.put((RESTORE, deleted))
+
+    def submit_select(self, key: str, token: int, sql: str, binds: Sequence[Any], width: int) -> None:
+        """
+        Queues a read-only query whose rows are posted back through the selected signal.
+
+        Args:
+            key (str): Identifies the requester; only the newest pending SELECT per key runs.
+            token (int): Passed back unchanged so the requester can drop stale results.
+            sql (str): The SELECT statement.
+            binds (Sequence[Any]): Positional bind values.
+            width (int): The number of result columns to read.
+        """
+        self._commands.put((SELECT, key, token, sql, list(binds), width))
+
+    def submit_backup(self, backup_dir: str, keep: int = tkc.BACKUP_KEEP) -> None:
+        """
+        Queues a gzip snapshot of the database into a backup directory, keeping the newest
+        snapshots only.
+
+        Args:
+            backup_dir (str): The directory the snapshots are kept in.
+            keep (int): The number of snapshots kept.
+        """
+        self._commands.put((BACKUP, backup_dir, keep))
+
+    def stop(self) -> None:
+        """
+        Finishes the queued commands, closes the connection and waits for the thread.
+        """
+        if self.isRunning():
+            self._commands.put((_STOP,))
+            self.wait()
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # Worker thread
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def run(self) -> None:
+        data_manager = DataManager(self.db_name, self.connection_name)
+        try:
+            running = True
+            while running:
+                batch = [self._commands.get()]
+                while True:
+                    try:
+                        batch.append(self._commands.get_nowait())
+                    except queue.Empty:
+                        break
+                with log_timing('worker.batch', commands=len(batch)):
+                    running = self._process(data_manager, batch)
+        except Exception as e:
+            logger.error("Database worker stopped: %s", e, exc_info=True)
+        finally:
+            data_manager.close()
+            del data_manager
+            QSqlDatabase.removeDatabase(self.connection_name)
+
+    def _process(self, data_manager: DataManager, batch: List[Tuple[Any, ...]]) -> bool:
+        """
+        Coalesces and executes one drained batch of commands.
+
+        Returns:
+            bool: False once a stop command has been processed.
+        """
+        rows: List[Sequence[Union[str, int]]] = []
+        ids: List[int] = []
+        restores: List[DeletedRows] = []
+        selects: Dict[str, Tuple[Any, ...]] = {}
+        backup: Optional[Tuple[Any, ...]] = None
+        running = True
+        for command in batch:
+            kind = command[0]
+            if kind == INSERT:
+                rows.append(command[1])
+            elif kind == DELETE:
+                ids.extend(command[1])
+            elif kind == RESTORE:
+                restores.append(command[1])
+            elif kind == SELECT:
+                selects.pop(command[1], None)
+                selects[command[1]] = command
+            elif kind == BACKUP:
+                backup = command
+            elif kind == _STOP:
+                running = False
+
+        if rows:
+            count = data_manager.insert_many_into_beck_table(rows)
+            if self.journal is not None:
+                self._trim_journal(count, len(rows))
+            if count < len(rows):
+                self.failed.emit(INSERT, f"{len(rows) - count} of {len(rows)} rows not saved")
+            if count:
+                self.inserted.emit(count)
+        for deleted in restores:
+            count = data_manager.restore_beck_rows(deleted)
+            if count:
+                self.restored.emit(count)
+            else:
+                self.failed.emit(RESTORE, f"{len(deleted)} rows not restored")
+        if ids:
+            deleted = data_manager.delete_from_beck_table(ids)
+            if deleted is not None:
+                self.deleted.emit(ids, deleted)
+            else:
+                self.failed.emit(DELETE, f"{len(ids)} rows not deleted")
+        for _, key, token, sql, binds, width in selects.values():
+            with log_timing('worker.select', key=key) as fields:
+                query = QSqlQuery(data_manager.db)
+                query.setForwardOnly(True)
+                query.prepare(sql)
+                for value in binds:
+                    query.addBindValue(value)
+                if not query.exec():
+                    logger.error("Error in worker select %s: %s", key, query.lastError().text())
+                    self.failed.emit(SELECT, query.lastError().text())
+                    continue
+                result = read_rows(query, width)
+                fields['rows'] = len(result)
+            self.selected.emit(key, token, result)
+        if backup is not None:
+            self._backup(data_manager, *backup[1:])
+        return running
+
+    def _trim_journal(self, committed: int, submitted: int) -> None:
+        """
+        Drops the journal records of committed rows, keeping those of failed ones.
+        """
+        try:
+            self.journal.discard(committed, skip=self._journal_kept)
+        except OSError as e:
+            logger.error("Error trimming the commit journal: %s", e)
+            return
+        self._journal_kept += submitted - committed
+
+    def _backup(self, data_manager: DataManager, backup_dir: str, keep: int) -> None:
+        """
+        Snapshots the database with VACUUM INTO on the worker's connection, then gzips the
+        copy and rotates old snapshots.
+        """
+        from database.backup import compress_snapshot, rotate_snapshots, snapshot_name
+
+        try:
+            os.makedirs(backup_dir, exist_ok=True)
+            snapshot_path = os.path.join(backup_dir, snapshot_name())
+            raw_path = snapshot_path + '.db'
+            if not data_manager.snapshot_into(raw_path):
+                if os.path.exists(raw_path):
+                    os.remove(raw_path)
+                self.failed.emit(BACKUP, data_manager.db.lastError().text() or "snapshot not written")
+                return
+            compress_snapshot(raw_path, snapshot_path)
+            rotate_snapshots(backup_dir, keep)
+        except OSError as e:
+            logger.error("Error writing backup to %s: %s", backup_dir, e)
+            self.failed.emit(BACKUP, str(e))
+            return
+        self.backed_up.emit(snapshot_path)
@@ -0,0 +1,149 @@
+import calendar
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import List, Sequence, Tuple, Union
+
+import tracker_config as tkc
+from logger_setup import logger
+from beck_core.items import ITEM_COUNT
+
+# One committed assessment: the timestamp in epoch seconds, the twelve items, and the
+# CRC-32 of the bytes before it. The summary is the sum of the items.
+RECORD = struct.Struct(f'<q{ITEM_COUNT}bI')
+_PAYLOAD = struct.Struct(f'<q{ITEM_COUNT}b')
+
+default_journal_path = os.path.join(os.path.expanduser('~'), tkc.JOURNAL_FILE)
+
+Row = Tuple[Union[str, int], ...]
+
+
+def encode_record(row: Sequence[Union[str, int]]) -> bytes:
+    """
+    Packs a beck_table row into a journal record.
+
+    Args:
+        row (Sequence[Union[str, int]]): The row in BECK_COLUMNS order, with the date as
+            yyyy-MM-dd and the time as hh:mm:ss.
+
+    Returns:
+        bytes: The RECORD.size bytes of the record.
+    """
+    beck_date, beck_time = row[0], row[1]
+    # Sliced rather than parsed with strptime, which is several times slower
+    seconds = calendar.timegm((int(beck_date[0:4]), int(beck_date[5:7]), int(beck_date[8:10]),
+                               int(beck_time[0:2]), int(beck_time[3:5]), int(beck_time[6:8])))
+    payload = _PAYLOAD.pack(seconds, *row[2:2 + ITEM_COUNT])
+    return payload + struct.pack('<I', zlib.crc32(payload))
+
+
+def decode_records(data: bytes) -> Tuple[List[Row], int]:
+    """
+    Unpacks journal records up to the first torn or corrupt one.
+
+    A crash can leave the last record half written; it and anything after it are
+    ignored.
+
+    Args:
+        data (bytes): The journal contents.
+
+    Returns:
+        Tuple[List[Row], int]: The rows in BECK_COLUMNS order, and the number of bytes
+        they took.
+    """
+    rows: List[Row] = []
+    end = len(data) - len(data) % RECORD.size
+    for offset in range(0, end, RECORD.size):
+        seconds, *items, crc = RECORD.unpack_from(data, offset)
+        if zlib.crc32(data[offset:offset + _PAYLOAD.size]) != crc:
+            logger.error("Journal record %d is corrupt; %d bytes after it are ignored",
+                         offset // RECORD.size, len(data) - offset)
+            return rows, offset
+        moment = time.gmtime(seconds)
+        rows.append((time.strftime('%Y-%m-%d', moment), time.strftime('%H:%M:%S', moment),
+                     *items, sum(items)))
+    return rows, end
+
+
+def read_journal(path: str) -> List[Row]:
+    """
+    Returns the rows of the intact records of a journal file, or none if it is missing.
+
+    Args:
+        path (str): The journal file.
+
+    Returns:
+        List[Row]: The rows in BECK_COLUMNS order, oldest first.
+    """
+    try:
+        with open(path, 'rb') as handle:
+            data = handle.read()
+    except FileNotFoundError:
+        return []
+    return decode_records(data)[0]
+
+
+class BeckJournal:
+    """
+    An append-only file of committed assessments that have not reached beck_table yet.
+
+    A commit appends one fixed-size record with a single unbuffered write, which takes a
+    few microseconds and survives the app crashing right after. Once the database worker
+    has committed rows, they are discarded from the front of the journal. Records left
+    over from a crash are replayed by DataManager when the database is next opened.
+
+    Appends come from the GUI thread and discards from the worker thread, so both take a
+    lock.
+
+    Attributes:
+        path (str): The journal file.
+        fsync (bool): Whether every append is also flushed to disk, which makes commits
+            survive a power loss but costs milliseconds each.
+
+    """
+
+    def __init__(self, path: str = default_journal_path, fsync: bool = tkc.JOURNAL_FSYNC) -> None:
+        self.path: str = path
+        self.fsync: bool = fsync
+        self._lock = threading.Lock()
+        self._file = open(path, 'ab', buffering=0)
+
+    def append(self, row: Sequence[Union[str, int]]) -> None:
+        """
+        Appends one row to the journal.
+
+        Args:
+            row (Sequence[Union[str, int]]): The row in BECK_COLUMNS order.
+        """
+        record = encode_record(row)
+        with self._lock:
+            self._file.write(record)
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def discard(self, count: int, skip: int = 0) -> None:
+        """
+        Drops the oldest records once their rows are committed to beck_table.
+
+        Records appended meanwhile are moved forward in the file.
+
+        Args:
+            count (int): The number of records to drop.
+            skip (int): Records at the front to keep, because their rows failed to insert
+                and are left for the next replay.
+        """
+        if count <= 0:
+            return
+        with self._lock:
+            with open(self.path, 'r+b') as handle:
+                handle.seek((skip + count) * RECORD.size)
+                rest = handle.read()
+                handle.seek(skip * RECORD.size)
+                handle.write(rest)
+                handle.truncate((skip * RECORD.size) + len(rest))
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,296 @@
+import os
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+import tracker_config as tkc
+from logger_setup import logger
+from database.beck_export import connect_read_only
+from database.bulk_load import repair_interrupted_load
+from database.database_manager import DataManager
+from database.database_utility.connection_tuning import apply_connection_pragmas
+
+T = TypeVar('T')
+
+default_profile_dir = os.path.join(os.path.expanduser('~'), tkc.PROFILE_DIR)
+
+
+class ProfileSummary:
+    """
+    Aggregate scores of one profile, as returned by ProfileStore.summaries.
+
+    Attributes:
+        count (int): The number of assessments.
+        mean (Optional[float]): The mean beck_summary, None without assessments.
+        low (Optional[int]): The lowest beck_summary.
+        high (Optional[int]): The highest beck_summary.
+        last (Optional[str]): The beck_timestamp of the latest assessment.
+
+    """
+    __slots__ = ('count', 'mean', 'low', 'high', 'last')
+
+    def __init__(self, count: int, mean: Optional[float], low: Optional[int],
+                 high: Optional[int], last: Optional[str]) -> None:
+        self.count: int = count
+        self.mean: Optional[float] = mean
+        self.low: Optional[int] = low
+        self.high: Optional[int] = high
+        self.last: Optional[str] = last
+
+    def __repr__(self) -> str:
+        return (f"ProfileSummary(count={self.count}, mean={self.mean}, low={self.low}, "
+                f"high={self.high}, last={self.last})")
+
+
+class ProfileStore:
+    """
+    Keeps one SQLite shard per patient or profile, indexed by a small catalog database.
+
+    Each profile's assessments live in their own database file under profile_dir, with
+    the same schema DataManager creates, so queries and backups only touch the data of
+    one profile. The catalog maps profile ids to shard files.
+
+    DataManagers for the shards are opened lazily and kept in an LRU pool of at most
+    pool_size named QSqlDatabase connections; the least recently used shard is closed and
+    its connection removed when the pool is full. DataManagers handed out by
+    data_manager() must not be kept past the next call that may evict them.
+
+    Read-only aggregates across profiles fan out over a thread pool. Each task opens its
+    own sqlite3 connection, since QSqlDatabase connections cannot cross threads and the
+    stdlib driver releases the GIL while SQLite runs the query. QtSql bundles its own
+    SQLite library, and two libraries must never have the same file open at once, so the
+    pooled connections of the shards read are closed first.
+
+    Attributes:
+        profile_dir (str): The directory holding the catalog and the shards.
+        pool_size (int): The maximum number of shard connections kept open.
+
+    """
+
+    def __init__(self,
+                 profile_dir: str = default_profile_dir,
+                 pool_size: int = tkc.SHARD_POOL_SIZE) -> None:
+        self.profile_dir: str = profile_dir
+        self.pool_size: int = pool_size
+        self._pool: "OrderedDict[str, DataManager]" = OrderedDict()
+        self._catalog_connection: str = f"{tkc.CATALOG_CONNECTION}:{os.path.abspath(profile_dir)}"
+        os.makedirs(profile_dir, exist_ok=True)
+        self.catalog: QSqlDatabase = QSqlDatabase.addDatabase('QSQLITE', self._catalog_connection)
+        self.catalog.setDatabaseName(os.path.join(profile_dir, tkc.CATALOG_DB_NAME))
+        if not self.catalog.open():
+            logger.error("Error: Unable to open profile catalog %s", self.catalog.lastError().text())
+            return
+        apply_connection_pragmas(self.catalog)
+        query = QSqlQuery(self.catalog)
+        if not query.exec("""
+                        CREATE TABLE IF NOT EXISTS profiles (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        profile_id TEXT NOT NULL UNIQUE,
+                        display_name TEXT,
+                        shard_file TEXT,
+                        created_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now'))
+                        )"""):
+            logger.error("Error creating table: profiles %s", query.lastError().text())
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # Catalog
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def create_profile(self, profile_id: str, display_name: Optional[str] = None) -> str:
+        """
+        Registers a profile and creates its shard, or returns the shard of an existing one.
+
+        Shard files are named after the catalog row id, so any profile id is safe to use.
+
+        Args:
+            profile_id (str): The unique id of the patient or profile.
+            display_name (Optional[str]): A human readable name.
+
+        Returns:
+            str: The path of the profile's shard.
+
+        Raises:
+            RuntimeError: If the catalog could not be updated.
+        """
+        existing = self.shard_path(profile_id)
+        if existing is not None:
+            return existing
+        query = QSqlQuery(self.catalog)
+        if not self.catalog.transaction():
+            raise RuntimeError(f"Error starting transaction: profiles - "
+                               f"{self.catalog.lastError().text()}")
+        query.prepare("INSERT INTO profiles (profile_id, display_name) VALUES (?, ?)")
+        query.addBindValue(profile_id)
+        query.addBindValue(display_name if display_name is not None else profile_id)
+        saved = query.exec()
+        if saved:
+            shard_file = f"profile_{int(query.lastInsertId()):06d}.db"
+            query.prepare("UPDATE profiles SET shard_file = ? WHERE profile_id = ?")
+            query.addBindValue(shard_file)
+            query.addBindValue(profile_id)
+            saved = query.exec()
+        if not saved or not self.catalog.commit():
+            error = query.lastError().text()
+            self.catalog.rollback()
+            raise RuntimeError(f"Error registering profile {profile_id}: {error}")
+        self.data_manager(profile_id)
+        logger.info("Created profile %s in %s", profile_id, shard_file)
+        return os.path.join(self.profile_dir, shard_file)
+
+    def profiles(self) -> List[Tuple[str, str]]:
+        """
+        Lists the registered profiles.
+
+        Returns:
+            List[Tuple[str, str]]: (profile_id, display_name) pairs in creation order.
+        """
+        query = QSqlQuery(self.catalog)
+        query.setForwardOnly(True)
+        if not query.exec("SELECT profile_id, display_name FROM profiles ORDER BY id"):
+            logger.error("Error reading profiles: %s", query.lastError().text())
+            return []
+        result: List[Tuple[str, str]] = []
+        while query.next():
+            result.append((query.value(0), query.value(1)))
+        return result
+
+    def shard_path(self, profile_id: str) -> Optional[str]:
+        """
+        Returns the shard file of a profile.
+
+        Args:
+            profile_id (str): The profile id.
+
+        Returns:
+            Optional[str]: The path, or None if the profile is not registered.
+        """
+        query = QSqlQuery(self.catalog)
+        query.prepare("SELECT shard_file FROM profiles WHERE profile_id = ?")
+        query.addBindValue(profile_id)
+        if not query.exec() or not query.next() or query.isNull(0):
+            return None
+        return os.path.join(self.profile_dir, query.value(0))
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # Connection pool
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def data_manager(self, profile_id: str) -> DataManager:
+        """
+        Returns the DataManager of a profile's shard, opening it on first use.
+
+        Args:
+            profile_id (str): A registered profile id.
+
+        Returns:
+            DataManager: The shard's DataManager on its own named connection.
+
+        Raises:
+            KeyError: If the profile is not registered.
+        """
+        data_manager = self._pool.get(profile_id)
+        if data_manager is not None:
+            self._pool.move_to_end(profile_id)
+            return data_manager
+        path = self.shard_path(profile_id)
+        if path is None:
+            raise KeyError(f"Unknown profile {profile_id}")
+        while len(self._pool) >= self.pool_size:
+            self._close_shard(*self._pool.popitem(last=False))
+        repair_interrupted_load(path)
+        data_manager = DataManager(path, self._shard_connection(profile_id))
+        self._pool[profile_id] = data_manager
+        return data_manager
+
+    def release(self, profile_id: str) -> None:
+        """
+        Closes a profile's shard connection if it is open.
+
+        Args:
+            profile_id (str): The profile id.
+        """
+        data_manager = self._pool.pop(profile_id, None)
+        if data_manager is not None:
+            self._close_shard(profile_id, data_manager)
+
+    def close(self) -> None:
+        """
+        Closes every shard connection and the catalog.
+        """
+        while self._pool:
+            self._close_shard(*self._pool.popitem(last=False))
+        self.catalog.close()
+        self.catalog = QSqlDatabase()
+        QSqlDatabase.removeDatabase(self._catalog_connection)
+
+    def _shard_connection(self, profile_id: str) -> str:
+        return f"{tkc.SHARD_CONNECTION_PREFIX}:{os.path.abspath(self.profile_dir)}:{profile_id}"
+
+    def _close_shard(self, profile_id: str, data_manager: DataManager) -> None:
+        data_manager.close()
+        QSqlDatabase.removeDatabase(self._shard_connection(profile_id))
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # Cross-profile queries
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def fan_out(self,
+                task: Callable[[sqlite3.Connection], T],
+                profile_ids: Optional[Iterable[str]] = None,
+                max_workers: int = tkc.PROFILE_FANOUT_WORKERS) -> Dict[str, T]:
+        """
+        Runs a read-only task against many shards in parallel.
+
+        The shards' pooled DataManagers are closed beforehand; see the class docstring.
+        DataManagers obtained earlier for these profiles must not be used afterwards.
+
+        Args:
+            task (Callable[[sqlite3.Connection], T]): Called with a read-only connection to
+                one shard, on a pool thread.
+            profile_ids (Optional[Iterable[str]]): The profiles to query, all by default.
+            max_workers (int): The number of threads.
+
+        Returns:
+            Dict[str, T]: The task result per profile. Profiles whose shard is missing or
+            whose task failed are left out and logged.
+        """
+        ids = [profile for profile, _ in self.profiles()] if profile_ids is None else list(profile_ids)
+        paths = {profile: self.shard_path(profile) for profile in ids}
+        for profile in ids:
+            self.release(profile)
+
+        def run(profile_id: str) -> Tuple[str, Optional[T]]:
+            path = paths[profile_id]
+            if path is None or not os.path.exists(path):
+                logger.error("Profile %s has no shard", profile_id)
+                return profile_id, None
+            try:
+                connection = connect_read_only(path)
+                try:
+                    return profile_id, task(connection)
+                finally:
+                    connection.close()
+            except sqlite3.Error as e:
+                logger.error("Error querying profile %s: %s", profile_id, e)
+                return profile_id, None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ids) or 1))) as executor:
+            return {profile: result for profile, result in executor.map(run, ids)
+                    if result is not None}
+
+    def summaries(self, profile_ids: Optional[Iterable[str]] = None) -> Dict[str, ProfileSummary]:
+        """
+        Returns count, mean, range and latest assessment of beck_summary per profile.
+
+        Args:
+            profile_ids (Optional[Iterable[str]]): The profiles to query, all by default.
+
+        Returns:
+            Dict[str, ProfileSummary]: The summary per profile.
+        """
+        def summarize(connection: sqlite3.Connection) -> ProfileSummary:
+            return ProfileSummary(*connection.execute(
+                "SELECT COUNT(*), AVG(beck_summary), MIN(beck_summary), MAX(beck_summary), "
+                "MAX(beck_timestamp) FROM beck_table").fetchone())
+
+        return self.fan_out(summarize, profile_ids)
@@ -1,27 +1,136 @@
+"""
+Logging for the app and the command line tools.
+
+Records are written as JSON, one object per line, to a size-rotated file in the log
+directory. Loggers only put records on a queue; a QueueListener thread formats and
+writes them, so file I/O never runs on the GUI thread.
+
+Log with %-style arguments, which are only formatted if the record passes the level:
+
+    logger.error("Error reading trend: %s - %s", table, query.lastError().text())
+
+Keyword fields passed with extra= become fields of the JSON object. log_timing() uses
+them to record how long a database operation took:
+
+    with log_timing('beck_table.restore', rows=len(deleted)) as fields:
+        fields['restored'] = ...
+"""
+import atexit
+import copy
+import json
 import logging
 import os
-import sys
+import queue
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, Iterator
 
 import tracker_config as tkc
 
 
 LOG_DIRECTORY = tkc.PRINGLES
-# LOG_FILE = 'TESTJAN23MAIN.txt'
-
 
 log_directory = os.path.join(os.path.expanduser('~'), tkc.PRINGLES)
 
 # Create the directory if it doesn't exist
-if not os.path.exists(log_directory):
-    os.makedirs(log_directory)
+os.makedirs(log_directory, exist_ok=True)
 
 # Path to your log file
 log_file = os.path.join(log_directory, tkc.LOG_FILE)
 
+# Attributes every LogRecord has. Anything else on a record was passed with extra=.
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'taskName'}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats a record as one line of JSON with its extra= fields at the top level.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            'time': self.formatTime(record, tkc.DATEFORMAT),
+            'created': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'function': record.funcName,
+            'line': record.lineno,
+            'thread': record.threadName,
+        }
+        for name, value in vars(record).items():
+            if name not in _RECORD_ATTRIBUTES:
+                entry[name] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry['stack'] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class _MessageQueueHandler(QueueHandler):
+    """
+    Queues records for the listener thread, leaving the JSON formatting to it.
+
+    Only the message is merged in the calling thread, because its arguments may change
+    once the call returns. QueueHandler would format the whole record here and fold the
+    traceback into the message.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _start_listener() -> QueueListener:
+    """
+    Routes the root logger through a queue to the rotating JSON log file.
+    """
+    file_handler = RotatingFileHandler(log_file, maxBytes=tkc.LOG_MAX_BYTES,
+                                       backupCount=tkc.LOG_BACKUP_COUNT, encoding='utf-8',
+                                       delay=True)
+    file_handler.setFormatter(JsonFormatter())
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(tkc.LOG_LEVEL)
+    root.addHandler(_MessageQueueHandler(records))
+    listener = QueueListener(records, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
 logger = logging.getLogger(__name__)
+listener = _start_listener()
+
+
+@contextmanager
+def log_timing(operation: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Times a block and logs it with operation and duration_ms as fields of the record.
+
+    The record is logged at DEBUG, or at WARNING when the block took at least
+    tkc.LOG_SLOW_MS, so slow database calls show up at the usual log levels. Nothing is
+    formatted when the level is filtered out.
+
+    Args:
+        operation (str): A stable name such as 'beck_table.delete'.
+        **fields: Further fields of the record, such as row counts.
 
-logging.basicConfig(level=logging.ERROR,
-                    format='%(asctime)s - %(levelname)s - %(message)s',
-                    datefmt=tkc.DATEFORMAT,
-                    filename=log_file,
-                    filemode=tkc.FILE_MODE)
+    Yields:
+        Dict[str, Any]: The fields, so the block can add results to them.
+    """
+    started = time.perf_counter()
+    try:
+        yield fields
+    finally:
+        duration_ms = (time.perf_counter() - started) * 1000
+        level = logging.WARNING if duration_ms >= tkc.LOG_SLOW_MS else logging.DEBUG
+        if logger.isEnabledFor(level):
+            logger.log(level, "%s took %.1f ms", operation, duration_ms, stacklevel=3,
+                       extra={'operation': operation, 'duration_ms': round(duration_ms, 3), **fields})
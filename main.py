@@ -1,9 +1,6 @@
-from PyQt6.QtWidgets import QApplication
-from ui.main_window import MainWindow
 import sys
 from logger_setup import logger
-# pyrcc5 resources.qrc -o resources.py
-from ui.main_ui import res
+from utility.app_operations.startup_profiler import profiler
 
 
 def run_app():
@@ -11,24 +8,35 @@ def run_app():
         Runs the application.
 
         This function initializes the application, creates the main window,
-        and starts the event loop.
+        and starts the event loop. Pass --profile-startup to print how long each
+        startup phase took once the window has first painted.
 
         Raises:
             Exception: If an error occurs during the execution of the application.
 
     """
     logger.info("ENTER BY PORTAL START YES!")
+    profiler.enabled = '--profile-startup' in sys.argv
+    argv = [arg for arg in sys.argv if arg != '--profile-startup']
     try:
-        app = QApplication(sys.argv)
-        
-        window = MainWindow()
-        window.show()
+        with profiler.phase("import Qt"):
+            from PyQt6.QtWidgets import QApplication
+        with profiler.phase("import main window"):
+            from ui.main_window import MainWindow
+            # pyrcc5 resources.qrc -o resources.py
+            from ui.main_ui import res
+        with profiler.phase("QApplication"):
+            app = QApplication(argv)
+
+        with profiler.phase("MainWindow"):
+            window = MainWindow()
+        profiler.report_after_first_paint(window)
+        with profiler.phase("show"):
+            window.show()
         sys.exit(app.exec())
     except Exception as e:
-        logger.error(f"Error at portal {e}", exc_info=True)
-    
+        logger.error("Error at portal %s", e, exc_info=True)
+
 
 if __name__ == "__main__":
     run_app()
-
-
@@ -2,7 +2,10 @@
 from logger_setup import logger
 from typing import Any
 
+from utility.app_operations.perf_stats import perf_stats
 
+
+@perf_stats.timed('change_stack_page')
 def change_stack_page(minderStacks: Any, index: int) -> None:
     """
     Change the current index of the alpha stack.
@@ -21,6 +24,6 @@ def change_stack_page(minderStacks: Any, index: int) -> None:
         minderStacks.setCurrentIndex(index)
         logger.info("Minder Stack Page Change")
     except Exception as e:
-        logger.error(f"Minder Stack Page Change Error: {e}", exc_info=True)
+        logger.error("Minder Stack Page Change Error: %s", e, exc_info=True)
 
 
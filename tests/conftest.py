@@ -0,0 +1,74 @@
+import os
+import random
+import sys
+import tempfile
+from itertools import count
+from typing import Any, Callable, Iterator, List, Tuple
+
+import pytest
+
+# The app derives its database, settings and log paths from HOME when first imported
+os.environ['HOME'] = tempfile.mkdtemp(prefix='beck_tests_')
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from database.database_manager import DataManager
+
+_connection_numbers = count()
+
+
+def beck_rows(number: int, seed: int = 1, first_day: int = 1) -> List[Tuple[Any, ...]]:
+    """
+    Returns reproducible rows in BECK_COLUMNS order, three a day from 2020-01-<first_day>.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for index in range(number):
+        day = first_day + index // 3
+        items = [rng.randint(0, 3) for _ in range(12)]
+        rows.append((f"2020-{1 + (day - 1) // 28:02d}-{1 + (day - 1) % 28:02d}",
+                     f"{8 + 4 * (index % 3):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}",
+                     *items, sum(items)))
+    return rows
+
+
+def fetch_all(db: QSqlDatabase, sql: str) -> List[Tuple[Any, ...]]:
+    query = QSqlQuery(db)
+    assert query.exec(sql), query.lastError().text()
+    rows = []
+    while query.next():
+        rows.append(tuple(query.value(i) for i in range(query.record().count())))
+    return rows
+
+
+@pytest.fixture(scope='session')
+def qt_app() -> QApplication:
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+
+@pytest.fixture
+def open_manager(qt_app, tmp_path) -> Iterator[Callable[..., DataManager]]:
+    """
+    Opens DataManagers on a database in tmp_path, each on its own connection, and closes
+    them after the test.
+    """
+    opened: List[Tuple[DataManager, str]] = []
+
+    def open_(**kwargs: Any) -> DataManager:
+        name = f"test_{next(_connection_numbers)}"
+        manager = DataManager(str(tmp_path / 'beck.db'), name, **kwargs)
+        opened.append((manager, name))
+        return manager
+
+    yield open_
+    for manager, name in opened:
+        manager.close()
+        QSqlDatabase.removeDatabase(name)
+
+
+@pytest.fixture
+def data_manager(open_manager) -> DataManager:
+    return open_manager()
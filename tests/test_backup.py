@@ -0,0 +1,81 @@
+import gzip
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from database.backup import (STAGED_RESTORE_SUFFIX, backup_database, check_integrity, compress_snapshot,
+                             list_snapshots, restore_database, rotate_snapshots, snapshot_name,
+                             stage_restore)
+
+from conftest import beck_rows
+
+ROWS_SQL = "SELECT beck_date, beck_time, beck_summary FROM beck_table ORDER BY id"
+
+
+def stored_rows(path):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute(ROWS_SQL).fetchall()
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def db_path(open_manager, tmp_path):
+    manager = open_manager()
+    manager.insert_many_into_beck_table(beck_rows(30))
+    manager.close()
+    return str(tmp_path / 'beck.db')
+
+
+def test_backup_and_restore_round_trip(db_path, tmp_path):
+    expected = stored_rows(db_path)
+    snapshot = backup_database(db_path, str(tmp_path / 'backups'))
+    assert list_snapshots(str(tmp_path / 'backups')) == [snapshot]
+
+    connection = sqlite3.connect(db_path)
+    connection.execute("DELETE FROM beck_table WHERE id > 10")
+    connection.commit()
+    connection.close()
+    restore_database(snapshot, db_path)
+    assert stored_rows(db_path) == expected
+    assert not os.path.exists(db_path + STAGED_RESTORE_SUFFIX)
+    assert not os.path.exists(db_path + '-wal')
+
+
+def test_corrupt_snapshot_is_not_staged(db_path, tmp_path):
+    expected = stored_rows(db_path)
+    snapshot = str(tmp_path / snapshot_name())
+    with gzip.open(snapshot, 'wb') as handle:
+        handle.write(b'SQLite format 3\x00' + os.urandom(8192))
+    with pytest.raises(RuntimeError):
+        stage_restore(snapshot, db_path)
+    assert [name for name in os.listdir(tmp_path) if STAGED_RESTORE_SUFFIX in name] == []
+    assert stored_rows(db_path) == expected
+
+
+def test_snapshot_taken_while_open_is_intact(data_manager, tmp_path):
+    data_manager.insert_many_into_beck_table(beck_rows(20))
+    raw_path = str(tmp_path / 'copy.db')
+    assert data_manager.snapshot_into(raw_path)
+    assert check_integrity(raw_path) == []
+    assert len(stored_rows(raw_path)) == 20
+    snapshot = str(tmp_path / snapshot_name())
+    compress_snapshot(raw_path, snapshot)
+    assert not os.path.exists(raw_path)
+    restored = str(tmp_path / 'restored.db')
+    restore_database(snapshot, restored)
+    assert len(stored_rows(restored)) == 20
+
+
+def test_rotation_keeps_the_newest_snapshots(tmp_path):
+    taken = datetime(2024, 1, 1)
+    names = [snapshot_name(taken + timedelta(hours=hours)) for hours in range(5)]
+    for name in names:
+        (tmp_path / name).write_bytes(b'')
+    (tmp_path / (names[0] + '.partial')).write_bytes(b'')
+    removed = rotate_snapshots(str(tmp_path), keep=2)
+    assert sorted(os.path.basename(path) for path in removed) == names[:3]
+    assert list_snapshots(str(tmp_path)) == [str(tmp_path / name) for name in reversed(names[3:])]
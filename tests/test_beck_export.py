@@ -0,0 +1,61 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from beck_core.items import BECK_COLUMNS, ITEM_NAMES
+from database.beck_export import export_beck_table
+
+from conftest import beck_rows
+
+
+@pytest.fixture
+def db_path(open_manager, tmp_path):
+    manager = open_manager()
+    manager.insert_many_into_beck_table(beck_rows(25))
+    manager.close()
+    path = str(tmp_path / 'beck.db')
+    connection = sqlite3.connect(path)
+    connection.execute("UPDATE beck_table SET beck_time = NULL, beck_summary = NULL WHERE id = 4")
+    connection.commit()
+    rows = connection.execute(f"SELECT id, {', '.join(BECK_COLUMNS)} FROM beck_table ORDER BY id").fetchall()
+    connection.close()
+    return path, rows
+
+
+def test_npz_export_matches_table(db_path, tmp_path):
+    path, rows = db_path
+    output = str(tmp_path / 'beck.npz')
+    assert export_beck_table(path, output, chunk_size=7) == len(rows)
+    with np.load(output) as archive:
+        assert archive['item_names'].tolist() == list(ITEM_NAMES)
+        assert archive['id'].tolist() == [row[0] for row in rows]
+        assert [str(day) for day in archive['beck_date']] == [row[1] for row in rows]
+        assert archive['items'].tolist() == [list(row[3:-1]) for row in rows]
+        assert np.isnat(archive['beck_time'][3]) and np.isnat(archive['beck_timestamp'][3])
+        assert archive['beck_summary'][3] == -1
+        assert str(archive['beck_timestamp'][0]) == f"{rows[0][1]}T{rows[0][2]}"
+
+
+@pytest.mark.parametrize('extension', ['parquet', 'feather'])
+def test_arrow_export_matches_table(db_path, tmp_path, extension):
+    pytest.importorskip('pyarrow')
+    import pyarrow.feather
+    import pyarrow.parquet
+    path, rows = db_path
+    output = str(tmp_path / f'beck.{extension}')
+    assert export_beck_table(path, output, chunk_size=7) == len(rows)
+    read = pyarrow.parquet.read_table if extension == 'parquet' else pyarrow.feather.read_table
+    table = read(output).to_pydict()
+    assert table['id'] == [row[0] for row in rows]
+    assert [day.isoformat() for day in table['beck_date']] == [row[1] for row in rows]
+    assert [None if time is None else time.isoformat() for time in table['beck_time']] == [
+        row[2] for row in rows]
+    assert table['beck_summary'] == [row[-1] for row in rows]
+    assert [list(values) for values in zip(*(table[name] for name in ITEM_NAMES))] == [
+        list(row[3:-1]) for row in rows]
+
+
+def test_unknown_export_format_is_refused(db_path, tmp_path):
+    with pytest.raises(ValueError):
+        export_beck_table(db_path[0], str(tmp_path / 'beck.xlsx'))
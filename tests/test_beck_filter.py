@@ -0,0 +1,32 @@
+import pytest
+
+from beck_core.items import SUMMARY_MAX
+from database.database_utility.beck_filter import beck_filter_clause
+from database.database_utility.paged_model import PagedSqlTableModel
+
+from conftest import beck_rows, fetch_all
+
+
+def test_open_filters_are_left_out():
+    assert beck_filter_clause() == ("", [])
+    assert beck_filter_clause(max_score=SUMMARY_MAX - 1) == ("beck_summary BETWEEN ? AND ?",
+                                                             [0, SUMMARY_MAX - 1])
+
+
+@pytest.mark.parametrize('filters, where', [
+    ({'date_from': '2020-01-10'}, "beck_date >= '2020-01-10'"),
+    ({'date_to': '2020-01-10'}, "beck_date <= '2020-01-10'"),
+    ({'date_from': '2020-01-05', 'date_to': '2020-01-12', 'min_score': 15},
+     "beck_date BETWEEN '2020-01-05' AND '2020-01-12' AND beck_summary >= 15"),
+    ({'min_score': 10, 'max_score': 20}, "beck_summary BETWEEN 10 AND 20"),
+])
+def test_filtered_model_matches_sql(data_manager, filters, where):
+    data_manager.insert_many_into_beck_table(beck_rows(60))
+    model = PagedSqlTableModel('beck_table', page_size=8, db=data_manager.db)
+    model.set_filter(*beck_filter_clause(**filters))
+    model.select()
+    while model.canFetchMore():
+        model.fetchMore()
+    expected = fetch_all(data_manager.db, f"SELECT id FROM beck_table WHERE {where} ORDER BY id")
+    assert 0 < len(expected) < 60
+    assert sorted(model.row_id(row) for row in range(model.rowCount())) == [id_ for id_, in expected]
@@ -0,0 +1,92 @@
+import csv
+import json
+
+import pytest
+
+from beck_core.items import ITEM_COUNT
+from database.beck_import import RECORD_COLUMNS, import_beck_file, validate_record
+
+from conftest import beck_rows
+
+GOOD = ('2020-01-01', '08:30:00', *[2] * ITEM_COUNT)
+
+
+def test_validate_record_recomputes_summary():
+    assert validate_record(GOOD) == (*GOOD, 2 * ITEM_COUNT)
+    assert validate_record(('2020-01-01', '08:30:00', *['1'] * ITEM_COUNT))[-1] == ITEM_COUNT
+
+
+@pytest.mark.parametrize('values, reason', [
+    (GOOD[:-1], "malformed record"),
+    (('2020-02-30', *GOOD[1:]), "bad beck_date"),
+    (('2020-1-01', *GOOD[1:]), "bad beck_date"),
+    ((GOOD[0], '8:30', *GOOD[2:]), "bad beck_time"),
+    ((*GOOD[:2], 4, *GOOD[3:]), "sadness out of range"),
+    ((*GOOD[:3], None, *GOOD[4:]), "outlook out of range"),
+    ((*GOOD[:3], True, *GOOD[4:]), "outlook is not an integer"),
+    ((*GOOD[:-1], False), "sleep is not an integer"),
+])
+def test_validate_record_rejects(values, reason):
+    with pytest.raises(ValueError, match=reason):
+        validate_record(values)
+
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(('note', *reversed(RECORD_COLUMNS)))
+        for row in rows:
+            writer.writerow(('', *reversed(row[:len(RECORD_COLUMNS)])))
+
+
+def test_csv_import_skips_duplicates_and_writes_rejects(tmp_path):
+    rows = beck_rows(50)
+    path = tmp_path / 'beck.csv'
+    write_csv(path, [*rows, rows[3], ('2020-13-01', *rows[0][1:])])
+    inserted = []
+
+    def insert_many(batch):
+        inserted.extend(batch)
+        return len(inserted)
+
+    stats = import_beck_file(str(path), insert_many, existing_keys={rows[0][:2]},
+                             rejects_path=str(tmp_path / 'rejects.csv'))
+    assert (stats.read, stats.valid, stats.rejected, stats.duplicates, stats.inserted) == (52, 49, 1, 2, 49)
+    assert inserted == rows[1:]
+    with open(tmp_path / 'rejects.csv', newline='', encoding='utf-8') as handle:
+        rejects = list(csv.reader(handle))
+    assert rejects[1][:3] == ['53', 'bad beck_date', '2020-13-01']
+
+
+def test_csv_rows_with_the_wrong_field_count_are_rejected(tmp_path):
+    rows = beck_rows(4)
+    path = tmp_path / 'beck.csv'
+    write_csv(path, rows)
+    with open(path, 'a', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle)
+        # Without the leading note these line up with RECORD_COLUMNS by count only
+        writer.writerow(reversed(rows[0][:len(RECORD_COLUMNS)]))
+        writer.writerow(('', *reversed(rows[1][:len(RECORD_COLUMNS)]), 'extra'))
+    stats = import_beck_file(str(path), lambda batch: len(list(batch)),
+                             rejects_path=str(tmp_path / 'rejects.csv'))
+    assert (stats.read, stats.rejected, stats.inserted) == (6, 2, 4)
+    with open(tmp_path / 'rejects.csv', newline='', encoding='utf-8') as handle:
+        rejects = list(csv.reader(handle))
+    assert [reject[:2] for reject in rejects[1:]] == [['6', 'malformed record'], ['7', 'malformed record']]
+
+
+def test_jsonl_import_into_database(data_manager, tmp_path):
+    rows = beck_rows(40)
+    path = tmp_path / 'beck.jsonl'
+    with open(path, 'w', encoding='utf-8') as handle:
+        for row in rows:
+            handle.write(json.dumps(dict(zip(RECORD_COLUMNS, row))) + '\n')
+        handle.write('[1, 2]\n\nnot json\n')
+    stats = import_beck_file(str(path), data_manager.insert_many_into_beck_table)
+    assert (stats.valid, stats.rejected, stats.inserted) == (40, 2, 40)
+    assert len(data_manager.becks_between()) == 40
+
+
+def test_unknown_format_is_refused(tmp_path):
+    with pytest.raises(ValueError):
+        import_beck_file(str(tmp_path / 'beck.xml'), lambda rows: 0)
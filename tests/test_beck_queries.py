@@ -0,0 +1,63 @@
+import numpy as np
+
+from beck_core.items import SUMMARY_MAX
+
+from conftest import beck_rows, fetch_all
+
+ITEMS_SQL = ("sadness, outlook, guilt, solitude, sexdrive, hygiene, decisiveness, effort, interest, "
+             "pessimism, victimhood, sleep")
+
+
+def expected(db, where=''):
+    rows = fetch_all(db, f"SELECT id, CAST(strftime('%s', beck_date || ' ' || beck_time) AS INTEGER), "
+                         f"beck_summary, {ITEMS_SQL} FROM beck_table {where}")
+    return ([row[0] for row in rows], [row[1] for row in rows], [row[2] for row in rows],
+            [list(row[3:]) for row in rows])
+
+
+def as_lists(rows):
+    return rows.ids.tolist(), rows.timestamps.tolist(), rows.summaries.tolist(), rows.items.tolist()
+
+
+def test_range_latest_and_by_id_match_sql(data_manager):
+    data_manager.insert_many_into_beck_table(beck_rows(120))
+    db = data_manager.db
+    assert as_lists(data_manager.becks_between('2020-01-10', '2020-01-20')) == expected(
+        db, "WHERE beck_date BETWEEN '2020-01-10' AND '2020-01-20' ORDER BY beck_date, beck_time, id")
+    assert as_lists(data_manager.becks_between()) == expected(db, "ORDER BY beck_date, beck_time, id")
+    assert as_lists(data_manager.latest_becks(7)) == expected(
+        db, "WHERE id IN (SELECT id FROM beck_table ORDER BY beck_date DESC, beck_time DESC, id DESC "
+            "LIMIT 7) ORDER BY beck_date, beck_time, id")
+    assert as_lists(data_manager.becks_by_id([90, 3, 3, 999, 41])) == expected(
+        db, "WHERE id IN (3, 41, 90) ORDER BY id")
+    assert len(data_manager.becks_by_id([])) == 0
+
+
+def test_missing_values_come_back_as_markers(data_manager):
+    data_manager.insert_many_into_beck_table(beck_rows(3))
+    fetch_all(data_manager.db, "UPDATE beck_table SET beck_summary = NULL, sadness = 9 WHERE id = 2")
+    rows = data_manager.becks_by_id([1, 2])
+    assert rows.summaries.tolist()[1] == -1
+    assert rows.items[1].tolist() == [-1] * 12 and (rows.items[0] >= 0).all()
+
+
+def test_histogram_matches_sql(data_manager):
+    data_manager.insert_many_into_beck_table(beck_rows(150))
+    counts = np.zeros(SUMMARY_MAX + 1, dtype=np.int64)
+    for score, count in fetch_all(data_manager.db, "SELECT beck_summary, COUNT(*) FROM beck_table "
+                                                   "WHERE beck_date >= '2020-01-15' GROUP BY 1"):
+        counts[score] = count
+    assert np.array_equal(data_manager.summary_histogram('2020-01-15'), counts)
+    assert data_manager.summary_histogram().sum() == 150
+
+
+def test_query_cache_reuses_and_evicts_prepared_queries(data_manager):
+    cache = data_manager.queries
+    data_manager.insert_many_into_beck_table(beck_rows(30))
+    first = cache.get("SELECT COUNT(*) FROM beck_table")
+    assert cache.get("SELECT COUNT(*) FROM beck_table") is first
+    assert cache.run("SELECT COUNT(*) FROM beck_table WHERE id > ?", [10], 1) == [(20,)]
+    for limit in range(cache.size):
+        assert cache.run(f"SELECT id FROM beck_table LIMIT {limit}", [], 1) is not None
+    assert cache.get("SELECT COUNT(*) FROM beck_table") is not first
+    assert cache.get("SELECT nothing FROM nowhere") is None
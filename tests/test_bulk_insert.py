@@ -0,0 +1,69 @@
+import logging
+import sqlite3
+
+import pytest
+
+from beck_core.items import BECK_COLUMNS
+from database.bulk_load import (CREATE_DEFERRED_TABLE, DEFERRED_TABLE, bulk_insert_beck_rows,
+                                connect_for_bulk_load, repair_interrupted_load)
+
+from conftest import beck_rows, fetch_all
+
+
+class UnreadableRow(tuple):
+    def __getitem__(self, index):
+        raise RuntimeError("unreadable row")
+
+
+def test_insert_many_reports_rows_and_rate(data_manager, caplog):
+    caplog.set_level(logging.INFO, logger='logger_setup')
+    assert data_manager.insert_many_into_beck_table(beck_rows(30), chunk_size=8) == 30
+    record, = [record for record in caplog.records if getattr(record, 'operation', None) == 'beck_table.insert_many']
+    assert record.rows == 30 and record.duration_ms >= 0
+    assert "30 rows in" in record.getMessage() and "rows/sec" in record.getMessage()
+    assert len(data_manager.becks_between()) == 30
+
+
+def test_failed_deferred_load_rolls_back_and_restores_the_schema(open_manager, tmp_path):
+    open_manager().close()
+    connection = connect_for_bulk_load(str(tmp_path / 'beck.db'))
+    schema_sql = "SELECT type, name FROM sqlite_master WHERE tbl_name = 'beck_table' ORDER BY name"
+    schema = connection.execute(schema_sql).fetchall()
+    rows = beck_rows(100)
+    rows[80] = UnreadableRow(rows[80])
+    with pytest.raises(RuntimeError):
+        bulk_insert_beck_rows(connection, rows, chunk_size=64, defer_indexes=True)
+    assert not connection.in_transaction
+    assert connection.execute(schema_sql).fetchall() == schema
+    assert connection.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (DEFERRED_TABLE,)).fetchall() == []
+    assert connection.execute("SELECT SUM(row_count) FROM beck_rollup "
+                              "WHERE granularity = 'day'").fetchone() == (64,)
+    assert connection.execute("SELECT COUNT(*) FROM beck_table").fetchone() == (64,)
+    connection.close()
+
+
+def test_killed_deferred_load_is_repaired_before_opening(open_manager, tmp_path):
+    path = str(tmp_path / 'beck.db')
+    assert not repair_interrupted_load(path)
+    manager = open_manager()
+    manager.insert_many_into_beck_table(beck_rows(60))
+    manager.close()
+    # What a load killed between dropping the index and trigger and putting them back leaves
+    connection = sqlite3.connect(path, isolation_level=None)
+    connection.execute(CREATE_DEFERRED_TABLE)
+    connection.execute(f"INSERT INTO {DEFERRED_TABLE} SELECT type, name, sql FROM sqlite_master "
+                       f"WHERE name IN ('idx_beck_summary', 'beck_rollup_insert')")
+    connection.execute("DROP INDEX idx_beck_summary")
+    connection.execute("DROP TRIGGER beck_rollup_insert")
+    connection.executemany(f"INSERT INTO beck_table({', '.join(BECK_COLUMNS)}, beck_timestamp) "
+                           f"VALUES ({', '.join('?' * (len(BECK_COLUMNS) + 1))})",
+                           [(*row, f"{row[0]}T{row[1]}") for row in beck_rows(30, seed=2, first_day=21)])
+    connection.close()
+
+    assert repair_interrupted_load(path)
+    assert not repair_interrupted_load(path)
+    manager = open_manager()
+    assert fetch_all(manager.db, "SELECT name FROM sqlite_master WHERE name IN "
+                                 "('idx_beck_summary', 'beck_rollup_insert') ORDER BY name") == [
+        ('beck_rollup_insert',), ('idx_beck_summary',)]
+    assert fetch_all(manager.db, "SELECT SUM(row_count) FROM beck_rollup WHERE granularity = 'day'") == [(90,)]
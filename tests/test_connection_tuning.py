@@ -0,0 +1,12 @@
+import logging
+
+from database.database_utility.connection_tuning import apply_connection_pragmas
+
+
+def test_settings_are_logged_at_the_default_level(data_manager, caplog):
+    assert logging.getLogger().level == logging.ERROR
+    effective = apply_connection_pragmas(data_manager.db, {'synchronous': 1, 'cache_size': -2000})
+    assert effective == {'synchronous': 1, 'cache_size': -2000}
+    record, = [record for record in caplog.records if record.name == 'logger_setup.connection']
+    assert record.levelno == logging.INFO
+    assert "synchronous=1, cache_size=-2000" in record.getMessage()
@@ -0,0 +1,63 @@
+from PyQt6.QtCore import Qt
+
+from database.db_worker import DatabaseWorker
+
+from conftest import beck_rows, fetch_all
+
+
+def run_batch(tmp_path, submit):
+    """
+    Queues commands before the worker starts, so it drains them as one batch, and returns
+    the signals it emitted by name.
+    """
+    worker = DatabaseWorker(str(tmp_path / 'beck.db'), f"worker_{tmp_path.name}")
+    emitted = {}
+    for name in ('inserted', 'deleted', 'restored', 'selected', 'failed'):
+        getattr(worker, name).connect(lambda *args, name=name: emitted.setdefault(name, []).append(args),
+                                      Qt.ConnectionType.DirectConnection)
+    submit(worker)
+    worker.start()
+    worker.stop()
+    return emitted
+
+
+def test_pending_commands_are_coalesced(qt_app, open_manager, tmp_path):
+    rows = beck_rows(12)
+    count_sql = "SELECT id, beck_summary FROM beck_table ORDER BY id"
+
+    def submit(worker):
+        for row in rows:
+            worker.submit_insert(*row)
+        worker.submit_select('view', 1, count_sql, [], 2)
+        worker.submit_delete([2, 3])
+        worker.submit_delete([5])
+        worker.submit_select('view', 2, count_sql, [], 2)
+        worker.submit_select('other', 7, "SELECT COUNT(*) FROM beck_table WHERE id > ?", [10], 1)
+
+    emitted = run_batch(tmp_path, submit)
+    assert 'failed' not in emitted
+    assert emitted['inserted'] == [(12,)]
+    (ids, deleted), = emitted['deleted']
+    assert ids == [2, 3, 5] and len(deleted) == 3
+    # Only the newest select per key runs, after the writes of the batch
+    remaining = [(id_, row[-1]) for id_, row in enumerate(rows, start=1) if id_ not in (2, 3, 5)]
+    assert emitted['selected'] == [('view', 2, remaining), ('other', 7, [(2,)])]
+    assert fetch_all(open_manager().db, count_sql) == remaining
+
+
+def test_restore_follows_inserts_and_precedes_deletes(qt_app, open_manager, tmp_path):
+    manager = open_manager()
+    manager.insert_many_into_beck_table(beck_rows(6))
+    deleted = manager.delete_from_beck_table([1, 2])
+    manager.close()
+
+    def submit(worker):
+        worker.submit_delete([1])
+        worker.submit_restore(deleted)
+        worker.submit_insert(*beck_rows(1, seed=9, first_day=20)[0])
+
+    emitted = run_batch(tmp_path, submit)
+    assert (emitted['inserted'], emitted['restored']) == ([(1,)], [(2,)])
+    assert emitted['deleted'][0][0] == [1]
+    assert fetch_all(open_manager().db, "SELECT id FROM beck_table ORDER BY id") == [
+        (2,), (3,), (4,), (5,), (6,), (7,)]
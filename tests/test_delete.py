@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+import pytest
+from PyQt6.QtCore import QItemSelection, QItemSelectionModel
+from PyQt6.QtWidgets import QTableView
+
+from database.database_utility.delete_records import delete_selected_rows
+from database.database_utility.paged_model import PagedSqlTableModel
+
+from conftest import beck_rows, fetch_all
+
+TABLE_SQL = "SELECT * FROM beck_table ORDER BY id"
+ROLLUPS_SQL = "SELECT * FROM beck_rollup ORDER BY granularity, period_start"
+
+
+def test_delete_and_undo_round_trip(data_manager):
+    data_manager.insert_many_into_beck_table(beck_rows(90))
+    fetch_all(data_manager.db, "UPDATE beck_table SET beck_summary = NULL WHERE id = 30")
+    table, rollups = fetch_all(data_manager.db, TABLE_SQL), fetch_all(data_manager.db, ROLLUPS_SQL)
+    ids = [*range(1, 91, 3), 30, 30, 500]
+
+    deleted = data_manager.delete_from_beck_table(ids)
+    assert sorted(deleted.ids) == sorted(set(ids) - {500})
+    assert sorted(row[:15] for row in deleted.rows()) == sorted(row[:15] for row in table if row[0] in ids)
+    assert fetch_all(data_manager.db, "SELECT COUNT(*) FROM beck_table") == [(90 - len(deleted),)]
+
+    assert data_manager.restore_beck_rows(deleted) == len(deleted)
+    assert fetch_all(data_manager.db, TABLE_SQL) == table
+    assert fetch_all(data_manager.db, ROLLUPS_SQL) == rollups
+
+
+@pytest.fixture
+def window(data_manager):
+    data_manager.insert_many_into_beck_table(beck_rows(600))
+    view = QTableView()
+    model = PagedSqlTableModel('beck_table', page_size=64, db=data_manager.db)
+    model.select()
+    view.setModel(model)
+    while model.canFetchMore():
+        model.fetchMore()
+    yield SimpleNamespace(beck_tableview=view, becks_model=model)
+    view.deleteLater()
+
+
+def select(view, ranges):
+    model = view.model()
+    selection = QItemSelection()
+    for top, bottom, left, right in ranges:
+        selection.select(model.index(top, left), model.index(bottom, right))
+    view.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.Select)
+
+
+@pytest.mark.parametrize('step, resets', [(1, False), (10, False), (2, True)])
+def test_delete_selected_rows(data_manager, window, step, resets):
+    model, last = window.becks_model, window.becks_model.columnCount() - 1
+    model_resets = []
+    model.modelReset.connect(lambda: model_resets.append(1))
+    rows = range(0, 400, step)
+    select(window.beck_tableview, [(row, row, 0, last) for row in rows])
+    # A whole row selected in two pieces is deleted, a single cell is not
+    select(window.beck_tableview, [(401, 401, 0, 3), (401, 401, 4, last), (403, 403, 2, 2)])
+    deleted_ids = {model.row_id(row) for row in (*rows, 401)}
+    expected = [id_ for id_, in fetch_all(data_manager.db, "SELECT id FROM beck_table ORDER BY id")
+                if id_ not in deleted_ids]
+
+    delete_selected_rows(window, 'beck_tableview', 'becks_model')
+    assert [model.row_id(row) for row in range(model.rowCount())] == expected
+    assert fetch_all(data_manager.db, "SELECT id FROM beck_table ORDER BY id") == [(id_,) for id_ in expected]
+    assert not window.beck_tableview.selectionModel().hasSelection()
+    # Many separate runs are removed under one reset, a few one by one
+    assert bool(model_resets) == resets
@@ -0,0 +1,75 @@
+from database.journal import RECORD, BeckJournal, decode_records, encode_record, read_journal
+
+from conftest import beck_rows, fetch_all
+
+
+def test_records_round_trip():
+    rows = beck_rows(20)
+    data = b''.join(encode_record(row) for row in rows)
+    assert len(data) == 20 * RECORD.size
+    assert decode_records(data) == (rows, len(data))
+
+
+def test_corrupt_record_stops_decoding():
+    rows = beck_rows(3)
+    data = bytearray(b''.join(encode_record(row) for row in rows))
+    data[RECORD.size + 4] ^= 0xFF
+    assert decode_records(bytes(data)) == (rows[:1], RECORD.size)
+
+
+def test_torn_tail_is_ignored():
+    rows = beck_rows(3)
+    data = b''.join(encode_record(row) for row in rows)
+    assert decode_records(data[:-5]) == (rows[:2], 2 * RECORD.size)
+
+
+def test_missing_journal_reads_empty(tmp_path):
+    assert read_journal(str(tmp_path / 'absent.bin')) == []
+
+
+def test_discard_keeps_skipped_and_later_records(tmp_path):
+    rows = beck_rows(6)
+    journal = BeckJournal(str(tmp_path / 'journal.bin'), fsync=False)
+    for row in rows[:4]:
+        journal.append(row)
+    journal.discard(2, skip=1)
+    for row in rows[4:]:
+        journal.append(row)
+    journal.close()
+    assert read_journal(journal.path) == [rows[0], rows[3], *rows[4:]]
+
+
+def test_replay_inserts_missing_rows_and_empties_journal(open_manager, tmp_path):
+    rows = beck_rows(10)
+    manager = open_manager()
+    manager.insert_many_into_beck_table(rows[:4])
+    manager.close()
+    path = str(tmp_path / 'journal.bin')
+    with open(path, 'wb') as handle:
+        # The first rows were committed before the crash, the last record is torn
+        handle.write(b''.join(encode_record(row) for row in rows) + encode_record(rows[0])[:7])
+
+    manager = open_manager(journal_path=path)
+    stored = fetch_all(manager.db, "SELECT beck_date, beck_time, sadness, outlook, guilt, solitude, "
+                                   "sexdrive, hygiene, decisiveness, effort, interest, pessimism, "
+                                   "victimhood, sleep, beck_summary FROM beck_table ORDER BY id")
+    assert stored == rows
+    with open(path, 'rb') as handle:
+        assert handle.read() == b''
+    assert manager.replay_journal(path) == 0
+
+
+def test_replay_keeps_commits_made_in_the_same_second(open_manager, tmp_path):
+    first, second = beck_rows(2, seed=5)
+    second = (*first[:2], *second[2:])
+    rows = [first, second, second]
+    manager = open_manager()
+    manager.insert_many_into_beck_table([first, second])
+    manager.close()
+    path = str(tmp_path / 'journal.bin')
+    with open(path, 'wb') as handle:
+        handle.write(b''.join(encode_record(row) for row in rows))
+
+    manager = open_manager(journal_path=path)
+    stored = fetch_all(manager.db, "SELECT beck_summary FROM beck_table ORDER BY id")
+    assert stored == [(first[-1],), (second[-1],), (second[-1],)]
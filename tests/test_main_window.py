@@ -0,0 +1,21 @@
+import pytest
+
+
+@pytest.fixture
+def window(qt_app):
+    from ui.main_window import MainWindow
+    window = MainWindow()
+    yield window
+    window.close()
+
+
+def test_commit_right_after_a_slider_move_stores_the_new_summary(window, monkeypatch):
+    inserted = []
+    monkeypatch.setattr(window, 'queue_beck_insert', lambda *row: inserted.append(row))
+    for slider in window.beck_sliders:
+        slider.setValue(2)
+    window.sadness.setValue(3)
+    assert window.summary_timer.isActive()
+    window.actionCommit.trigger()
+    (row,) = inserted
+    assert row[-1] == sum(row[2:-1]) == 25
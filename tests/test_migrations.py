@@ -0,0 +1,66 @@
+import sqlite3
+
+from beck_core.items import BECK_COLUMNS
+from database.database_utility import migrations
+from database.database_utility.migrations import SCHEMA_VERSION, apply_migrations, get_schema_version
+
+from conftest import beck_rows, fetch_all
+
+SCHEMA_SQL = ("SELECT type, name FROM sqlite_master WHERE tbl_name IN ('beck_table', 'beck_rollup') "
+              "AND sql IS NOT NULL ORDER BY type, name")
+
+
+def create_unversioned_database(path, rows):
+    """
+    Creates beck_table as it was before the first migration, with rows in it.
+    """
+    connection = sqlite3.connect(path)
+    connection.execute(f"CREATE TABLE beck_table (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                       f"{', '.join(f'{name} INTEGER' for name in BECK_COLUMNS)})")
+    connection.executemany(f"INSERT INTO beck_table({', '.join(BECK_COLUMNS)}) "
+                           f"VALUES ({', '.join('?' * len(BECK_COLUMNS))})", rows)
+    connection.commit()
+    connection.close()
+
+
+def test_new_database_is_at_schema_version(data_manager):
+    assert get_schema_version(data_manager.db) == SCHEMA_VERSION
+    assert fetch_all(data_manager.db, SCHEMA_SQL) == [
+        ('index', 'idx_beck_date_time'), ('index', 'idx_beck_summary'), ('index', 'idx_beck_timestamp'),
+        ('table', 'beck_rollup'), ('table', 'beck_table'),
+        ('trigger', 'beck_rollup_delete'), ('trigger', 'beck_rollup_insert'),
+        ('trigger', 'beck_rollup_update_new'), ('trigger', 'beck_rollup_update_old'),
+        ('trigger', 'beck_table_timestamp_update')]
+
+
+def test_unversioned_database_is_migrated_and_backfilled(open_manager, tmp_path):
+    rows = beck_rows(90)
+    create_unversioned_database(tmp_path / 'beck.db', rows)
+    manager = open_manager()
+    assert get_schema_version(manager.db) == SCHEMA_VERSION
+    assert fetch_all(manager.db, "SELECT COUNT(*) FROM beck_table "
+                                 "WHERE beck_timestamp = beck_date || 'T' || beck_time") == [(90,)]
+    assert fetch_all(manager.db, "SELECT granularity, SUM(row_count) FROM beck_rollup "
+                                 "GROUP BY granularity ORDER BY granularity") == [
+        ('day', 90), ('month', 90), ('week', 90)]
+
+
+def test_timestamp_follows_inserts_and_edits(data_manager):
+    data_manager.insert_into_beck_table(*beck_rows(1)[0])
+    data_manager.insert_many_into_beck_table(beck_rows(2, seed=4, first_day=9))
+    fetch_all(data_manager.db, "UPDATE beck_table SET beck_time = '23:59:59' WHERE id = 2")
+    assert fetch_all(data_manager.db, "SELECT COUNT(*) FROM beck_table "
+                                      "WHERE beck_timestamp IS NOT beck_date || 'T' || beck_time") == [(0,)]
+
+
+def test_failed_migration_leaves_the_version(data_manager, monkeypatch):
+    monkeypatch.setattr(migrations, 'MIGRATIONS', [
+        *migrations.MIGRATIONS,
+        (SCHEMA_VERSION + 1, "adds a table, then fails", [
+            "CREATE TABLE beck_extra (id INTEGER)",
+            "INSERT INTO no_such_table VALUES (1)",
+        ]),
+    ])
+    assert apply_migrations(data_manager.db) == SCHEMA_VERSION
+    assert get_schema_version(data_manager.db) == SCHEMA_VERSION
+    assert fetch_all(data_manager.db, "SELECT name FROM sqlite_master WHERE name = 'beck_extra'") == []
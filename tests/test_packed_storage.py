@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+import tracker_config as tkc
+from beck_core.items import BECK_COLUMNS, ITEM_COUNT
+from beck_core.packing import PACKED_MAX, pack_items, packed_summaries, unpack_items
+from database.database_utility.packed_storage import is_packed, set_packed_storage
+
+from conftest import beck_rows, fetch_all
+
+ROWS_SQL = f"SELECT id, {', '.join(BECK_COLUMNS)}, beck_timestamp FROM beck_table ORDER BY id"
+ROLLUPS_SQL = "SELECT * FROM beck_rollup ORDER BY granularity, period_start"
+
+
+def test_pack_round_trip():
+    items = np.random.default_rng(0).integers(0, 4, size=(1000, ITEM_COUNT))
+    packed = pack_items(items)
+    assert packed.min() >= 0 and packed.max() <= PACKED_MAX
+    assert np.array_equal(unpack_items(packed), items)
+    assert np.array_equal(packed_summaries(packed), items.sum(axis=1))
+    assert pack_items([[3] * ITEM_COUNT])[0] == PACKED_MAX
+
+
+def test_pack_rejects_out_of_range_items():
+    with pytest.raises(ValueError):
+        pack_items([[4] + [0] * (ITEM_COUNT - 1)])
+
+
+def test_pack_and_unpack_keep_rows_and_rollups(data_manager):
+    data_manager.insert_many_into_beck_table(beck_rows(200))
+    rows = fetch_all(data_manager.db, ROWS_SQL)
+    rollups = fetch_all(data_manager.db, ROLLUPS_SQL)
+
+    assert set_packed_storage(data_manager.db, True)
+    assert is_packed(data_manager.db)
+    assert fetch_all(data_manager.db, ROWS_SQL) == rows
+    assert fetch_all(data_manager.db, ROLLUPS_SQL) == rollups
+
+    assert set_packed_storage(data_manager.db, False)
+    assert not is_packed(data_manager.db)
+    assert fetch_all(data_manager.db, ROWS_SQL) == rows
+    assert fetch_all(data_manager.db, ROLLUPS_SQL) == rollups
+
+
+def test_writes_through_the_packed_view(data_manager):
+    data_manager.insert_many_into_beck_table(beck_rows(100))
+    assert set_packed_storage(data_manager.db, True)
+
+    data_manager.insert_into_beck_table(*beck_rows(1, seed=5, first_day=60)[0])
+    data_manager.insert_into_beck_table('2021-01-01', '10:00:00', 4, *[0] * (ITEM_COUNT - 1), 4)
+    deleted = data_manager.delete_from_beck_table([3, 4, 5])
+    assert data_manager.restore_beck_rows(deleted) == 3
+    fetch_all(data_manager.db, "UPDATE beck_table SET sadness = 0, beck_date = '2020-04-01' WHERE id = 7")
+    rows = fetch_all(data_manager.db, ROWS_SQL)
+    assert len(rows) == 101
+    assert rows[6][1] == '2020-04-01' and rows[6][-2] == sum(rows[6][3:3 + ITEM_COUNT])
+
+    rollups = fetch_all(data_manager.db, ROLLUPS_SQL)
+    assert data_manager.rebuild_rollups()
+    assert fetch_all(data_manager.db, ROLLUPS_SQL) == rollups
+
+    assert set_packed_storage(data_manager.db, False)
+    assert fetch_all(data_manager.db, ROWS_SQL) == rows
+    data_manager.insert_into_beck_table(*beck_rows(1, seed=6, first_day=70)[0])
+    assert fetch_all(data_manager.db, "SELECT MAX(id) FROM beck_table") == [(102,)]
+
+
+def test_unpackable_rows_stay_plain(data_manager):
+    data_manager.insert_many_into_beck_table(beck_rows(10))
+    data_manager.insert_into_beck_table('2021-01-01', None, *[1] * ITEM_COUNT, ITEM_COUNT)
+    assert not set_packed_storage(data_manager.db, True)
+    assert not is_packed(data_manager.db)
+
+
+def test_storage_follows_config_on_open(open_manager, monkeypatch):
+    open_manager().insert_many_into_beck_table(beck_rows(30))
+    monkeypatch.setattr(tkc, 'PACKED_STORAGE', True)
+    manager = open_manager()
+    assert is_packed(manager.db)
+    assert len(manager.becks_between()) == 30
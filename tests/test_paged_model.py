@@ -0,0 +1,95 @@
+import pytest
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtSql import QSqlQuery
+
+from database.database_utility.paged_model import PagedSqlTableModel, read_rows
+
+from conftest import beck_rows, fetch_all
+
+
+@pytest.fixture
+def model(data_manager):
+    data_manager.insert_many_into_beck_table(beck_rows(60))
+    # Ties and NULLs in the sort column, so pages break inside runs of equal keys
+    fetch_all(data_manager.db, "UPDATE beck_table SET beck_summary = NULL WHERE id % 7 = 0")
+    fetch_all(data_manager.db, "UPDATE beck_table SET beck_summary = 20 WHERE id % 5 = 0")
+    model = PagedSqlTableModel('beck_table', page_size=4, db=data_manager.db)
+    model.select()
+    return model
+
+
+def all_ids(model):
+    while model.canFetchMore():
+        model.fetchMore()
+    return [model.row_id(row) for row in range(model.rowCount())]
+
+
+class HeldWorker(QObject):
+    """
+    Stands in for DatabaseWorker and holds each select until the test delivers it.
+    """
+    selected = pyqtSignal(str, int, list)
+
+    def __init__(self):
+        super().__init__()
+        self.selects = []
+
+    def submit_select(self, key, token, sql, binds, width):
+        self.selects.append((key, token, sql, binds, width))
+
+    def deliver(self, db):
+        key, token, sql, binds, width = self.selects.pop()
+        query = QSqlQuery(db)
+        query.prepare(sql)
+        for value in binds:
+            query.addBindValue(value)
+        assert query.exec(), query.lastError().text()
+        self.selected.emit(key, token, read_rows(query, width))
+
+
+@pytest.mark.parametrize('column', ['beck_summary', 'beck_date', 'id'])
+@pytest.mark.parametrize('order, direction', [(Qt.SortOrder.AscendingOrder, 'ASC'),
+                                              (Qt.SortOrder.DescendingOrder, 'DESC')])
+def test_pages_follow_sql_order_through_nulls_and_ties(data_manager, model, column, order, direction):
+    model.sort(model.fieldIndex(column), order)
+    tie_break = f", id {direction}" if column != 'id' else ''
+    expected = fetch_all(data_manager.db, f"SELECT id FROM beck_table "
+                                          f"ORDER BY {column} {direction}{tie_break}")
+    assert all_ids(model) == [id_ for id_, in expected]
+
+
+def test_filtered_pages_follow_sql_order(data_manager, model):
+    model.set_filter("beck_summary IS NULL OR beck_summary >= ?", [20])
+    model.sort(model.fieldIndex('beck_summary'), Qt.SortOrder.DescendingOrder)
+    expected = fetch_all(data_manager.db, "SELECT id FROM beck_table WHERE beck_summary IS NULL "
+                                          "OR beck_summary >= 20 ORDER BY beck_summary DESC, id DESC")
+    assert len(expected) > 2 * model.page_size
+    assert all_ids(model) == [id_ for id_, in expected]
+
+
+def test_no_pages_are_fetched_while_a_worker_sort_is_in_flight(data_manager, model):
+    worker = HeldWorker()
+    model.attach_worker(worker)
+    model.fetchMore()
+    shown = [model.row_id(row) for row in range(model.rowCount())]
+    model.sort(model.fieldIndex('beck_summary'), Qt.SortOrder.DescendingOrder)
+    assert not model.canFetchMore()
+    model.fetchMore()
+    assert [model.row_id(row) for row in range(model.rowCount())] == shown
+    worker.deliver(data_manager.db)
+    assert model.rowCount() == model.page_size and model.canFetchMore()
+    expected = fetch_all(data_manager.db, "SELECT id FROM beck_table ORDER BY beck_summary DESC, id DESC")
+    assert all_ids(model) == [id_ for id_, in expected]
+
+
+def test_repeated_sort_resets_once(model):
+    resets = []
+    model.modelReset.connect(lambda: resets.append(1))
+    column = model.fieldIndex('beck_date')
+    model.sort(column, Qt.SortOrder.DescendingOrder)
+    model.sort(column, Qt.SortOrder.DescendingOrder)
+    assert len(resets) == 1
+    model.sort(column, Qt.SortOrder.AscendingOrder)
+    assert len(resets) == 2
+    model.select()
+    assert len(resets) == 3
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from database.profile_store import ProfileStore
+
+from conftest import beck_rows
+
+
+@pytest.fixture
+def store(qt_app, tmp_path):
+    store = ProfileStore(str(tmp_path / 'profiles'), pool_size=2)
+    yield store
+    store.close()
+
+
+def test_profiles_get_their_own_shard(store):
+    first = store.create_profile('patient/1', 'First')
+    second = store.create_profile("patient '2'")
+    assert store.create_profile('patient/1') == first
+    assert os.path.dirname(first) == store.profile_dir and os.path.isfile(first) and first != second
+    assert store.profiles() == [('patient/1', 'First'), ("patient '2'", "patient '2'")]
+    assert store.shard_path('nobody') is None
+    with pytest.raises(KeyError):
+        store.data_manager('nobody')
+
+
+def test_pool_keeps_the_most_recently_used_shards(store):
+    for profile in ('a', 'b', 'c'):
+        store.create_profile(profile)
+    assert list(store._pool) == ['b', 'c']
+    store.data_manager('b')
+    store.data_manager('a')
+    assert list(store._pool) == ['b', 'a']
+    store.data_manager('a').insert_many_into_beck_table(beck_rows(5))
+    store.release('a')
+    assert list(store._pool) == ['b']
+    assert len(store.data_manager('a').becks_between()) == 5
+
+
+def test_summaries_fan_out_over_shards(store):
+    for profile in ('a', 'b', 'c'):
+        store.create_profile(profile)
+    rows = {'a': beck_rows(6), 'b': beck_rows(9, seed=2, first_day=4)}
+    for profile, profile_rows in rows.items():
+        store.data_manager(profile).insert_many_into_beck_table(profile_rows)
+    store.release('c')
+    os.remove(store.shard_path('c'))
+    summaries = store.summaries()
+    assert sorted(summaries) == ['a', 'b']
+    for profile, profile_rows in rows.items():
+        scores = [row[-1] for row in profile_rows]
+        summary = summaries[profile]
+        assert (summary.count, summary.low, summary.high) == (len(rows[profile]), min(scores), max(scores))
+        assert summary.mean == pytest.approx(sum(scores) / len(scores))
+        assert summary.last == max(f"{row[0]}T{row[1]}" for row in profile_rows)
+    assert store._pool == {}
@@ -0,0 +1,60 @@
+import pytest
+
+from database.bulk_load import bulk_insert_beck_rows, connect_for_bulk_load
+
+from conftest import beck_rows, fetch_all
+
+ROLLUPS_SQL = "SELECT * FROM beck_rollup ORDER BY granularity, period_start"
+
+
+def assert_rollups_match_rebuild(manager):
+    maintained = fetch_all(manager.db, ROLLUPS_SQL)
+    assert maintained
+    assert manager.rebuild_rollups()
+    assert fetch_all(manager.db, ROLLUPS_SQL) == maintained
+
+
+def test_triggers_match_rebuild_after_writes(data_manager):
+    for row in beck_rows(30, seed=2):
+        data_manager.insert_into_beck_table(*row)
+    data_manager.insert_many_into_beck_table(beck_rows(200, seed=3, first_day=5))
+    deleted = data_manager.delete_from_beck_table(list(range(20, 90)))
+    assert len(deleted) == 70
+    assert_rollups_match_rebuild(data_manager)
+
+    assert data_manager.restore_beck_rows(deleted) == 70
+    fetch_all(data_manager.db, "UPDATE beck_table SET sadness = 3, beck_summary = beck_summary + 1, "
+                               "beck_date = '2020-03-01' WHERE id BETWEEN 100 AND 120")
+    assert_rollups_match_rebuild(data_manager)
+
+
+def test_rebuild_of_a_date_range(data_manager):
+    data_manager.insert_many_into_beck_table(beck_rows(120))
+    maintained = fetch_all(data_manager.db, ROLLUPS_SQL)
+    fetch_all(data_manager.db, "UPDATE beck_rollup SET row_count = 0 WHERE granularity = 'day' AND "
+                               "(period_start BETWEEN '2020-01-10' AND '2020-01-20' "
+                               "OR period_start = '2020-02-10')")
+    assert data_manager.rebuild_rollups('2020-01-10', '2020-01-20')
+    # The day in another week and month is outside the rebuilt periods
+    assert [row[:3] for row in fetch_all(data_manager.db, ROLLUPS_SQL) if row not in maintained] == [
+        ('day', '2020-02-10', 0)]
+
+
+@pytest.mark.parametrize('granularity, period', [('day', 'beck_date'),
+                                                 ('month', "strftime('%Y-%m-01', beck_date)")])
+def test_trend_matches_table(data_manager, granularity, period):
+    data_manager.insert_many_into_beck_table(beck_rows(150))
+    expected = fetch_all(data_manager.db, f"SELECT {period}, COUNT(*), AVG(beck_summary), "
+                                          f"MIN(beck_summary), MAX(beck_summary) FROM beck_table "
+                                          f"GROUP BY 1 ORDER BY 1")
+    trend = [row[:5] for row in data_manager.beck_trend(granularity)]
+    assert [row[:2] + row[3:] for row in trend] == [row[:2] + row[3:] for row in expected]
+    assert [row[2] for row in trend] == pytest.approx([row[2] for row in expected])
+
+
+def test_deferred_bulk_load_rebuilds_rollups(open_manager, tmp_path):
+    open_manager().close()
+    connection = connect_for_bulk_load(str(tmp_path / 'beck.db'))
+    assert bulk_insert_beck_rows(connection, beck_rows(300), chunk_size=64, defer_indexes=True) == 300
+    connection.close()
+    assert_rollups_match_rebuild(open_manager())
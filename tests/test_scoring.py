@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from beck_core.items import ITEM_COUNT, SEVERITY_LABELS, SUMMARY_MAX, severity_band
+from beck_core.record import BeckAssessment
+from beck_core.scoring import (as_item_array, band_counts, item_means, score_items, severity_bands,
+                               valid_rows)
+
+
+def test_score_items_sums_each_row():
+    items = np.random.default_rng(1).integers(0, 4, size=(500, ITEM_COUNT))
+    assert np.array_equal(score_items(items), items.sum(axis=1))
+    assert score_items([[3] * ITEM_COUNT])[0] == SUMMARY_MAX
+
+
+def test_as_item_array_rejects_wrong_width():
+    with pytest.raises(ValueError):
+        as_item_array([[1] * (ITEM_COUNT - 1)])
+
+
+@pytest.mark.parametrize('value', [259, -129, 2 ** 40])
+def test_as_item_array_refuses_values_int8_would_wrap(value):
+    items = [[1] * ITEM_COUNT, [value] + [1] * (ITEM_COUNT - 1)]
+    with pytest.raises(ValueError):
+        as_item_array(items)
+    with pytest.raises(ValueError):
+        score_items(np.array(items, dtype=np.int64))
+
+
+def test_valid_rows_flags_out_of_range_items():
+    items = np.zeros((3, ITEM_COUNT), dtype=np.int8)
+    items[1, 4] = 4
+    items[2, 0] = -1
+    assert valid_rows(items).tolist() == [True, False, False]
+
+
+def test_severity_bands_match_severity_band():
+    totals = np.arange(SUMMARY_MAX + 1)
+    assert [SEVERITY_LABELS[band] for band in severity_bands(totals)] == [
+        severity_band(int(total)) for total in totals]
+
+
+def test_band_counts_cover_every_score():
+    totals = np.arange(SUMMARY_MAX + 1)
+    counts = band_counts(totals)
+    assert list(counts) == list(SEVERITY_LABELS)
+    assert sum(counts.values()) == len(totals)
+    assert counts['minimal'] == 8
+
+
+def test_item_means():
+    assert np.array_equal(item_means(np.zeros((0, ITEM_COUNT))), np.zeros(ITEM_COUNT))
+    assert item_means([[0] * ITEM_COUNT, [3] * ITEM_COUNT]).tolist() == [1.5] * ITEM_COUNT
+
+
+def test_equal_assessments_hash_equal():
+    first = BeckAssessment('2020-01-01', '08:30:00', [1] * ITEM_COUNT)
+    same = BeckAssessment.from_row(first.to_row())
+    other = BeckAssessment('2020-01-01', '08:30:00', [2] * ITEM_COUNT)
+    assert first == same and hash(first) == hash(same)
+    assert len({first, same, other}) == 2
@@ -0,0 +1,43 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from beck_core.synthetic import chunk_rows, iter_synthetic_chunks
+
+
+def concatenated(chunks, key):
+    return np.concatenate([chunk[key] for chunk in chunks])
+
+
+@pytest.mark.parametrize('schedule', ['daily', 'irregular'])
+@pytest.mark.parametrize('rows', [500, 200000])
+def test_rows_fill_the_span_ending_on_end(schedule, rows):
+    chunks = list(iter_synthetic_chunks(rows, seed=3, end=date(2024, 6, 30), years=2,
+                                        schedule=schedule, chunk_size=20000))
+    days = concatenated(chunks, 'beck_date').astype('datetime64[D]')
+    stamps = concatenated(chunks, 'beck_timestamp')
+    assert len(stamps) == rows
+    assert np.datetime64('2022-06-30') <= days.min() and days.max() <= np.datetime64('2024-06-30')
+    assert (np.diff(stamps) > 0).all()
+    assert np.array_equal(concatenated(chunks, 'id'), np.arange(1, rows + 1))
+    summaries = concatenated(chunks, 'beck_summary')
+    assert np.array_equal(summaries, concatenated(chunks, 'items').sum(axis=1))
+
+
+def test_same_seed_and_profile_give_the_same_rows():
+    first, second, other = (list(iter_synthetic_chunks(1000, seed=1, profile=profile, end=date(2024, 1, 1)))
+                            for profile in (0, 0, 1))
+    assert np.array_equal(concatenated(first, 'items'), concatenated(second, 'items'))
+    assert not np.array_equal(concatenated(first, 'beck_timestamp'), concatenated(other, 'beck_timestamp'))
+
+
+def test_chunk_rows_format():
+    chunk = next(iter_synthetic_chunks(10, end=date(2024, 1, 1), years=0.01))
+    row = next(chunk_rows(chunk))
+    assert row[0].startswith('2023-12-') and len(row[1]) == 8 and row[-1] == sum(row[2:-1])
+
+
+def test_too_many_rows_for_the_span():
+    with pytest.raises(ValueError):
+        next(iter_synthetic_chunks(100000, years=0.001))
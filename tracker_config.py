@@ -7,8 +7,53 @@ APPLICATION_NAME = "beckAssesment"
 LOG_FILE = 'beckAssesment.log'
 PRINGLES = 'beckAssesment'  # lol the directory made/placed
 DATEFORMAT = '%d-%b-%y %I:%M:%S %p'  # this is how you want it from now on lolol ok?
-FILE_MODE = 'w'
+LOG_LEVEL = 'ERROR'  # records below this level are dropped before they are formatted
+LOG_MAX_BYTES = 5 * 1024 * 1024  # the log file rotates when it would grow past this
+LOG_BACKUP_COUNT = 3  # rotated log files kept, beckAssesment.log.1 being the newest
+LOG_SLOW_MS = 250  # timed database operations at least this slow are logged as warnings
+DB_SETTINGS_LOG_LEVEL = 'INFO'  # level of the per-connection SQLite settings line, logged even when LOG_LEVEL is higher
 # database
 DB_NAME = 'the_one_and_only_babababy_june17.db'
-
-
+BULK_INSERT_CHUNK_SIZE = 50000  # rows per transaction for bulk inserts
+MODEL_PAGE_SIZE = 256  # rows fetched per page by the data view model
+MODEL_CACHE_PAGES = 64  # pages of rows the data view model keeps in memory
+MODEL_FILTER_CACHE = 8  # first pages of recent filters and sorts the data view model keeps
+MODEL_REMOVE_RESET_RUNS = 64  # past this many separate runs of removed rows the data view model resets
+QUERY_CACHE_SIZE = 16  # prepared statements DataManager's read queries keep per connection
+PACKED_STORAGE = False  # keep beck_table as 2-bit items in one integer per row, behind a view
+# sqlite performance profile, applied to every connection when it is opened
+DB_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',  # safe with WAL; commits no longer fsync the main db file
+    'mmap_size': 268435456,  # 256 MiB of the db file read through the page cache
+    'cache_size': -65536,  # negative values are KiB, so 64 MiB
+    'temp_store': 'MEMORY',
+    'busy_timeout': 5000,  # ms to wait on a lock held by another connection
+}
+DB_WORKER_CONNECTION = 'beck_worker'  # QSqlDatabase connection name of the worker thread
+EXPORT_CHUNK_SIZE = 100000  # rows held in memory at once while exporting
+IMPORT_PROGRESS_EVERY = 50000  # records between importer progress callbacks
+UNDO_DELETE_DEPTH = 10  # deletes that can be undone, newest first
+JOURNAL_FILE = 'beck_journal.bin'  # commits not yet in the database, in the home folder
+JOURNAL_FSYNC = False  # True also survives power loss, at milliseconds per commit
+# profiles: one database shard per patient or profile, indexed by a catalog database
+PROFILE_DIR = 'beck_profiles'  # directory in the home folder holding the catalog and shards
+CATALOG_DB_NAME = 'beck_catalog.db'
+CATALOG_CONNECTION = 'beck_catalog'  # QSqlDatabase connection name prefix of the catalog
+SHARD_CONNECTION_PREFIX = 'beck_shard'  # QSqlDatabase connection name prefix of the shards
+SHARD_POOL_SIZE = 8  # shard connections kept open at once
+PROFILE_FANOUT_WORKERS = 4  # threads used by cross-profile queries
+# backups: gzip snapshots of the database in the home folder, rotated by count
+BACKUP_DIR = 'beck_backups'
+BACKUP_INTERVAL_HOURS = 24  # the app takes a snapshot once the newest one is older than this
+BACKUP_KEEP = 7  # snapshots kept; older ones are deleted after each backup
+BACKUP_CHECK_INTERVAL_MS = 3600000  # how often the running app checks whether a backup is due
+BACKUP_STEP_PAGES = 1024  # database pages copied per step of the online backup
+BACKUP_GZIP_LEVEL = 1  # 1 is about five times faster than 6 for a tenth more bytes
+# performance stats, shown on the hidden page opened with Ctrl+Shift+P
+PERF_STATS_ENABLED = True  # record hot-path latencies; the page can toggle it at runtime
+PERF_RING_SIZE = 1024  # latest samples kept per operation for the percentiles
+# ui
+SUMMARY_REPAINT_INTERVAL_MS = 16  # coalesce slider ticks into one beck_summary repaint per frame
+FILTER_DEBOUNCE_MS = 300  # data view filter edits settle this long before the model is re-queried
+FILTER_DEFAULT_DAYS = 30  # span of the date range when the date filter is first switched on
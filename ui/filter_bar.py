@@ -0,0 +1,118 @@
+from typing import Optional
+
+from PyQt6 import QtWidgets
+from PyQt6.QtCore import QDate, QTimer, pyqtSignal
+
+import tracker_config as tkc
+from beck_core.items import SUMMARY_MAX
+from database.database_utility.beck_filter import beck_filter_clause
+
+
+class BeckFilterBar(QtWidgets.QWidget):
+    """
+    The date range and score filters above the data view.
+
+    Edits restart a single-shot timer, so the model is re-queried once the filters have
+    settled instead of on every spin box tick. The filters are emitted as a WHERE clause
+    for PagedSqlTableModel.set_filter.
+
+    Signals:
+        filter_changed (str, list): The WHERE clause and its bind values.
+
+    """
+    filter_changed = pyqtSignal(str, list)
+
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setObjectName("beck_filter_bar")
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.use_dates = QtWidgets.QCheckBox("Dates", self)
+        self.use_dates.setObjectName("filter_use_dates")
+        layout.addWidget(self.use_dates)
+        today = QDate.currentDate()
+        self.date_from = self._date_edit("filter_date_from", today.addDays(-tkc.FILTER_DEFAULT_DAYS))
+        self.date_to = self._date_edit("filter_date_to", today)
+        layout.addWidget(self.date_from)
+        layout.addWidget(QtWidgets.QLabel("to", self))
+        layout.addWidget(self.date_to)
+
+        layout.addSpacing(12)
+        layout.addWidget(QtWidgets.QLabel("Score", self))
+        self.min_score = self._score_spinbox("filter_min_score", 0)
+        self.max_score = self._score_spinbox("filter_max_score", SUMMARY_MAX)
+        layout.addWidget(self.min_score)
+        layout.addWidget(QtWidgets.QLabel("to", self))
+        layout.addWidget(self.max_score)
+        layout.addStretch(1)
+
+        self.clear_button = QtWidgets.QPushButton("Clear", self)
+        self.clear_button.setObjectName("filter_clear")
+        layout.addWidget(self.clear_button)
+
+        self.debounce = QTimer(self)
+        self.debounce.setSingleShot(True)
+        self.debounce.setInterval(tkc.FILTER_DEBOUNCE_MS)
+        self.debounce.timeout.connect(self.emit_filter)
+
+        self.use_dates.toggled.connect(self.on_use_dates_toggled)
+        self.date_from.dateChanged.connect(self.schedule)
+        self.date_to.dateChanged.connect(self.schedule)
+        self.min_score.valueChanged.connect(self.schedule)
+        self.max_score.valueChanged.connect(self.schedule)
+        self.clear_button.clicked.connect(self.clear)
+        self.on_use_dates_toggled(False)
+
+    def _date_edit(self, name: str, date: QDate) -> QtWidgets.QDateEdit:
+        edit = QtWidgets.QDateEdit(date, self)
+        edit.setObjectName(name)
+        edit.setCalendarPopup(True)
+        edit.setDisplayFormat("yyyy-MM-dd")
+        return edit
+
+    def _score_spinbox(self, name: str, value: int) -> QtWidgets.QSpinBox:
+        spinbox = QtWidgets.QSpinBox(self)
+        spinbox.setObjectName(name)
+        spinbox.setRange(0, SUMMARY_MAX)
+        spinbox.setValue(value)
+        return spinbox
+
+    def on_use_dates_toggled(self, checked: bool) -> None:
+        self.date_from.setEnabled(checked)
+        self.date_to.setEnabled(checked)
+        self.schedule()
+
+    def schedule(self, *_) -> None:
+        """
+        Restarts the debounce timer; the filter is emitted when it runs out.
+        """
+        self.debounce.start()
+
+    def clear(self) -> None:
+        """
+        Switches every filter off and emits the empty filter at once.
+        """
+        for widget in (self.use_dates, self.min_score, self.max_score):
+            widget.blockSignals(True)
+        self.use_dates.setChecked(False)
+        self.date_from.setEnabled(False)
+        self.date_to.setEnabled(False)
+        self.min_score.setValue(0)
+        self.max_score.setValue(SUMMARY_MAX)
+        for widget in (self.use_dates, self.min_score, self.max_score):
+            widget.blockSignals(False)
+        self.emit_filter()
+
+    def emit_filter(self) -> None:
+        """
+        Emits the current filters as a WHERE clause. Reversed ranges are swapped.
+        """
+        self.debounce.stop()
+        date_from = date_to = None
+        if self.use_dates.isChecked():
+            first, last = sorted((self.date_from.date(), self.date_to.date()), key=QDate.toJulianDay)
+            date_from, date_to = first.toString("yyyy-MM-dd"), last.toString("yyyy-MM-dd")
+        low, high = sorted((self.min_score.value(), self.max_score.value()))
+        where, binds = beck_filter_clause(date_from, date_to, low, high)
+        self.filter_changed.emit(where, binds)
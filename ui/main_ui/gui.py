@@ -13,177 +13,11 @@ class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
         MainWindow.setObjectName("MainWindow")
         MainWindow.resize(466, 168)
-        MainWindow.setStyleSheet("QWidget {\n"
-"    background-color: #121212;\n"
-"color:#fff;\n"
-"font:11pt \"Helvetica\";\n"
-"}\n"
-"\n"
-"QLabel {\n"
-"background:transparent;\n"
-"}\n"
-"/* /////////////////////////////////////////////////////////////////////////////\n"
-"                                 QSlider\n"
-"///////////////////////////////////////////////////////////////////////////// */\n"
-"QSlider::groove:horizontal {\n"
-"    height: 10px;\n"
-"    margin: 0px;\n"
-"    background-color: rgba(22,22,22,100);\n"
-"}\n"
-"QSlider::groove:horizontal:hover {\n"
-"    background-color: rgb(32, 32, 32);\n"
-"}\n"
-"QSlider::handle:horizontal {\n"
-"    background-color: rgb(255, 88, 71);\n"
-"    border: none;\n"
-"    height: 10px;\n"
-"    width: 10px;\n"
-"    margin: 0px;\n"
-"    border-radius: 5px;\n"
-"}\n"
-"QSlider::handle:horizontal:hover {\n"
-"    background-color: white;\n"
-"}\n"
-"QSlider::handle:horizontal:pressed {\n"
-"    background-color:white;\n"
-"}\n"
-"\n"
-"/*\n"
-"VERTICAL\n"
-"///////////////////////////////////////////////////////////////////////////// */\n"
-"QSlider::groove:vertical {\n"
-"    border-radius: 11px;\n"
-"    width: 22px;\n"
-"    margin: 0px;\n"
-"    background-color: rgba(33,33,33,100);\n"
-"}\n"
-"\n"
-"QSlider::groove:vertical:hover {\n"
-"    background-color: rgba(44,44,44,100);    \n"
-"}\n"
-"QSlider::handle:vertical {\n"
-"    background-color: rgb(255, 88, 71);\n"
-"    border: none;\n"
-"    height: 22px;\n"
-"    width: 22px;\n"
-"    margin: 0px;\n"
-"    border-radius: 11px;\n"
-"}\n"
-"QSlider::handle:vertical:hover {\n"
-"    background-color: rgb(195, 155, 255);\n"
-"}\n"
-"QSlider::handle:vertical:pressed {\n"
-"    background-color: rgb(255, 121, 198);\n"
-"}\n"
-"\n"
-"/* ////////////////////////////////////////////////////////////////////////////////////////////////\n"
-"                                    QScrollBar\n"
-"//////////////////////////////////////////////////////////////////////////////////////////////// */\n"
-"QScrollBar:horizontal {\n"
-"    border: none;\n"
-"    background:transparent;\n"
-"    height: 12px;\n"
-"    margin: 0px 10px 0px 10px;\n"
-"    border-radius: 3px;\n"
-"}\n"
-"QScrollBar::handle:horizontal {\n"
-"    background: rgb(22,22,22);\n"
-"    min-width:24px;\n"
-"    border-radius: 4px;\n"
-"}\n"
-"QScrollBar::add-line:horizontal {\n"
-"    border: none;\n"
-"    background: transparent;\n"
-"    width: 20px;\n"
-"    border-top-right-radius: 4px;\n"
-"    border-bottom-right-radius: 4px;\n"
-"    subcontrol-position: right;\n"
-"    subcontrol-origin: margin;\n"
-"}\n"
-"QScrollBar::sub-line:horizontal {\n"
-"    border: none;\n"
-"    background: transparent;\n"
-"    width: 20px;\n"
-"    border-top-left-radius: 4px;\n"
-"    border-bottom-left-radius: 4px;\n"
-"    subcontrol-position: left;\n"
-"    subcontrol-origin: margin;\n"
-"}\n"
-"QScrollBar::up-arrow:horizontal, \n"
-"QScrollBar::down-arrow:horizontal {\n"
-"    background: none;\n"
-"}\n"
-"QScrollBar::add-page:horizontal, \n"
-"QScrollBar::sub-page:horizontal {\n"
-"    background: transparent;\n"
-"}\n"
-"QScrollBar:vertical {\n"
-"    border: none;\n"
-"    background-color:transparent;\n"
-"    width: 12px;\n"
-"    margin: 10px 0px 10px 0px;\n"
-"    border-radius: 4px;\n"
-"}\n"
-"QScrollBar::handle:vertical {\n"
-"    background: rgb(22,22,22);\n"
-"    min-height: 12px;\n"
-"    border-radius: 4px;\n"
-"}\n"
-"QScrollBar::add-line:vertical {\n"
-"    border: none;\n"
-"    background: transparent;\n"
-"    height: 20px;\n"
-"    border-bottom-left-radius: 4px;\n"
-"    border-bottom-right-radius: 4px;\n"
-"    subcontrol-position: bottom;\n"
-"    subcontrol-origin: margin;\n"
-"}\n"
-"QScrollBar::sub-line:vertical {\n"
-"    border: none;\n"
-"    background: transparent;\n"
-"    height: 20px;\n"
-"    border-top-left-radius: 4px;\n"
-"    border-top-right-radius: 4px;\n"
-"    subcontrol-position: top;\n"
-"    subcontrol-origin: margin;\n"
-"}\n"
-"QScrollBar::up-arrow:vertical, \n"
-"QScrollBar::down-arrow:vertical {\n"
-"    background: none;\n"
-"}\n"
-"QScrollBar::add-page:vertical, \n"
-"QScrollBar::sub-page:vertical {\n"
-"    background: transparent;\n"
-"}")
         self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
         self.centralwidget.setObjectName("centralwidget")
         self.gridLayout_12 = QtWidgets.QGridLayout(self.centralwidget)
         self.gridLayout_12.setObjectName("gridLayout_12")
         self.stackedWidget = QtWidgets.QStackedWidget(parent=self.centralwidget)
-        self.stackedWidget.setStyleSheet("QTabWidget {\n"
-"background-color: #fff;\n"
-"    border: none;\n"
-"}\n"
-"\n"
-"QTabWidget::pane {\n"
-"    border: none;    \n"
-"    background-color: #fff;\n"
-"}\n"
-"\n"
-"QTabBar::tab {\n"
-"\n"
-"background-color: transparent;\n"
-"\n"
-"}\n"
-"\n"
-"QTabBar::tab:selected {\n"
-"background-color: transparent;\n"
-"}\n"
-"\n"
-"QTabBar::tab:only-one {\n"
-"background-color: transparent;\n"
-"}\n"
-"")
         self.stackedWidget.setObjectName("stackedWidget")
         self.mainpanePage1 = QtWidgets.QWidget()
         self.mainpanePage1.setObjectName("mainpanePage1")
@@ -192,52 +26,6 @@ class Ui_MainWindow(object):
         self.gridLayout_24.setSpacing(0)
         self.gridLayout_24.setObjectName("gridLayout_24")
         self.tabWidget = QtWidgets.QTabWidget(parent=self.mainpanePage1)
-        self.tabWidget.setStyleSheet("\n"
-"    /* ///////////////////////////////////////////////////////////////\n"
-"    QToolTip\n"
-"    /////////////////////////////////////////////////////////////// */\n"
-"    QToolTip {\n"
-"        background: rgba(23,23,23, 150);\n"
-"        border: 1px solid rgb(100,199,211);\n"
-"        border-radius: 5px;\n"
-"        padding:4px;\n"
-"        text-align: left;\n"
-"        color: rgb(100,199,211);\n"
-"    }\n"
-"    \n"
-"QTabWidget {\n"
-"background-color: #fff;\n"
-"    border: none;\n"
-"}\n"
-"\n"
-"QTabWidget::pane {\n"
-"    border: none;    \n"
-"    background-color: #fff;\n"
-"}\n"
-"\n"
-"QTabBar::tab {\n"
-"margin-left:3px;\n"
-"padding-top:2px;\n"
-"padding-bottom:2px;\n"
-"background-color: transparent;\n"
-"    border: none;\n"
-"}\n"
-"\n"
-"QTabBar::tab:selected {\n"
-"background-color: transparent;\n"
-"font-weight:bold;\n"
-"font-size:8pt;\n"
-"}\n"
-"\n"
-"QTabBar::tab:hover {\n"
-"    border-radius: 4px;\n"
-"    \n"
-"}\n"
-"\n"
-"QTabBar::tab:only-one {\n"
-"background-color: transparent;\n"
-"}\n"
-"")
         self.tabWidget.setIconSize(QtCore.QSize(12, 12))
         self.tabWidget.setUsesScrollButtons(True)
         self.tabWidget.setMovable(True)
@@ -256,26 +44,13 @@ class Ui_MainWindow(object):
         self.sadness = QtWidgets.QSlider(parent=self.frame_4)
         self.sadness.setMinimumSize(QtCore.QSize(45, 0))
         self.sadness.setMaximumSize(QtCore.QSize(16777215, 90))
-        self.sadness.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(87,111,215);}\n"
-"QSlider::handle:vertical:hover {background:rgb(127,151,255);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(37,61,165);}\n"
-"QSlider::groove:vertical:hover {background:rgba(87,111,215,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(87,111,215,0.15);}\n"
-"\n"
-"        ")
+        self.sadness.setProperty("beckColor", "sadness")
         self.sadness.setMaximum(3)
         self.sadness.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.sadness.setInvertedAppearance(True)
         self.sadness.setObjectName("sadness")
         self.gridLayout_14.addWidget(self.sadness, 0, 0, 1, 1)
         self.label_15 = QtWidgets.QLabel(parent=self.frame_4)
-        self.label_15.setStyleSheet("")
         self.label_15.setWordWrap(True)
         self.label_15.setObjectName("label_15")
         self.gridLayout_14.addWidget(self.label_15, 0, 1, 1, 1)
@@ -298,26 +73,13 @@ class Ui_MainWindow(object):
         self.victimhood = QtWidgets.QSlider(parent=self.frame)
         self.victimhood.setMinimumSize(QtCore.QSize(45, 0))
         self.victimhood.setMaximumSize(QtCore.QSize(16777215, 90))
-        self.victimhood.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(153,153,255);}\n"
-"QSlider::handle:vertical:hover {background:rgb(193,193,255);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(103,103,205);}\n"
-"QSlider::groove:vertical:hover {background:rgba(153,153,255,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(153,153,255,0.15);}\n"
-"\n"
-"        ")
+        self.victimhood.setProperty("beckColor", "victimhood")
         self.victimhood.setMaximum(3)
         self.victimhood.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.victimhood.setInvertedAppearance(True)
         self.victimhood.setObjectName("victimhood")
         self.gridLayout_13.addWidget(self.victimhood, 0, 0, 1, 1)
         self.label_13 = QtWidgets.QLabel(parent=self.frame)
-        self.label_13.setStyleSheet("")
         self.label_13.setWordWrap(True)
         self.label_13.setObjectName("label_13")
         self.gridLayout_13.addWidget(self.label_13, 0, 1, 1, 1)
@@ -338,26 +100,13 @@ class Ui_MainWindow(object):
         self.gridLayout_7.setContentsMargins(0, 0, 0, 0)
         self.gridLayout_7.setObjectName("gridLayout_7")
         self.label_12 = QtWidgets.QLabel(parent=self.frame1)
-        self.label_12.setStyleSheet("")
         self.label_12.setWordWrap(True)
         self.label_12.setObjectName("label_12")
         self.gridLayout_7.addWidget(self.label_12, 0, 1, 1, 1)
         self.pessimism = QtWidgets.QSlider(parent=self.frame1)
         self.pessimism.setMinimumSize(QtCore.QSize(45, 0))
         self.pessimism.setMaximumSize(QtCore.QSize(16777215, 90))
-        self.pessimism.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(214,157,210);}\n"
-"QSlider::handle:vertical:hover {background:rgb(254,197,250);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(164,107,160);}\n"
-"QSlider::groove:vertical:hover {background:rgba(214,157,210,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(214,157,210,0.15);}\n"
-"\n"
-"        ")
+        self.pessimism.setProperty("beckColor", "pessimism")
         self.pessimism.setMaximum(3)
         self.pessimism.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.pessimism.setInvertedAppearance(True)
@@ -380,26 +129,13 @@ class Ui_MainWindow(object):
         self.gridLayout_8.setContentsMargins(0, 0, 0, 0)
         self.gridLayout_8.setObjectName("gridLayout_8")
         self.label_16 = QtWidgets.QLabel(parent=self.frame_5)
-        self.label_16.setStyleSheet("")
         self.label_16.setWordWrap(True)
         self.label_16.setObjectName("label_16")
         self.gridLayout_8.addWidget(self.label_16, 0, 1, 1, 1)
         self.interest = QtWidgets.QSlider(parent=self.frame_5)
         self.interest.setMinimumSize(QtCore.QSize(45, 0))
         self.interest.setMaximumSize(QtCore.QSize(16777215, 90))
-        self.interest.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(247,198,94);}\n"
-"QSlider::handle:vertical:hover {background:rgb(255,238,134);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(197,148,44);}\n"
-"QSlider::groove:vertical:hover {background:rgba(247,198,94,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(247,198,94,0.15);}\n"
-"\n"
-"        ")
+        self.interest.setProperty("beckColor", "interest")
         self.interest.setMaximum(3)
         self.interest.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.interest.setInvertedAppearance(True)
@@ -423,26 +159,13 @@ class Ui_MainWindow(object):
         self.gridLayout_9.setContentsMargins(0, 0, 0, 0)
         self.gridLayout_9.setObjectName("gridLayout_9")
         self.label_17 = QtWidgets.QLabel(parent=self.frame_6)
-        self.label_17.setStyleSheet("")
         self.label_17.setWordWrap(True)
         self.label_17.setObjectName("label_17")
         self.gridLayout_9.addWidget(self.label_17, 0, 1, 1, 1)
         self.effort = QtWidgets.QSlider(parent=self.frame_6)
         self.effort.setMinimumSize(QtCore.QSize(45, 0))
         self.effort.setMaximumSize(QtCore.QSize(16777215, 90))
-        self.effort.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(255,89,156);}\n"
-"QSlider::handle:vertical:hover {background:rgb(255,129,196);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(205,39,106);}\n"
-"QSlider::groove:vertical:hover {background:rgba(255,89,156,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(255,89,156,0.15);}\n"
-"\n"
-"        ")
+        self.effort.setProperty("beckColor", "effort")
         self.effort.setMaximum(3)
         self.effort.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.effort.setInvertedAppearance(True)
@@ -467,19 +190,7 @@ class Ui_MainWindow(object):
         self.decisiveness = QtWidgets.QSlider(parent=self.frame_7)
         self.decisiveness.setMinimumSize(QtCore.QSize(45, 0))
         self.decisiveness.setMaximumSize(QtCore.QSize(16777215, 90))
-        self.decisiveness.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(120,155,172);}\n"
-"QSlider::handle:vertical:hover {background:rgb(160,195,212);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(70,105,122);}\n"
-"QSlider::groove:vertical:hover {background:rgba(120,155,172,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(120,155,172,0.15);}\n"
-"\n"
-"        ")
+        self.decisiveness.setProperty("beckColor", "decisiveness")
         self.decisiveness.setMaximum(3)
         self.decisiveness.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.decisiveness.setInvertedAppearance(True)
@@ -512,20 +223,7 @@ class Ui_MainWindow(object):
         self.hygiene = QtWidgets.QSlider(parent=self.frame_8)
         self.hygiene.setMinimumSize(QtCore.QSize(45, 0))
         self.hygiene.setMaximumSize(QtCore.QSize(16777215, 90))
-        self.hygiene.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(96,174,106);}\n"
-"QSlider::handle:vertical:hover {background:rgb(136,214,146);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(46,124,56);}\n"
-"QSlider::groove:vertical:hover {background:rgba(96,174,106,0.25);}\n"
-"\n"
-"QSlider::groove:vertical {background:rgba(96,174,106,0.15);}\n"
-"\n"
-"        ")
+        self.hygiene.setProperty("beckColor", "hygiene")
         self.hygiene.setMaximum(3)
         self.hygiene.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.hygiene.setInvertedAppearance(True)
@@ -550,27 +248,13 @@ class Ui_MainWindow(object):
         self.sexdrive = QtWidgets.QSlider(parent=self.frame_9)
         self.sexdrive.setMinimumSize(QtCore.QSize(45, 0))
         self.sexdrive.setMaximumSize(QtCore.QSize(16777215, 90))
-        self.sexdrive.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(229,100,111);}\n"
-"QSlider::handle:vertical:hover {background:rgb(255,140,151);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(179,50,61);}\n"
-"QSlider::groove:vertical:hover {background:rgba(229,100,111,0.25);}\n"
-"\n"
-"QSlider::groove:vertical {background:rgba(229,100,111,0.15);}\n"
-"\n"
-"        ")
+        self.sexdrive.setProperty("beckColor", "sexdrive")
         self.sexdrive.setMaximum(3)
         self.sexdrive.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.sexdrive.setInvertedAppearance(True)
         self.sexdrive.setObjectName("sexdrive")
         self.gridLayout_15.addWidget(self.sexdrive, 0, 0, 1, 1)
         self.label_20 = QtWidgets.QLabel(parent=self.frame_9)
-        self.label_20.setStyleSheet("")
         self.label_20.setWordWrap(True)
         self.label_20.setObjectName("label_20")
         self.gridLayout_15.addWidget(self.label_20, 0, 1, 1, 1)
@@ -591,27 +275,13 @@ class Ui_MainWindow(object):
         self.gridLayout_16.setContentsMargins(0, 0, 0, 0)
         self.gridLayout_16.setObjectName("gridLayout_16")
         self.label_14 = QtWidgets.QLabel(parent=self.frame_10)
-        self.label_14.setStyleSheet("")
         self.label_14.setWordWrap(True)
         self.label_14.setObjectName("label_14")
         self.gridLayout_16.addWidget(self.label_14, 0, 1, 1, 1)
         self.solitude = QtWidgets.QSlider(parent=self.frame_10)
         self.solitude.setMinimumSize(QtCore.QSize(45, 0))
         self.solitude.setMaximumSize(QtCore.QSize(16777215, 90))
-        self.solitude.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(223,133,93);}\n"
-"QSlider::handle:vertical:hover {background:rgb(255,173,133);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(173,83,43);}\n"
-"QSlider::groove:vertical:hover {background:rgba(223,133,93,0.25);}\n"
-"\n"
-"QSlider::groove:vertical {background:rgba(223,133,93,0.15);}\n"
-"\n"
-"        ")
+        self.solitude.setProperty("beckColor", "solitude")
         self.solitude.setMaximum(3)
         self.solitude.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.solitude.setInvertedAppearance(True)
@@ -636,26 +306,13 @@ class Ui_MainWindow(object):
         self.guilt = QtWidgets.QSlider(parent=self.frame_11)
         self.guilt.setMinimumSize(QtCore.QSize(45, 0))
         self.guilt.setMaximumSize(QtCore.QSize(16777215, 90))
-        self.guilt.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(170,129,224);}\n"
-"QSlider::handle:vertical:hover {background:rgb(210,169,255);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(120,79,174);}\n"
-"QSlider::groove:vertical:hover {background:rgba(170,129,224,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(170,129,224,0.15);}\n"
-"\n"
-"        ")
+        self.guilt.setProperty("beckColor", "guilt")
         self.guilt.setMaximum(3)
         self.guilt.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.guilt.setInvertedAppearance(True)
         self.guilt.setObjectName("guilt")
         self.gridLayout_20.addWidget(self.guilt, 0, 0, 1, 1)
         self.label_21 = QtWidgets.QLabel(parent=self.frame_11)
-        self.label_21.setStyleSheet("")
         self.label_21.setWordWrap(True)
         self.label_21.setObjectName("label_21")
         self.gridLayout_20.addWidget(self.label_21, 0, 1, 1, 1)
@@ -674,26 +331,13 @@ class Ui_MainWindow(object):
         self.gridLayout_26.setSpacing(6)
         self.gridLayout_26.setObjectName("gridLayout_26")
         self.label_23 = QtWidgets.QLabel(parent=self.frame_2)
-        self.label_23.setStyleSheet("")
         self.label_23.setWordWrap(True)
         self.label_23.setObjectName("label_23")
         self.gridLayout_26.addWidget(self.label_23, 0, 1, 1, 1)
         self.sleep = QtWidgets.QSlider(parent=self.frame_2)
         self.sleep.setMinimumSize(QtCore.QSize(45, 0))
         self.sleep.setMaximumSize(QtCore.QSize(16777215, 90))
-        self.sleep.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(214,157,210);}\n"
-"QSlider::handle:vertical:hover {background:rgb(254,197,250);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(164,107,160);}\n"
-"QSlider::groove:vertical:hover {background:rgba(214,157,210,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(214,157,210,0.15);}\n"
-"\n"
-"        ")
+        self.sleep.setProperty("beckColor", "sleep")
         self.sleep.setMaximum(3)
         self.sleep.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.sleep.setInvertedAppearance(True)
@@ -716,27 +360,13 @@ class Ui_MainWindow(object):
         self.gridLayout_22.setContentsMargins(0, 0, 0, 0)
         self.gridLayout_22.setObjectName("gridLayout_22")
         self.label_22 = QtWidgets.QLabel(parent=self.frame_12)
-        self.label_22.setStyleSheet("")
         self.label_22.setWordWrap(True)
         self.label_22.setObjectName("label_22")
         self.gridLayout_22.addWidget(self.label_22, 0, 1, 1, 1)
         self.outlook = QtWidgets.QSlider(parent=self.frame_12)
         self.outlook.setMinimumSize(QtCore.QSize(45, 0))
         self.outlook.setMaximumSize(QtCore.QSize(16777215, 90))
-        self.outlook.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(200,129,224);}\n"
-"QSlider::handle:vertical:hover {background:rgb(240,169,255);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(150,79,174);}\n"
-"QSlider::groove:vertical:hover {background:rgba(200,129,224,0.25);}\n"
-"\n"
-"QSlider::groove:vertical {background:rgba(200,129,224,0.15);}\n"
-"\n"
-"        ")
+        self.outlook.setProperty("beckColor", "outlook")
         self.outlook.setMaximum(3)
         self.outlook.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.outlook.setInvertedAppearance(True)
@@ -759,7 +389,6 @@ class Ui_MainWindow(object):
         self.gridLayout_29.setVerticalSpacing(0)
         self.gridLayout_29.setObjectName("gridLayout_29")
         self.altmans_summary_label = QtWidgets.QLabel(parent=self.frame_3)
-        self.altmans_summary_label.setStyleSheet("font-weight:bold;margin-top:4px; margin-bottom:4px;")
         self.altmans_summary_label.setObjectName("altmans_summary_label")
         self.gridLayout_29.addWidget(self.altmans_summary_label, 1, 1, 1, 2, QtCore.Qt.AlignmentFlag.AlignHCenter)
         self.label = QtWidgets.QLabel(parent=self.frame_3)
@@ -792,19 +421,7 @@ class Ui_MainWindow(object):
         self.beck_summary = QtWidgets.QSlider(parent=self.frame_3)
         self.beck_summary.setMinimumSize(QtCore.QSize(45, 90))
         self.beck_summary.setMaximumSize(QtCore.QSize(16777215, 90))
-        self.beck_summary.setStyleSheet("\n"
-"\n"
-"/* ///////////////////////////////////////////////////////////////\n"
-"QSlider Colors\n"
-"/////////////////////////////////////////////////////////////// */\n"
-"\n"
-"QSlider::handle:vertical {background:rgb(244,56,81);}\n"
-"QSlider::handle:vertical:hover {background:rgb(239,116,121);}\n"
-"QSlider::handle:vertical:pressed {background:rgb(149,26,31);}\n"
-"QSlider::groove:vertical:hover {background:rgba(199,76,81,0.25);}\n"
-"QSlider::groove:vertical {background:rgba(199,76,81,0.08);}\n"
-"\n"
-"        ")
+        self.beck_summary.setProperty("beckColor", "beck_summary")
         self.beck_summary.setMaximum(36)
         self.beck_summary.setOrientation(QtCore.Qt.Orientation.Vertical)
         self.beck_summary.setInvertedAppearance(True)
@@ -821,22 +438,6 @@ class Ui_MainWindow(object):
         self.gridLayout_25 = QtWidgets.QGridLayout(self.mainpanePage2)
         self.gridLayout_25.setObjectName("gridLayout_25")
         self.beck_tableview = QtWidgets.QTableView(parent=self.mainpanePage2)
-        self.beck_tableview.setStyleSheet("\n"
-"QTableView {\n"
-"background-color: transparent;\n"
-"selection-background-color: #7e57c2;\n"
-"gridline-color:transparent;\n"
-"color: rgb(77, 15, 26);\n"
-"}\n"
-"QTableView::item {\n"
-"padding: 1px;color: rgb(77, 15, 26);\n"
-"background:rgb(229,100,111);\n"
-"}\n"
-"QTableView::item:selected {\n"
-"    color: rgb(255, 255, 255);\n"
-"background:rgb(23, 23, 23);\n"
-"}\n"
-"    ")
         self.beck_tableview.setShowGrid(False)
         self.beck_tableview.setGridStyle(QtCore.Qt.PenStyle.NoPen)
         self.beck_tableview.setSortingEnabled(True)
@@ -1,13 +1,16 @@
 import datetime
+import os
+from collections import deque
 from PyQt6 import QtWidgets
-from PyQt6.QtCore import QDate, QSettings, QTime, Qt, QByteArray, QDateTime
-from PyQt6.QtGui import QCloseEvent
+from PyQt6.QtCore import QDate, QSettings, QTime, Qt, QByteArray, QDateTime, QTimer
+from PyQt6.QtGui import QAction, QCloseEvent, QKeySequence
 
 import tracker_config as tkc
 # ////////////////////////////////////////////////////////////////////////////////////////
 # UI
 # ////////////////////////////////////////////////////////////////////////////////////////
 from ui.main_ui.gui import Ui_MainWindow
+from ui.theme import apply_theme
 
 # ////////////////////////////////////////////////////////////////////////////////////////
 # LOGGER
@@ -25,6 +28,8 @@ from utility.app_operations.frameless_window import (
 from utility.app_operations.window_controls import (
     WindowController)
 from utility.app_operations.show_hide import toggle_views
+from utility.app_operations.startup_profiler import profiler
+from utility.app_operations.perf_stats import perf_stats
 # app ops
 # from utility.widgets_set_widgets.slider_spinbox_connections import (
 #     connect_slider_spinbox)
@@ -32,23 +37,24 @@ from utility.app_operations.show_hide import toggle_views
 # ////////////////////////////////////////////////////////////////////////////////////////
 # DATABASE Magicks w/ Wizardry & Necromancy
 # ////////////////////////////////////////////////////////////////////////////////////////
-# Database connections
-from database.database_manager import (
-    DataManager)
+# The database connection, worker, models and trend page pull in QtSql and NumPy, so
+# they are imported and built on first use by ensure_database, ensure_data_page and
+# ensure_trend_page instead of before the first paint.
 
 # Delete Records
 from database.database_utility.delete_records import (
     delete_selected_rows)
 
-# setup Models
-from database.database_utility.model_setup import (
-    create_and_set_model)
-
 # ////////////////////////////////////////////////////////////////////////////////////////
 # ADD DATA MODULES
 # ////////////////////////////////////////////////////////////////////////////////////////
 from database.beck_add_data import add_beck_data
 
+# ////////////////////////////////////////////////////////////////////////////////////////
+# SCORING
+# ////////////////////////////////////////////////////////////////////////////////////////
+from beck_core.score_state import ScoreState
+
 
 class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
     """
@@ -69,68 +75,216 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
                  **kwargs):
         super().__init__(*args, **kwargs)
         self.becks_model = None
+        self.filter_bar = None
+        self.db_manager = None
+        self.db_worker = None
+        self.journal = None
+        self.trend_cache = None
+        self.mainpanePage3 = None
+        self.perf_page = None
+        self.restore_stager = None
         self.ui = Ui_MainWindow()
-        self.setupUi(self)
-        # Database init
-        self.db_manager = DataManager()
-        self.setup_models()
-        # QSettings settings_manager setup
-        self.settings = QSettings(tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME)
-        self.window_controller = WindowController()
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-        self.restore_state()
-        self.app_operations()
-        # self.slider_set_spinbox()
-        self.stack_navigation()
-        self.delete_group()
-        self.set_hidden()
+        with profiler.phase("theme"):
+            apply_theme(QtWidgets.QApplication.instance())
+        with profiler.phase("setupUi"):
+            self.setupUi(self)
+        with profiler.phase("window setup"):
+            # QSettings settings_manager setup
+            self.settings = QSettings(tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME)
+            self.window_controller = WindowController()
+            self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
+            self.restore_state()
+            self.actionTrends = QAction("Trends", self)
+            self.actionTrends.setObjectName("actionTrends")
+            self.actionTrends.setShortcut(QKeySequence("Ctrl+3"))
+            self.menuViews.addAction(self.actionTrends)
+            # The performance page is for support and has no menu entry
+            self.actionPerformance = QAction("Performance", self)
+            self.actionPerformance.setObjectName("actionPerformance")
+            self.actionPerformance.setShortcut(QKeySequence("Ctrl+Shift+P"))
+            self.addAction(self.actionPerformance)
+            self.app_operations()
+            # self.slider_set_spinbox()
+            self.stack_navigation()
+            self.delete_group()
+            self.backup_group()
+            self.set_hidden()
+        with profiler.phase("beck sliders"):
+            self.setup_beck_sliders()
     
-        self.update_beck_summary()
-        
+    def setup_beck_sliders(self) -> None:
+        """
+        Sets the slider ranges and connects them to the running beck_summary score.
+
+        Returns:
+            None
+        """
         #########################################################################
         # beck summer of summation
         #########################################################################
         self.beck_summary.setEnabled(False)
-        for slider in [
-            self.sadness, self.outlook, self.guilt, self.solitude, self.sexdrive, self.hygiene, self.decisiveness, self.effort, self.interest, self.pessimism, self.victimhood, self.sleep, ]:
+        self.beck_sliders = (
+            self.sadness, self.outlook, self.guilt, self.solitude, self.sexdrive, self.hygiene,
+            self.decisiveness, self.effort, self.interest, self.pessimism, self.victimhood,
+            self.sleep, )
+        for slider in self.beck_sliders:
             slider.setRange(0, 3)
         
-        self.sadness.valueChanged.connect(self.update_beck_summary)
-        self.outlook.valueChanged.connect(self.update_beck_summary)
-        self.guilt.valueChanged.connect(self.update_beck_summary)
-        self.solitude.valueChanged.connect(self.update_beck_summary)
-        self.sexdrive.valueChanged.connect(self.update_beck_summary)
-        self.hygiene.valueChanged.connect(self.update_beck_summary)
-        self.decisiveness.valueChanged.connect(self.update_beck_summary)
-        self.effort.valueChanged.connect(self.update_beck_summary)
-        self.interest.valueChanged.connect(self.update_beck_summary)
-        self.pessimism.valueChanged.connect(self.update_beck_summary)
-        self.victimhood.valueChanged.connect(self.update_beck_summary)
-        self.sleep.valueChanged.connect(self.update_beck_summary)
+        self.beck_score = ScoreState()
+        self.summary_timer = QTimer(self)
+        self.summary_timer.setSingleShot(True)
+        self.summary_timer.setInterval(tkc.SUMMARY_REPAINT_INTERVAL_MS)
+        self.summary_timer.timeout.connect(self.flush_beck_summary)
+        self.update_beck_summary()
+        
+        for index, slider in enumerate(self.beck_sliders):
+            slider.valueChanged.connect(
+                lambda value, i=index: self.on_beck_item_changed(i, value))
+    
+    def on_beck_item_changed(self, index: int, value: int) -> None:
+        """
+        Applies one slider change to the running score and schedules a summary repaint.
+
+        Only the delta of the changed item is added to the total. Bursts of valueChanged
+        signals while a slider is dragged share a single pending repaint of beck_summary.
+
+        Args:
+            index (int): The position of the slider in beck_sliders.
+            value (int): The new slider value.
+        """
+        try:
+            self.beck_score.set_item(index, value)
+            if not self.summary_timer.isActive():
+                self.summary_timer.start()
+        except Exception as e:
+            logger.error("%s", e, exc_info=True)
+    
+    def flush_beck_summary(self) -> None:
+        """
+        Pushes the running total to the beck_summary slider.
+        """
+        try:
+            with perf_stats.measure('flush_beck_summary'):
+                self.beck_summary.setValue(self.beck_score.total)
+        except Exception as e:
+            logger.error("%s", e, exc_info=True)
     
     def update_beck_summary(self):
         """
-        updates the averages of the sliders in the wellbeing and pain module such that
-        the overall is the avg of the whole
+        Re-reads every slider into the running score and updates beck_summary immediately.
+
+        Slider changes are normally applied incrementally by on_beck_item_changed; this full
+        resync is only needed when the score state may be out of step with the sliders.
         :return:
         """
         try:
-            
-            values = [slider.value() for slider in
-                      [self.sadness, self.outlook, self.guilt, self.solitude, self
-                      .sexdrive, self.hygiene, self.decisiveness, self.effort, self
-                       .interest, self.pessimism, self.victimhood, self.sleep, ] if
-                      slider.value() > 0]
-            
-            sumabitch = sum(values)
-            
-            self.beck_summary.setValue(int(sumabitch))
+            with perf_stats.measure('update_beck_summary'):
+                self.beck_score.load(slider.value() for slider in self.beck_sliders)
+                self.summary_timer.stop()
+                self.flush_beck_summary()
         
         except Exception as e:
-            logger.error(f"{e}", exc_info=True)
+            logger.error("%s", e, exc_info=True)
+    
     def set_hidden(self) -> None:
         self.hidemeframe.setVisible(False)
     
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # Deferred setup
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def ensure_database(self) -> None:
+        """
+        Opens the database and starts the database worker on first use.
+
+        Returns:
+            None
+        """
+        if self.db_worker is not None:
+            return
+        with profiler.phase("open database"):
+            from database.backup import apply_staged_restore
+            from database.bulk_load import repair_interrupted_load
+            from database.database_manager import DataManager, target_db_path
+            from database.db_worker import DatabaseWorker
+            from database.journal import BeckJournal, default_journal_path
+            # A restore staged in an earlier session replaces the file before it is opened
+            apply_staged_restore(target_db_path)
+            # Indexes and triggers a killed headless bulk load dropped are put back while
+            # no QtSql connection has the file open
+            repair_interrupted_load(target_db_path)
+            # Commits the worker had not written when the app last stopped are replayed
+            self.db_manager = DataManager(journal_path=default_journal_path)
+            self.journal = BeckJournal(default_journal_path)
+            self.db_worker = DatabaseWorker(target_db_path, parent=self, journal=self.journal)
+            self.db_worker.failed.connect(self.on_db_worker_failed)
+            self.db_worker.deleted.connect(self.on_rows_deleted)
+            self.db_worker.restored.connect(self.on_rows_restored)
+            self.db_worker.backed_up.connect(self.on_backed_up)
+            self.db_worker.start()
+        self.backup_timer.start()
+        self.backup_if_due()
+    
+    def ensure_data_page(self) -> None:
+        """
+        Builds the model of the data page the first time the page is opened.
+
+        Returns:
+            None
+        """
+        self.ensure_database()
+        if self.becks_model is None:
+            with profiler.phase("data page"):
+                self.setup_models()
+    
+    def ensure_trend_page(self) -> None:
+        """
+        Builds the trend chart page the first time it is opened.
+
+        Returns:
+            None
+        """
+        self.ensure_database()
+        if self.mainpanePage3 is None:
+            with profiler.phase("trend page"):
+                self.setup_trend_page()
+    
+    def ensure_perf_page(self) -> None:
+        """
+        Builds the hidden performance page the first time it is opened.
+
+        Returns:
+            None
+        """
+        if self.perf_page is None:
+            from ui.perf_panel import PerfPage
+            self.perf_page = PerfPage(perf_stats)
+            self.stackedWidget.addWidget(self.perf_page)
+    
+    def open_page(self, index: int) -> None:
+        """
+        Switches to a stackedWidget page by index, building it first if needed.
+
+        Args:
+            index (int): 0 for input, 1 for the data view, 2 for trends.
+
+        Returns:
+            None
+        """
+        {1: self.switch_to_page2, 2: self.switch_to_page3}.get(index, self.switch_to_page1)()
+    
+    def queue_beck_insert(self, *values) -> None:
+        """
+        Queues a committed assessment on the database worker, starting it if needed.
+
+        Args:
+            *values: The row in BECK_COLUMNS order.
+
+        Returns:
+            None
+        """
+        self.ensure_database()
+        self.db_worker.submit_insert(*values)
+    
     def switch_to_page1(self) -> None:
         """
         Switches to page 1 in the stackedWidget widget and resizes the main window.
@@ -141,8 +295,9 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         Returns:
             None
         """
-        self.stackedWidget.setCurrentWidget(self.mainpanePage1)
-        self.resize(450, 155)
+        with perf_stats.measure('switch_to_page1'):
+            self.stackedWidget.setCurrentWidget(self.mainpanePage1)
+            self.resize(450, 155)
     
     def switch_to_page2(self) -> None:
         """
@@ -155,7 +310,32 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         Returns:
             None
         """
-        self.stackedWidget.setCurrentWidget(self.mainpanePage2)
+        with perf_stats.measure('switch_to_page2'):
+            self.ensure_data_page()
+            self.stackedWidget.setCurrentWidget(self.mainpanePage2)
+            self.resize(1000, 450)
+    
+    def switch_to_page3(self) -> None:
+        """
+        Switches to the trend chart page in the stackedWidget widget and resizes the main window.
+
+        Returns:
+            None
+        """
+        with perf_stats.measure('switch_to_page3'):
+            self.ensure_trend_page()
+            self.stackedWidget.setCurrentWidget(self.mainpanePage3)
+            self.resize(1000, 450)
+    
+    def switch_to_perf_page(self) -> None:
+        """
+        Switches to the hidden performance page.
+
+        Returns:
+            None
+        """
+        self.ensure_perf_page()
+        self.stackedWidget.setCurrentWidget(self.perf_page)
         self.resize(1000, 450)
     
     def handle_minimize_action(self) -> None:
@@ -170,7 +350,7 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         try:
             self.window_controller.toggle_minimize(self)
         except Exception as e:
-            logger.exception(f"Error occurred while minimizing {e}", exc_info=True)
+            logger.exception("Error occurred while minimizing %s", e, exc_info=True)
     
     def handle_maximize_action(self) -> None:
         """
@@ -185,7 +365,7 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         try:
             self.window_controller.toggle_maximize(self)
         except Exception as e:
-            logger.exception(f"Error occurred while maximizing {e}", exc_info=True)
+            logger.exception("Error occurred while maximizing %s", e, exc_info=True)
     
     # ////////////////////////////////////////////////////////////////////////////////////////
     # APP-OPERATIONS setup
@@ -205,15 +385,19 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
             self.beck_table_commit()
             self.stackedWidget.currentChanged.connect(self.on_page_changed)
             last_index = self.settings.value("lastPageIndex", 0, type=int)
-            self.stackedWidget.setCurrentIndex(last_index)
+            if last_index:
+                # Reopen the last page after the window has painted
+                QTimer.singleShot(0, lambda: self.open_page(last_index))
             self.beck_time.setTime(QTime.currentTime())
             self.beck_date.setDate(QDate.currentDate())
             self.actionInput_View.triggered.connect(self.switch_to_page1)
             self.actionDataview.triggered.connect(self.switch_to_page2)
+            self.actionTrends.triggered.connect(self.switch_to_page3)
+            self.actionPerformance.triggered.connect(self.switch_to_perf_page)
             self.actionMinimize.triggered.connect(self.handle_minimize_action)
             self.actionMaximize.triggered.connect(self.handle_maximize_action)
         except Exception as e:
-            logger.error(f"Error occurred while setting up app_operations : {e}", exc_info=True)
+            logger.error("Error occurred while setting up app_operations : %s", e, exc_info=True)
     
     def on_page_changed(self, index):
         """
@@ -227,9 +411,14 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
 
         """
         try:
-            self.settings.setValue("lastPageIndex", index)
+            # Pages added on first use don't have fixed indexes, so the index open_page
+            # takes is stored, and the performance page is not reopened at all
+            page = {self.mainpanePage1: 0, self.mainpanePage2: 1,
+                    self.mainpanePage3: 2}.get(self.stackedWidget.widget(index))
+            if page is not None:
+                self.settings.setValue("lastPageIndex", page)
         except Exception as e:
-            logger.error(f"{e}", exc_info=True)
+            logger.error("%s", e, exc_info=True)
     
     # ////////////////////////////////////////////////////////////////////////////////////////
     # Minder Navigation
@@ -238,9 +427,9 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         """
         Connects the triggered signals of certain actions to change the stack pages.
 
-        The method creates a dictionary `change_stack_pages` that maps actions to their corresponding page index.
+        The method creates a dictionary `change_stack_pages` that maps actions to the attribute name of their page.
         It then iterates over the dictionary and connects the `triggered` signal of each action to a lambda function
-        that calls the `change_stack_page` method with the corresponding page index.
+        that calls the `change_stack_page` method with the current index of that page.
 
         Raises:
             Exception: If an error occurs during the connection of signals.
@@ -248,50 +437,65 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         """
         try:
             change_stack_pages = {
-                self.actionInput_View: 0,
-                self.actionDataview: 1,
+                self.actionInput_View: 'mainpanePage1',
+                self.actionDataview: 'mainpanePage2',
+                self.actionTrends: 'mainpanePage3',
             }
             
+            # Pages built on first use get the next free index, so it is looked up when
+            # the action fires, after the switch_to_page slot has built the page
             for action, page in change_stack_pages.items():
-                action.triggered.connect(lambda _, p=page: change_stack_page(self.stackedWidget, p))
+                action.triggered.connect(lambda _, p=page: change_stack_page(
+                    self.stackedWidget, self.stackedWidget.indexOf(getattr(self, p))))
         
         except Exception as e:
-            logger.error(f"An error has occurred: {e}", exc_info=True)
+            logger.error("An error has occurred: %s", e, exc_info=True)
     
     def beck_table_commit(self) -> None:
         """
         Connects the 'commit' action to the 'add_mentalsolo_data' function and inserts data into the altman_table.
 
         This method connects the 'commit' action to the 'add_beck_data' function, which inserts data into the beck_table.
-        The data to be inserted is retrieved from various UI elements in the main window.
+        The data to be inserted is retrieved from various UI elements in the main window and queued on the
+        database worker, so the commit and the following refresh never block the GUI thread.
 
         Raises:
             Exception: If an error occurs during the process.
         """
         try:
-            self.actionCommit.triggered.connect(
-                lambda: add_beck_data(
-                    self, {
-                        "beck_date": "beck_date",
-                        "beck_time": "beck_time",
-                        "sadness": "sadness",
-                        "outlook": "outlook",
-                        "guilt": "guilt",
-                        "solitude": "solitude",
-                        "sexdrive": "sexdrive",
-                        "hygiene": "hygiene",
-                        "decisiveness": "decisiveness",
-                        "effort": "effort",
-                        "interest": "interest",
-                        "pessimism": "pessimism",
-                        "victimhood": "victimhood",
-                        "sleep": "sleep",
-                        "beck_summary": "beck_summary",
-                        "model": "becks_model"
-                    },
-                    self.db_manager.insert_into_beck_table, ))
+            self.actionCommit.triggered.connect(lambda: self.commit_beck_assessment())
         except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
+            logger.error("An Error has occurred %s", e, exc_info=True)
+    
+    def commit_beck_assessment(self) -> None:
+        """
+        Commits the assessment on the form through add_beck_data.
+
+        add_beck_data reads beck_summary from its slider, which only catches up with the
+        items when the summary timer fires, so a pending repaint is flushed first.
+        """
+        self.summary_timer.stop()
+        self.flush_beck_summary()
+        add_beck_data(
+            self, {
+                "beck_date": "beck_date",
+                "beck_time": "beck_time",
+                "sadness": "sadness",
+                "outlook": "outlook",
+                "guilt": "guilt",
+                "solitude": "solitude",
+                "sexdrive": "sexdrive",
+                "hygiene": "hygiene",
+                "decisiveness": "decisiveness",
+                "effort": "effort",
+                "interest": "interest",
+                "pessimism": "pessimism",
+                "victimhood": "victimhood",
+                "sleep": "sleep",
+                "beck_summary": "beck_summary",
+                "model": "becks_model"
+            },
+            self.queue_beck_insert, )
     
     def delete_group(self):
         """
@@ -299,6 +503,7 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
 
         This method connects the delete action to the delete_selected_rows function,
         passing the necessary arguments to delete the selected rows in the altman_table.
+        It also adds the Undo Delete action, which restores the most recent deletes.
 
         Args:
             self: The instance of the main window.
@@ -306,27 +511,232 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         Returns:
             None
         """
-        self.actionDelete_Record.triggered.connect(
-            lambda: delete_selected_rows(
+        self.actionDelete_Record.triggered.connect(self.delete_selected_records)
+        self.delete_history = deque(maxlen=tkc.UNDO_DELETE_DEPTH)
+        self.actionUndo_Delete = QAction("Undo Delete", self)
+        self.actionUndo_Delete.setObjectName("actionUndo_Delete")
+        self.actionUndo_Delete.setShortcut(QKeySequence("Ctrl+Shift+Z"))
+        self.actionUndo_Delete.setEnabled(False)
+        self.menuBECK.insertAction(self.actionMinimize, self.actionUndo_Delete)
+        self.actionUndo_Delete.triggered.connect(self.undo_delete)
+    
+    def backup_group(self) -> None:
+        """
+        Adds the Back Up Now and Restore Backup actions and the scheduled backup timer.
+
+        Once the database is open, a snapshot is queued on the database worker whenever the
+        newest one is older than BACKUP_INTERVAL_HOURS. The timer only checks the age.
+
+        Returns:
+            None
+        """
+        self.actionBackup = QAction("Back Up Now", self)
+        self.actionBackup.setObjectName("actionBackup")
+        self.menuBECK.insertAction(self.actionMinimize, self.actionBackup)
+        self.actionBackup.triggered.connect(self.backup_now)
+        self.actionRestore_Backup = QAction("Restore Backup...", self)
+        self.actionRestore_Backup.setObjectName("actionRestore_Backup")
+        self.menuBECK.insertAction(self.actionMinimize, self.actionRestore_Backup)
+        self.actionRestore_Backup.triggered.connect(self.restore_backup)
+        self.backup_timer = QTimer(self)
+        self.backup_timer.setInterval(tkc.BACKUP_CHECK_INTERVAL_MS)
+        self.backup_timer.timeout.connect(self.backup_if_due)
+    
+    def backup_if_due(self) -> None:
+        """
+        Queues a scheduled snapshot if the newest one is older than the backup interval.
+
+        Returns:
+            None
+        """
+        from database.backup import backup_due, default_backup_dir
+        try:
+            if self.db_worker is not None and backup_due(default_backup_dir):
+                self.db_worker.submit_backup(default_backup_dir)
+        except OSError as e:
+            logger.error("Error checking the backup schedule: %s", e)
+    
+    def backup_now(self) -> None:
+        """
+        Queues a snapshot on the database worker, opening the database first if needed.
+
+        Returns:
+            None
+        """
+        from database.backup import default_backup_dir
+        self.ensure_database()
+        self.db_worker.submit_backup(default_backup_dir)
+    
+    def on_backed_up(self, path: str) -> None:
+        """
+        Logs a snapshot written by the database worker.
+
+        Args:
+            path (str): The snapshot.
+        """
+        logger.info("Database backed up to %s", path)
+    
+    def restore_backup(self) -> None:
+        """
+        Asks for a snapshot, then decompresses and checks it on a background thread.
+
+        The open database can't be swapped under the app's connections, so a snapshot that
+        passes the check is staged and replaces the database the next time the app opens it.
+
+        Returns:
+            None
+        """
+        from database.backup import RestoreStager, SNAPSHOT_SUFFIX, default_backup_dir
+        from database.database_manager import target_db_path
+        if self.restore_stager is not None and self.restore_stager.isRunning():
+            return
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, "Restore Backup", default_backup_dir, f"Backups (*{SNAPSHOT_SUFFIX})")
+        if not path:
+            return
+        self.restore_stager = RestoreStager(path, target_db_path, parent=self)
+        self.restore_stager.staged.connect(self.on_restore_staged)
+        self.restore_stager.failed.connect(self.on_restore_failed)
+        self.restore_stager.start()
+    
+    def on_restore_staged(self, path: str) -> None:
+        """
+        Tells the user a checked backup is staged, swapping it in at once when the
+        database has not been opened yet.
+
+        Args:
+            path (str): The snapshot that was staged.
+
+        Returns:
+            None
+        """
+        if self.db_worker is None:
+            # Nothing has the database open yet, so it is swapped in right away
+            self.ensure_database()
+            message = f"{os.path.basename(path)} passed the integrity check and was restored."
+        else:
+            message = (f"{os.path.basename(path)} passed the integrity check. It will replace "
+                       f"the current data when the app is restarted; entries made until then "
+                       f"are discarded.")
+        QtWidgets.QMessageBox.information(self, "Restore Backup", message)
+    
+    def on_restore_failed(self, message: str) -> None:
+        """
+        Tells the user a backup failed its check or could not be staged.
+
+        Args:
+            message (str): The error from RestoreStager.
+
+        Returns:
+            None
+        """
+        QtWidgets.QMessageBox.warning(self, "Restore Backup", f"The backup was not restored: {message}")
+    
+    def delete_selected_records(self) -> None:
+        """
+        Deletes the rows selected in the data view, once the data page has been built.
+
+        Returns:
+            None
+        """
+        if self.becks_model is not None:
+            delete_selected_rows(
                 self,
                 'beck_tableview',
                 'becks_model'
             )
-        )
+    
+    def on_rows_restored(self, count: int) -> None:
+        """
+        Reloads the data view after the worker has put deleted rows back.
+
+        Args:
+            count (int): The number of rows restored.
+        """
+        if self.becks_model is not None:
+            self.becks_model.select()
+    
+    def on_rows_deleted(self, ids: list, deleted) -> None:
+        """
+        Keeps the rows removed by a delete so it can be undone.
+
+        Args:
+            ids (list): The ids that were deleted.
+            deleted (DeletedRows): The copy of the deleted rows.
+        """
+        if len(deleted):
+            self.delete_history.append(deleted)
+            self.actionUndo_Delete.setEnabled(True)
+    
+    def undo_delete(self) -> None:
+        """
+        Restores the rows of the most recent delete. The data view is refreshed once the
+        worker has put them back.
+        """
+        if not self.delete_history:
+            return
+        self.db_worker.submit_restore(self.delete_history.pop())
+        self.actionUndo_Delete.setEnabled(bool(self.delete_history))
+    
+    def on_db_worker_failed(self, kind: str, message: str) -> None:
+        """
+        Logs a failed worker command. Deletes remove rows from the view before they are
+        committed, so a failed delete reloads the view from the database.
+
+        Args:
+            kind (str): The command kind.
+            message (str): The error message.
+        """
+        logger.error("Database worker %s failed: %s", kind, message)
+        if kind == 'delete' and self.becks_model is not None:
+            self.becks_model.select()
     
     def setup_models(self) -> None:
         """
         Set up the models for the main window.
 
-        This method creates and sets the becks_model using the altman_table.
+        This method creates and sets the becks_model using the beck_table. The model is
+        paged so large histories are loaded as the view scrolls, and the filter bar above
+        the view narrows it with SQL conditions.
 
         Returns:
             None
         """
-        self.becks_model = create_and_set_model(
+        from database.database_utility.model_setup import create_and_set_paged_model
+        self.becks_model = create_and_set_paged_model(
             "beck_table",
             self.beck_tableview
         )
+        # beck_timestamp only duplicates beck_date and beck_time for indexing
+        timestamp_column = self.becks_model.fieldIndex("beck_timestamp")
+        if timestamp_column >= 0:
+            self.beck_tableview.setColumnHidden(timestamp_column, True)
+        self.becks_model.attach_worker(self.db_worker)
+        # The filter bar shares the top row with hidemeframe, which stays hidden
+        from ui.filter_bar import BeckFilterBar
+        self.filter_bar = BeckFilterBar(self.mainpanePage2)
+        self.gridLayout_25.addWidget(self.filter_bar, 0, 0, 1, 1)
+        self.filter_bar.filter_changed.connect(self.becks_model.set_filter)
+
+    def setup_trend_page(self) -> None:
+        """
+        Adds the trend chart as the third page of the stackedWidget.
+
+        The chart loads data by visible date range through the database worker and drops
+        what it has loaded whenever the worker changes beck_table.
+
+        Returns:
+            None
+        """
+        from database.database_utility.trend_cache import TrendSeriesCache
+        from ui.trend_chart import TrendPage
+        self.trend_cache = TrendSeriesCache()
+        self.trend_cache.attach_worker(self.db_worker)
+        self.mainpanePage3 = TrendPage(self.trend_cache)
+        self.stackedWidget.addWidget(self.mainpanePage3)
+        self.db_worker.inserted.connect(lambda count: self.trend_cache.invalidate())
+        self.db_worker.deleted.connect(lambda ids, deleted: self.trend_cache.invalidate())
+        self.db_worker.restored.connect(lambda count: self.trend_cache.invalidate())
     
     def save_state(self):
         """
@@ -344,11 +754,11 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         try:
             self.settings.setValue("geometry", self.saveGeometry())
         except Exception as e:
-            logger.error(f"Error saving the minds_module geo{e}", exc_info=True)
+            logger.error("Error saving the minds_module geo%s", e, exc_info=True)
         try:
             self.settings.setValue("windowState", self.saveState())
         except Exception as e:
-            logger.error(f"Error saving the minds_module geo{e}", exc_info=True)
+            logger.error("Error saving the minds_module geo%s", e, exc_info=True)
     
     def restore_state(self) -> None:
         """
@@ -365,12 +775,12 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
             # restore window geometry state
             self.restoreGeometry(self.settings.value("geometry", QByteArray()))
         except Exception as e:
-            logger.error(f"Error restoring the minds module : stress state {e}")
+            logger.error("Error restoring the minds module : stress state %s", e)
         
         try:
             self.restoreState(self.settings.value("windowState", QByteArray()))
         except Exception as e:
-            logger.error(f"Error restoring WINDOW STATE {e}", exc_info=True)
+            logger.error("Error restoring WINDOW STATE %s", e, exc_info=True)
     
     def closeEvent(self, event: QCloseEvent) -> None:
         """
@@ -387,4 +797,15 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         try:
             self.save_state()
         except Exception as e:
-            logger.error(f"error saving state during closure: {e}", exc_info=True)
+            logger.error("error saving state during closure: %s", e, exc_info=True)
+        try:
+            if self.restore_stager is not None:
+                self.restore_stager.wait()
+            if self.db_worker is not None:
+                self.db_worker.stop()
+            if self.journal is not None:
+                self.journal.close()
+            if self.db_manager is not None:
+                self.db_manager.close()
+        except Exception as e:
+            logger.error("error stopping the database worker: %s", e, exc_info=True)
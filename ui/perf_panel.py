@@ -0,0 +1,102 @@
+import os
+from datetime import datetime
+from typing import Optional
+
+from PyQt6 import QtWidgets
+from PyQt6.QtCore import Qt, QTimer
+
+from logger_setup import log_directory, logger
+from utility.app_operations.perf_stats import PERCENTILES, PerfStats
+
+_COLUMNS = ('operation', 'count', *[f"p{round(fraction * 100)} ms" for fraction in PERCENTILES], 'max ms')
+_REFRESH_MS = 1000
+
+
+class PerfPage(QtWidgets.QWidget):
+    """
+    The hidden diagnostics page: latency percentiles of the instrumented operations.
+
+    The table is refreshed once a second while the page is shown. Dump JSON writes the
+    summaries and raw samples to a file a user can attach to a support request.
+
+    Attributes:
+        stats (PerfStats): The statistics shown.
+
+    """
+
+    def __init__(self, stats: PerfStats, parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setObjectName("perf_page")
+        self.stats: PerfStats = stats
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(6, 6, 6, 6)
+        self.table = QtWidgets.QTableWidget(0, len(_COLUMNS), self)
+        self.table.setObjectName("perf_tableview")
+        self.table.setHorizontalHeaderLabels(_COLUMNS)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+
+        buttons = QtWidgets.QHBoxLayout()
+        self.recording = QtWidgets.QCheckBox("Recording", self)
+        self.recording.setChecked(stats.enabled)
+        self.recording.toggled.connect(self.set_recording)
+        buttons.addWidget(self.recording)
+        buttons.addStretch(1)
+        for label, slot in (("Reset", self.reset), ("Dump JSON", self.dump_json)):
+            button = QtWidgets.QPushButton(label, self)
+            button.clicked.connect(slot)
+            buttons.addWidget(button)
+        layout.addLayout(buttons)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(_REFRESH_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event) -> None:
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self) -> None:
+        """
+        Fills the table from a snapshot of the statistics, slowest p95 first.
+        """
+        snapshot = sorted(self.stats.snapshot().items(), key=lambda item: -item[1]['p95_ms'])
+        self.table.setRowCount(len(snapshot))
+        for row, (name, summary) in enumerate(snapshot):
+            values = (name, f"{summary['count']:,}",
+                      *[f"{summary[f'p{round(fraction * 100)}_ms']:.2f}" for fraction in PERCENTILES],
+                      f"{summary['max_ms']:.2f}")
+            for column, value in enumerate(values):
+                item = QtWidgets.QTableWidgetItem(value)
+                if column:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+    def set_recording(self, enabled: bool) -> None:
+        self.stats.enabled = enabled
+
+    def reset(self) -> None:
+        self.stats.reset()
+        self.refresh()
+
+    def dump_json(self) -> None:
+        """
+        Asks for a file name, next to the log by default, and writes the statistics to it.
+        """
+        default = os.path.join(log_directory, f"beck_perf_{datetime.now():%Y%m%d_%H%M%S}.json")
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Dump performance statistics",
+                                                        default, "JSON (*.json)")
+        if not path:
+            return
+        try:
+            self.stats.dump_json(path)
+        except OSError as e:
+            logger.error("Error writing performance statistics to %s: %s", path, e)
+            QtWidgets.QMessageBox.warning(self, "Dump JSON", f"Could not write {path}: {e}")
@@ -0,0 +1,314 @@
+"""
+The application stylesheet.
+
+Every widget used to carry its own stylesheet: the window, the stacked and tab widgets,
+the table view and each of the thirteen sliders. Qt parses each sheet separately and
+re-polishes the widget's whole subtree whenever one is set. Here all rules are compiled
+once into a single sheet set on the QApplication. Widgets that need their own colours
+set a dynamic property which the sheet selects on:
+
+    slider.setProperty("beckColor", "sadness")      # QSlider[beckColor="sadness"]
+    toggle.setProperty("beckSeries", "sadness")     # QCheckBox[beckSeries="sadness"]
+
+Properties are matched when a widget is polished, so they must be set before it is
+shown. A property changed later needs style().unpolish()/polish() to take effect.
+"""
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from beck_core.items import ITEM_NAMES
+
+Rgb = Tuple[int, int, int]
+
+# Slider colours of the input page. Each item's hover and pressed shades are derived
+# from its handle colour; beck_summary has hand-picked shades.
+SLIDER_COLORS: Dict[str, Rgb] = {
+    'sadness': (87, 111, 215),
+    'outlook': (200, 129, 224),
+    'guilt': (170, 129, 224),
+    'solitude': (223, 133, 93),
+    'sexdrive': (229, 100, 111),
+    'hygiene': (96, 174, 106),
+    'decisiveness': (120, 155, 172),
+    'effort': (255, 89, 156),
+    'interest': (247, 198, 94),
+    'pessimism': (214, 157, 210),
+    'victimhood': (153, 153, 255),
+    'sleep': (214, 157, 210),
+}
+
+# (handle, hover, pressed, groove) of the beck_summary slider, and its groove alphas.
+_SUMMARY_SLIDER: Tuple[Rgb, Rgb, Rgb, Rgb] = ((244, 56, 81), (239, 116, 121), (149, 26, 31), (199, 76, 81))
+_SUMMARY_GROOVE_ALPHAS: Tuple[float, float] = (0.08, 0.25)
+
+# Line colours of the trend chart. They follow the sliders, except sleep, which would
+# otherwise share pessimism's colour.
+SERIES_COLORS: Dict[str, Rgb] = {
+    'beck_summary': _SUMMARY_SLIDER[0],
+    **SLIDER_COLORS,
+    'sleep': (100, 199, 211),
+}
+
+BASE_STYLESHEET: str = """
+QWidget {
+    background-color: #121212;
+    color: #fff;
+    font: 11pt "Helvetica";
+}
+QLabel {
+    background: transparent;
+}
+QLabel#altmans_summary_label {
+    font-weight: bold;
+    margin-top: 4px;
+    margin-bottom: 4px;
+}
+QToolTip {
+    background: rgba(23, 23, 23, 150);
+    border: 1px solid rgb(100, 199, 211);
+    border-radius: 5px;
+    padding: 4px;
+    text-align: left;
+    color: rgb(100, 199, 211);
+}
+/* /////////////////////////////////////////////////////////////////////////////
+                                 QSlider
+///////////////////////////////////////////////////////////////////////////// */
+QSlider::groove:horizontal {
+    height: 10px;
+    margin: 0px;
+    background-color: rgba(22, 22, 22, 100);
+}
+QSlider::groove:horizontal:hover {
+    background-color: rgb(32, 32, 32);
+}
+QSlider::handle:horizontal {
+    background-color: rgb(255, 88, 71);
+    border: none;
+    height: 10px;
+    width: 10px;
+    margin: 0px;
+    border-radius: 5px;
+}
+QSlider::handle:horizontal:hover {
+    background-color: white;
+}
+QSlider::handle:horizontal:pressed {
+    background-color: white;
+}
+QSlider::groove:vertical {
+    border-radius: 11px;
+    width: 22px;
+    margin: 0px;
+    background-color: rgba(33, 33, 33, 100);
+}
+QSlider::groove:vertical:hover {
+    background-color: rgba(44, 44, 44, 100);
+}
+QSlider::handle:vertical {
+    background-color: rgb(255, 88, 71);
+    border: none;
+    height: 22px;
+    width: 22px;
+    margin: 0px;
+    border-radius: 11px;
+}
+QSlider::handle:vertical:hover {
+    background-color: rgb(195, 155, 255);
+}
+QSlider::handle:vertical:pressed {
+    background-color: rgb(255, 121, 198);
+}
+/* /////////////////////////////////////////////////////////////////////////////
+                                 QScrollBar
+///////////////////////////////////////////////////////////////////////////// */
+QScrollBar:horizontal {
+    border: none;
+    background: transparent;
+    height: 12px;
+    margin: 0px 10px 0px 10px;
+    border-radius: 3px;
+}
+QScrollBar::handle:horizontal {
+    background: rgb(22, 22, 22);
+    min-width: 24px;
+    border-radius: 4px;
+}
+QScrollBar::add-line:horizontal {
+    border: none;
+    background: transparent;
+    width: 20px;
+    border-top-right-radius: 4px;
+    border-bottom-right-radius: 4px;
+    subcontrol-position: right;
+    subcontrol-origin: margin;
+}
+QScrollBar::sub-line:horizontal {
+    border: none;
+    background: transparent;
+    width: 20px;
+    border-top-left-radius: 4px;
+    border-bottom-left-radius: 4px;
+    subcontrol-position: left;
+    subcontrol-origin: margin;
+}
+QScrollBar::up-arrow:horizontal,
+QScrollBar::down-arrow:horizontal {
+    background: none;
+}
+QScrollBar::add-page:horizontal,
+QScrollBar::sub-page:horizontal {
+    background: transparent;
+}
+QScrollBar:vertical {
+    border: none;
+    background-color: transparent;
+    width: 12px;
+    margin: 10px 0px 10px 0px;
+    border-radius: 4px;
+}
+QScrollBar::handle:vertical {
+    background: rgb(22, 22, 22);
+    min-height: 12px;
+    border-radius: 4px;
+}
+QScrollBar::add-line:vertical {
+    border: none;
+    background: transparent;
+    height: 20px;
+    border-bottom-left-radius: 4px;
+    border-bottom-right-radius: 4px;
+    subcontrol-position: bottom;
+    subcontrol-origin: margin;
+}
+QScrollBar::sub-line:vertical {
+    border: none;
+    background: transparent;
+    height: 20px;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+    subcontrol-position: top;
+    subcontrol-origin: margin;
+}
+QScrollBar::up-arrow:vertical,
+QScrollBar::down-arrow:vertical {
+    background: none;
+}
+QScrollBar::add-page:vertical,
+QScrollBar::sub-page:vertical {
+    background: transparent;
+}
+/* /////////////////////////////////////////////////////////////////////////////
+                                 Pages
+///////////////////////////////////////////////////////////////////////////// */
+#stackedWidget QTabWidget {
+    background-color: #fff;
+    border: none;
+}
+#stackedWidget QTabWidget::pane {
+    border: none;
+    background-color: #fff;
+}
+#stackedWidget QTabBar::tab {
+    margin-left: 3px;
+    padding-top: 2px;
+    padding-bottom: 2px;
+    background-color: transparent;
+    border: none;
+}
+#stackedWidget QTabBar::tab:selected {
+    background-color: transparent;
+    font-weight: bold;
+    font-size: 8pt;
+}
+#stackedWidget QTabBar::tab:hover {
+    border-radius: 4px;
+}
+#stackedWidget QTabBar::tab:only-one {
+    background-color: transparent;
+}
+QTableView#beck_tableview {
+    background-color: transparent;
+    selection-background-color: #7e57c2;
+    gridline-color: transparent;
+    color: rgb(77, 15, 26);
+}
+QTableView#beck_tableview::item {
+    padding: 1px;
+    color: rgb(77, 15, 26);
+    background: rgb(229, 100, 111);
+}
+QTableView#beck_tableview::item:selected {
+    color: rgb(255, 255, 255);
+    background: rgb(23, 23, 23);
+}
+"""
+
+
+def _rgb(color: Rgb) -> str:
+    return f"rgb({color[0]},{color[1]},{color[2]})"
+
+
+def _shade(color: Rgb, delta: int) -> Rgb:
+    return tuple(min(max(channel + delta, 0), 255) for channel in color)
+
+
+def slider_rules(name: str, handle: Rgb, hover: Rgb, pressed: Rgb, groove: Rgb,
+                 groove_alphas: Tuple[float, float] = (0.15, 0.25)) -> str:
+    """
+    Returns the colour rules of the vertical sliders whose beckColor property is name.
+
+    Args:
+        name (str): The beckColor value.
+        handle (Rgb): The handle colour.
+        hover (Rgb): The handle colour under the mouse.
+        pressed (Rgb): The handle colour while dragged.
+        groove (Rgb): The groove colour, drawn translucent.
+        groove_alphas (Tuple[float, float]): The groove alpha normally and on hover.
+
+    Returns:
+        str: The QSS rules.
+    """
+    selector = f'QSlider[beckColor="{name}"]'
+    groove_rgb = ','.join(str(channel) for channel in groove)
+    return (f"{selector}::handle:vertical {{background:{_rgb(handle)};}}\n"
+            f"{selector}::handle:vertical:hover {{background:{_rgb(hover)};}}\n"
+            f"{selector}::handle:vertical:pressed {{background:{_rgb(pressed)};}}\n"
+            f"{selector}::groove:vertical {{background:rgba({groove_rgb},{groove_alphas[0]});}}\n"
+            f"{selector}::groove:vertical:hover {{background:rgba({groove_rgb},{groove_alphas[1]});}}\n")
+
+
+@lru_cache(maxsize=None)
+def compile_stylesheet() -> str:
+    """
+    Builds the application stylesheet from the base rules and the colour tables.
+
+    The result is cached, so the sheet is generated once per process and applying it
+    again hands Qt an identical string.
+
+    Returns:
+        str: The stylesheet.
+    """
+    rules = [BASE_STYLESHEET]
+    for name in ITEM_NAMES:
+        color = SLIDER_COLORS[name]
+        rules.append(slider_rules(name, color, _shade(color, 40), _shade(color, -50), color))
+    rules.append(slider_rules('beck_summary', *_SUMMARY_SLIDER, groove_alphas=_SUMMARY_GROOVE_ALPHAS))
+    for name, color in SERIES_COLORS.items():
+        rules.append(f'QCheckBox[beckSeries="{name}"] {{color:{_rgb(color)};}}\n')
+    return ''.join(rules)
+
+
+def apply_theme(app) -> None:
+    """
+    Sets the compiled stylesheet on the application unless it is already set.
+
+    Call it before the first window is built so every widget is polished once, against
+    the final sheet.
+
+    Args:
+        app (QApplication): The running application.
+    """
+    stylesheet = compile_stylesheet()
+    if app.styleSheet() != stylesheet:
+        app.setStyleSheet(stylesheet)
@@ -0,0 +1,253 @@
+import math
+from datetime import datetime, timezone
+from typing import Dict, Optional, Set, Tuple
+
+import numpy as np
+from PyQt6 import QtWidgets
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QColor, QMouseEvent, QPainter, QPaintEvent, QPen, QPolygonF, QWheelEvent
+
+from beck_core.decimation import minmax_decimate, visible_slice
+from beck_core.items import ITEM_MAX, ITEM_NAMES, SUMMARY_MAX
+from database.database_utility.trend_cache import TrendSeriesCache
+from ui.theme import SERIES_COLORS
+
+_DAY = 86400.0
+_MARGIN = (36, 12, 28, 24)  # left, top, right, bottom plot margins in pixels
+_MIN_SPAN = 3600.0  # the view never zooms in further than one hour
+
+
+def _polygon(xs: np.ndarray, ys: np.ndarray) -> QPolygonF:
+    """
+    Builds a QPolygonF by writing the coordinates straight into its buffer, which is
+    about fifty times faster than creating a QPointF per point.
+    """
+    polygon = QPolygonF()
+    polygon.resize(len(xs))
+    buffer = polygon.data()
+    buffer.setsize(len(xs) * 2 * np.dtype(np.float64).itemsize)
+    points = np.frombuffer(buffer, dtype=np.float64)
+    points[0::2] = xs
+    points[1::2] = ys
+    return polygon
+
+
+class TrendChart(QtWidgets.QWidget):
+    """
+    Plots beck_summary and selected items over time, with drag to pan and wheel to zoom.
+
+    Series are read from a TrendSeriesCache. Every paint slices the loaded arrays to the
+    view with a binary search and reduces them to the extremes of each pixel column
+    before drawing, so a frame costs about the same whether the view holds a week or
+    years of entries. While panning the cache is asked for the view plus one view width
+    on either side; it only queries what it has not loaded yet, and the chart redraws
+    from memory in the meantime.
+
+    Attributes:
+        cache (TrendSeriesCache): The data source.
+        view (Tuple[float, float]): The visible time range in epoch seconds.
+
+    """
+
+    def __init__(self, cache: TrendSeriesCache, parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+        self.cache: TrendSeriesCache = cache
+        now = datetime.now(tz=timezone.utc).timestamp()
+        self.view: Tuple[float, float] = (now - 90 * _DAY, now)
+        self.visible_series: Set[str] = {'beck_summary'}
+        self._drag_x: Optional[float] = None
+        self._has_bounds: bool = False
+        self.setMinimumSize(320, 200)
+        self.setMouseTracking(False)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        cache.changed.connect(self.update)
+        cache.bounds_ready.connect(self.on_bounds_ready)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if not self._has_bounds:
+            self.cache.request_bounds()
+        self.request_view()
+
+    def set_series_visible(self, name: str, visible: bool) -> None:
+        """
+        Shows or hides one series.
+
+        Args:
+            name (str): 'beck_summary' or an item name.
+            visible (bool): Whether to draw it.
+        """
+        if visible:
+            self.visible_series.add(name)
+        else:
+            self.visible_series.discard(name)
+        self.update()
+
+    def set_view(self, start: float, end: float) -> None:
+        """
+        Shows the time range start..end and loads whatever it needs.
+
+        Args:
+            start (float): The left edge in epoch seconds.
+            end (float): The right edge in epoch seconds.
+        """
+        if end - start < _MIN_SPAN:
+            middle = (start + end) / 2
+            start, end = middle - _MIN_SPAN / 2, middle + _MIN_SPAN / 2
+        self.view = (start, end)
+        self.request_view()
+        self.update()
+
+    def request_view(self) -> None:
+        """
+        Asks the cache for the view plus one view width of prefetch on either side.
+        """
+        start, end = self.view
+        span = end - start
+        self.cache.ensure(start - span, end + span)
+
+    def on_bounds_ready(self, first: float, last: float) -> None:
+        """
+        Frames the latest 90 days of data once the table's time range is known.
+        """
+        self._has_bounds = True
+        if math.isnan(first) or math.isnan(last):
+            return
+        self.set_view(max(first, last - 90 * _DAY) - _DAY / 2, last + _DAY / 2)
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # Interaction
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._drag_x = event.position().x()
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        if self._drag_x is None:
+            return
+        x = event.position().x()
+        start, end = self.view
+        shift = (self._drag_x - x) * (end - start) / max(self._plot_rect().width(), 1.0)
+        self._drag_x = x
+        self.set_view(start + shift, end + shift)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        self._drag_x = None
+
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        plot = self._plot_rect()
+        start, end = self.view
+        anchor = start + (event.position().x() - plot.left()) / max(plot.width(), 1.0) * (end - start)
+        factor = 0.8 ** (event.angleDelta().y() / 120)
+        self.set_view(anchor - (anchor - start) * factor, anchor + (end - anchor) * factor)
+
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    # Painting
+    # ////////////////////////////////////////////////////////////////////////////////////////
+    def _plot_rect(self) -> QRectF:
+        left, top, right, bottom = _MARGIN
+        return QRectF(left, top, max(self.width() - left - right, 1), max(self.height() - top - bottom, 1))
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(18, 18, 18))
+        plot = self._plot_rect()
+        self._paint_axes(painter, plot)
+        cache = self.cache
+        if len(cache.times):
+            start, end = self.view
+            window = visible_slice(cache.times, start, end)
+            times = cache.times[window]
+            buckets = max(int(plot.width()), 1)
+            painter.setClipRect(plot)
+            for name in ('beck_summary', *ITEM_NAMES):
+                if name not in self.visible_series:
+                    continue
+                if name == 'beck_summary':
+                    values = cache.summaries[window].astype(np.float64)
+                    scale = plot.height() / SUMMARY_MAX
+                else:
+                    values = cache.items[window, ITEM_NAMES.index(name)].astype(np.float64)
+                    scale = plot.height() / ITEM_MAX
+                values[values < 0] = np.nan
+                xs, ys = minmax_decimate(times, values, start, end, buckets)
+                if not len(xs):
+                    continue
+                px = plot.left() + (xs - start) * (plot.width() / (end - start))
+                py = plot.bottom() - ys * scale
+                # Lines are drawn with a one pixel cosmetic pen: Qt strokes wider pens on
+                # zigzagging polylines up to a hundred times slower. Antialiasing is
+                # dropped once the line is an envelope of per-column strokes.
+                painter.setPen(QPen(QColor(*SERIES_COLORS[name]), 0.0))
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing, len(px) <= plot.width())
+                if len(px) == 1:
+                    painter.drawEllipse(QPointF(px[0], py[0]), 2.0, 2.0)
+                else:
+                    painter.drawPolyline(_polygon(px, py))
+        painter.end()
+
+    def _paint_axes(self, painter: QPainter, plot: QRectF) -> None:
+        """
+        Draws the score grid, the summary scale on the left, the item scale on the right
+        and date labels along the bottom.
+        """
+        grid = QPen(QColor(48, 48, 48))
+        labels = QPen(QColor(160, 160, 160))
+        metrics = painter.fontMetrics()
+        for step in range(0, SUMMARY_MAX + 1, SUMMARY_MAX // 6):
+            y = plot.bottom() - step * plot.height() / SUMMARY_MAX
+            painter.setPen(grid)
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+            painter.setPen(labels)
+            painter.drawText(QRectF(0, y - 8, plot.left() - 4, 16),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, str(step))
+        for item_value in range(ITEM_MAX + 1):
+            y = plot.bottom() - item_value * plot.height() / ITEM_MAX
+            painter.drawText(QRectF(plot.right() + 4, y - 8, _MARGIN[2] - 4, 16),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, str(item_value))
+        start, end = self.view
+        span = end - start
+        label_width = metrics.horizontalAdvance('0000-00-00') + 16
+        ticks = max(int(plot.width() // label_width), 1)
+        step = _DAY * max(1, math.ceil(span / _DAY / ticks))
+        tick = math.ceil(start / step) * step
+        while tick <= end:
+            x = plot.left() + (tick - start) * plot.width() / span
+            painter.setPen(grid)
+            painter.drawLine(QPointF(x, plot.top()), QPointF(x, plot.bottom()))
+            painter.setPen(labels)
+            text = datetime.fromtimestamp(tick, tz=timezone.utc).strftime(
+                '%Y-%m-%d' if step >= _DAY else '%H:%M')
+            painter.drawText(QRectF(x - label_width / 2, plot.bottom() + 4, label_width, 16),
+                             Qt.AlignmentFlag.AlignCenter, text)
+            tick += step
+
+
+class TrendPage(QtWidgets.QWidget):
+    """
+    The trend page of the stacked widget: a row of series toggles above a TrendChart.
+
+    Attributes:
+        chart (TrendChart): The chart.
+        toggles (Dict[str, QCheckBox]): One check box per series.
+
+    """
+
+    def __init__(self, cache: TrendSeriesCache, parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setObjectName("mainpanePage3")
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        toggles = QtWidgets.QHBoxLayout()
+        self.chart = TrendChart(cache, self)
+        self.toggles: Dict[str, QtWidgets.QCheckBox] = {}
+        for name in ('beck_summary', *ITEM_NAMES):
+            toggle = QtWidgets.QCheckBox('summary' if name == 'beck_summary' else name, self)
+            toggle.setChecked(name in self.chart.visible_series)
+            toggle.setProperty("beckSeries", name)
+            toggle.toggled.connect(lambda checked, n=name: self.chart.set_series_visible(n, checked))
+            toggles.addWidget(toggle)
+            self.toggles[name] = toggle
+        toggles.addStretch(1)
+        layout.addLayout(toggles)
+        layout.addWidget(self.chart, 1)
@@ -39,7 +39,7 @@ class FramelessWindow(QMainWindow):
                 self.pressing = True
                 self.startPos = event.position().toPoint()
         except Exception as e:
-            logger.error(f"Error in mousePressEvent: {e}", exc_info=True)
+            logger.error("Error in mousePressEvent: %s", e, exc_info=True)
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         """
@@ -55,7 +55,7 @@ class FramelessWindow(QMainWindow):
             if self.pressing and self.startPos is not None:
                 self.move(self.pos() + event.position().toPoint() - self.startPos)
         except Exception as e:
-            logger.error(f"Error in mouseMoveEvent: {e}", exc_info=True)
+            logger.error("Error in mouseMoveEvent: %s", e, exc_info=True)
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """
@@ -71,7 +71,7 @@ class FramelessWindow(QMainWindow):
             if event.button() == Qt.MouseButton.LeftButton:
                 self.pressing = False
         except Exception as e:
-            logger.error(f"Error occurred in mouseReleaseEvent: {e}", exc_info=True)
+            logger.error("Error occurred in mouseReleaseEvent: %s", e, exc_info=True)
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         """
@@ -95,7 +95,7 @@ class FramelessWindow(QMainWindow):
             region = QRegion(path.toFillPolygon().toPolygon())
             self.setMask(region)
         except Exception as e:
-            logger.error(f"Error occurred in resizeEvent: {e}", exc_info=True)
+            logger.error("Error occurred in resizeEvent: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,205 @@
+import json
+import platform
+import sys
+import time
+from array import array
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, TypeVar
+
+import tracker_config as tkc
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+PERCENTILES = (0.5, 0.95, 0.99)
+
+_DISABLED = nullcontext()
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """
+    Returns the value at a fraction of already sorted samples, interpolating between ranks.
+
+    Args:
+        ordered (List[float]): The samples, sorted ascending.
+        fraction (float): 0.5 for the median, 0.95 for p95 and so on.
+
+    Returns:
+        float: The percentile, 0.0 without samples.
+    """
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class LatencyRing:
+    """
+    Keeps the latest durations of one operation in a fixed-size ring buffer.
+
+    The buffer is a preallocated array of doubles, so recording a sample is two stores
+    and never allocates. Percentiles describe the samples still in the ring; count and
+    max cover every sample since the last reset.
+
+    Attributes:
+        size (int): The number of samples kept.
+        count (int): Samples recorded since the last reset.
+        max_ms (float): The slowest sample since the last reset.
+
+    """
+    __slots__ = ('size', 'count', 'max_ms', 'total_ms', '_samples')
+
+    def __init__(self, size: int) -> None:
+        self.size: int = size
+        self.count: int = 0
+        self.max_ms: float = 0.0
+        self.total_ms: float = 0.0
+        self._samples: array = array('d', bytes(8 * size))
+
+    def add(self, duration_ms: float) -> None:
+        self._samples[self.count % self.size] = duration_ms
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    def samples(self) -> List[float]:
+        """
+        Returns the samples in the ring, oldest first.
+        """
+        if self.count <= self.size:
+            return self._samples[:self.count].tolist()
+        start = self.count % self.size
+        return (self._samples[start:] + self._samples[:start]).tolist()
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Returns the count, mean, max and the PERCENTILES of the operation in milliseconds.
+        """
+        ordered = sorted(self.samples())
+        result: Dict[str, float] = {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'max_ms': self.max_ms,
+        }
+        for fraction in PERCENTILES:
+            result[f"p{round(fraction * 100)}_ms"] = percentile(ordered, fraction)
+        return result
+
+
+class PerfStats:
+    """
+    Latency histograms of the app's hot paths, one LatencyRing per operation name.
+
+    Operations are timed with the timed() decorator or the measure() context manager.
+    While disabled, a decorated call costs one attribute check and measure() hands back
+    a shared no-op context, so the instrumentation stays in place on every build.
+
+    Samples may be recorded from the database worker thread as well as the GUI thread.
+    Each operation is only timed on one thread, and the GIL keeps a ring's stores whole,
+    so no lock is taken.
+
+    Attributes:
+        enabled (bool): Whether samples are recorded.
+        ring_size (int): Samples kept per operation.
+        rings (Dict[str, LatencyRing]): The rings by operation name, in first-use order.
+
+    """
+
+    def __init__(self, ring_size: int = tkc.PERF_RING_SIZE,
+                 enabled: bool = tkc.PERF_STATS_ENABLED) -> None:
+        self.enabled: bool = enabled
+        self.ring_size: int = ring_size
+        self.rings: Dict[str, LatencyRing] = {}
+
+    def record(self, name: str, duration_ms: float) -> None:
+        """
+        Adds one sample to the ring of an operation.
+
+        Args:
+            name (str): The operation name.
+            duration_ms (float): How long it took in milliseconds.
+        """
+        ring = self.rings.get(name)
+        if ring is None:
+            ring = self.rings.setdefault(name, LatencyRing(self.ring_size))
+        ring.add(duration_ms)
+
+    def measure(self, name: str) -> ContextManager[None]:
+        """
+        Times the enclosed block as one sample of an operation.
+
+        Args:
+            name (str): The operation name.
+        """
+        if not self.enabled:
+            return _DISABLED
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000)
+
+    def timed(self, name: str) -> Callable[[F], F]:
+        """
+        Decorates a function so every call is recorded as one sample of an operation.
+
+        Args:
+            name (str): The operation name.
+        """
+        def decorate(func: F) -> F:
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, (time.perf_counter() - started) * 1000)
+            return wrapper  # type: ignore[return-value]
+        return decorate
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the summary of every operation, by name.
+        """
+        return {name: ring.summary() for name, ring in list(self.rings.items())}
+
+    def reset(self) -> None:
+        """
+        Drops every sample recorded so far.
+        """
+        self.rings = {}
+
+    def dump_json(self, path: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Writes the summaries and the raw samples to a JSON file for a support request.
+
+        Args:
+            path (str): The file to write.
+            extra (Optional[Dict[str, Any]]): More fields for the document, such as the
+                number of rows in the database.
+        """
+        document = {
+            'created': datetime.now(tz=timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'executable': sys.executable,
+            'ring_size': self.ring_size,
+            **(extra or {}),
+            'operations': {name: {**ring.summary(), 'samples_ms': ring.samples()}
+                           for name, ring in list(self.rings.items())},
+        }
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(document, handle, indent=2)
+
+
+perf_stats = PerfStats()
@@ -0,0 +1,108 @@
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+from logger_setup import logger
+
+
+class StartupProfiler:
+    """
+    Records how long each phase of application startup takes.
+
+    Phases are timed with the phase() context manager and instants with mark(). Nothing
+    is recorded unless the profiler is enabled, so the calls can stay in place at no
+    cost. Times are relative to when the profiler was created, which for the module
+    level instance is when main.py first imports it.
+
+    Attributes:
+        enabled (bool): Whether phases are recorded.
+        phases (List[Tuple[str, float, float]]): (name, start, duration) in seconds.
+
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled: bool = enabled
+        self.started: float = time.perf_counter()
+        self.phases: List[Tuple[str, float, float]] = []
+        self._depth: int = 0
+        self._reported: bool = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Times the enclosed block as one phase. Phases may be nested.
+
+        Args:
+            name (str): The phase name shown in the report.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.phases.append(('  ' * self._depth + name, start - self.started,
+                                time.perf_counter() - start))
+
+    def mark(self, name: str) -> None:
+        """
+        Records an instant, such as the first paint.
+
+        Args:
+            name (str): The event name shown in the report.
+        """
+        if self.enabled:
+            self.phases.append((name, time.perf_counter() - self.started, 0.0))
+
+    def report(self, stream: Optional[TextIO] = None) -> None:
+        """
+        Prints the phases in start order with their start offset and duration.
+
+        Args:
+            stream (Optional[TextIO]): Where to print, stderr by default.
+        """
+        stream = stream or sys.stderr
+        lines = [f"{'phase':<40}{'start ms':>10}{'took ms':>10}"]
+        for name, start, duration in sorted(self.phases, key=lambda phase: phase[1]):
+            took = f"{duration * 1000:10.1f}" if duration else f"{'':>10}"
+            lines.append(f"{name:<40}{start * 1000:10.1f}{took}")
+        print('\n'.join(lines), file=stream)
+        logger.info("Startup profile\n" + '\n'.join(lines))
+
+    def report_after_first_paint(self, widget) -> None:
+        """
+        Marks the first paint of a widget, then prints the report once.
+
+        Args:
+            widget (QWidget): The window whose first paint ends startup.
+        """
+        if not self.enabled:
+            return
+        from PyQt6.QtCore import QCoreApplication, QEvent, QObject, QTimer
+
+        profiler = self
+        app = QCoreApplication.instance()
+
+        class FirstPaintFilter(QObject):
+            # The window itself may never be painted when its children cover it, so the
+            # filter watches every widget until one inside the window paints.
+            def eventFilter(self, watched, event) -> bool:
+                if (event.type() == QEvent.Type.Paint and not profiler._reported
+                        and getattr(watched, 'window', None) is not None
+                        and watched.window() is widget):
+                    profiler._reported = True
+                    profiler.mark("first paint")
+                    app.removeEventFilter(self)
+                    # Report after the paint has finished and pending startup work ran.
+                    QTimer.singleShot(0, profiler.report)
+                return False
+
+        self._paint_filter = FirstPaintFilter(widget)
+        app.installEventFilter(self._paint_filter)
+
+
+profiler = StartupProfiler()